@@ -2,8 +2,13 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 
+import os
 import sys
 
+# The sentence splitter is shared with sprint4/document.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "sprint4"))
+from sentences import stream_sentences
+
 #string = "Show me the names of actors in the movie with title ""Cloud Atlas"""
 sysin = sys.argv[1:]
 
@@ -15,52 +20,77 @@ tag = "VB"
 
 def showTags (string):
     word = nltk.word_tokenize(string)
-    print nltk.pos_tag(word)
+    print(nltk.pos_tag(word))
 
 #string2 = "Show me the title of all the movies that ""Halle Berry"" acted in"
 
-def output (string):
 
-    print string + "<br>"
-    print
+def streamSentences (lines, split=None):
+    # Yields the sentences of a file one at a time, so that a large file never has to be read into memory at once.
+    # Each sentence is given out as soon as it is complete; see sprint4/sentences.py.
+    return stream_sentences(lines, split or nltk.sent_tokenize)
+
+
+def tagIndex (sentences, index=None, tagger=None, tokenize=None):
+    # Tags every sentence once, and files every distinct word under its tag, so that any part of speech can be looked
+    # up afterwards without tagging everything again. Only the distinct words are kept, so the index grows with the
+    # vocabulary of the file rather than its length. The tagger is loaded once, rather than by nltk.pos_tag() for
+    # every sentence.
+    if index is None:
+        index = {}
+    tagger = tagger or nltk.tag.PerceptronTagger()
+    tokenize = tokenize or nltk.word_tokenize
+    for sent in sentences:
+        for word in tagger.tag(tokenize(sent)):
+            index.setdefault(word[1], set()).add(word[0])
+    return index
+
+
+def findSpeechPart (index, tag):
+    return [(word, tag) for word in sorted(index.get(tag, ()))]
 
-    def findSpeechPart (string, tag):
-        out = []
-        sentences = nltk.sent_tokenize(string)
-        data = []
-        for sent in sentences:
-            data = data + nltk.pos_tag(nltk.word_tokenize(sent))
-        for word in data:
-            if word[1] == tag:
-                out.append(word)
-        return out
 
-    NNS = findSpeechPart(string, "NNS")
+def output (string, index=None):
 
-    NN = findSpeechPart(string, "NN")
+    print(string + "<br>")
+    print("")
 
-    JJ = findSpeechPart(string,"JJ")
+    if index is None:
+        index = tagIndex(nltk.sent_tokenize(string))
 
-    NNP = findSpeechPart(string, "NNP")
+    NNS = findSpeechPart(index, "NNS")
 
-    print "<br>" \
-          "These are all of the Plural Nouns <br>" \
-          "<br>"
+    NN = findSpeechPart(index, "NN")
+
+    JJ = findSpeechPart(index, "JJ")
+
+    NNP = findSpeechPart(index, "NNP")
+
+    print("<br>"
+          "These are all of the Plural Nouns <br>"
+          "<br>")
     print (NNS)
-    print "<br>" \
-          "These are all of the Singular Nouns <br>" \
-          "<br>"
+    print("<br>"
+          "These are all of the Singular Nouns <br>"
+          "<br>")
     print (NN)
-    print "<br>" \
-          "These are all of the Adjectives <br>" \
-          "<br>"
+    print("<br>"
+          "These are all of the Adjectives <br>"
+          "<br>")
     print (JJ)
-    print "<br>" \
-          "These are all of the Singular Proper Nouns <br>" \
-          "<br>"
+    print("<br>"
+          "These are all of the Singular Proper Nouns <br>"
+          "<br>")
     print (NNP)
 
-showTags(string)
+# To index a large file instead of the command line: python index.py --file input.txt
+if __name__ == "__main__":
+    if sysin[:1] == ["--file"]:
+        f = open(sysin[1])
+        output(sysin[1], tagIndex(streamSentences(f)))
+        f.close()
+    else:
+        showTags(string)
 
 # print
 
@@ -77,4 +107,3 @@ showTags(string)
 #
 # showTags("who acted in movie ""Cloud Atlas"""
 #          )
-
@@ -0,0 +1,47 @@
+import re
+import unittest
+from sprint2.index import findSpeechPart, streamSentences, tagIndex
+
+
+def split(text):
+    """A stand-in for the sentence tokenizer, which needs nltk_data: a sentence ends with ? or . and a space."""
+    return [s for s in re.split(r"(?<=[?.])\s+", text) if s]
+
+
+class CountingTagger():
+    """Tags every word by its ending, and counts how many times it is asked, so no nltk_data is needed."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def tag(self, words):
+        self.calls += 1
+        return [(word, "NNS" if word.endswith("s") else "NN") for word in words]
+
+
+class TestIndex(unittest.TestCase):
+
+    """
+    Test that every sentence is tagged once by the same tagger, and that each word is kept once under its tag.
+    """
+    def test_tag_index(self):
+        tagger = CountingTagger()
+        sentences = ["outlaws have names", "outlaws have names", "dog bites outlaws"]
+        index = tagIndex(sentences, tagger=tagger, tokenize=str.split)
+        self.assertEqual(tagger.calls, 3)
+        self.assertEqual(findSpeechPart(index, "NNS"), [("bites", "NNS"), ("names", "NNS"), ("outlaws", "NNS")])
+        self.assertEqual(findSpeechPart(index, "NN"), [("dog", "NN"), ("have", "NN")])
+        self.assertEqual(findSpeechPart(index, "JJ"), [])
+
+    """
+    Test that the sentences of a file are given out as they are completed, across line breaks and paragraphs.
+    """
+    def test_stream_sentences(self):
+        lines = ["Who are all the outlaws? How many names", "start with J?", "", "What are the species", "of dogs?"]
+        self.assertEqual(list(streamSentences(lines, split)), ["Who are all the outlaws?",
+                                                               "How many names start with J?",
+                                                               "What are the species of dogs?"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ This program tokenizes and assigns Stanford CoreNLP tags to a sentence. Input ca
 File name: Tokenize.py
 Author: Angie Pinchbeck, Joseph Pruner
 Date created: 27/02/2018
-Date last modified: 02/04/2018
+Date last modified: 19/10/2026
 Python version: 3.5
 
 Much of this was based on a tutorial from:
@@ -18,17 +18,30 @@ As much of possible, we have used the Google style guide for Python:
 
 """
 
-import unicodedata  # for case-insensitive comparisons
 from itertools import product
 
 import nltk
 """I needed to import sys or I got an error -Joe"""
 import sys
 from inflection import singularize
-from nltk.corpus import stopwords
-from nltk.corpus import wordnet as wn
-from nltk.tokenize import word_tokenize
-import sys
+
+try:
+    from sprint4 import resources, workload
+    from sprint4.canonical import canonical, canonical_set
+    from sprint4.cypher import Comparison, Exists, Node, Path, Projection, Query, Value
+    from sprint4.paging import InvalidToken, decode_token, encode_token
+    from sprint4.rewrite import narrow_labels
+    from sprint4.schema import DEFAULT_SCHEMA, registry
+    from sprint4.translators import Deadline, DeadlineExceeded, Results, current_deadline, plugins
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    import resources
+    import workload
+    from canonical import canonical, canonical_set
+    from cypher import Comparison, Exists, Node, Path, Projection, Query, Value
+    from paging import InvalidToken, decode_token, encode_token
+    from rewrite import narrow_labels
+    from schema import DEFAULT_SCHEMA, registry
+    from translators import Deadline, DeadlineExceeded, Results, current_deadline, plugins
 
 class Tokenize():
     """
@@ -45,189 +58,429 @@ class Tokenize():
                     Expanded kept stop words: now includes "each".
         30/03/2018  Expanded kept stop words: now includes "than".
         02/04/2018  Fixed queries 5 and 6 to pass all tests. Add queries 3 and 7. All methods pass all 92 tests. 
+        19/10/2026  The database dictionaries now come from a named Schema in the SchemaRegistry (see schema.py).
+                    The tagger and stop words are loaded once and shared; similarity scores are cached per schema.
+                    The translation methods build their queries as a cypher.Query, which can also be rendered with
+                    $parameters; added translate() to return them.
+                    Added execute() to run the queries on a database through an executor from execute.py.
+                    All resources can come from a precompiled bundle (see bundle.py) instead of nltk_data.
+                    The label and relationship checks go through the schema's matcher, which only uses WordNet for
+                    words that aren't the schema's own words or in its lexicon (see matcher.py). They are done after
+                    the cheap checks in match_label_and_property() and return_multiple_labels().
+                    Added the schemaTagging option, which tags schema labels and properties as nouns.
+                    Added run_pipe() and the --pipe option, which replace the commented out input loop.
+                    The translation methods that are run come from a TranslatorRegistry (see translators.py), and are
+                    skipped when their preconditions show they can't apply. Removed count_with_operators(), which
+                    was never finished and never run.
+                    Added the firstMatch and deadline options to runTranslator() and translate().
+                    The translation methods no longer change the tagMap; listAllWithProperty() used to retag "named"
+                    and "list" in it, which every translation method after it saw. Removed the class attributes
+                    labels, relationships, labelProperties and relationshipProperties, which were shared by every
+                    object; they come from the schema, which is now immutable.
+                    The words are put in their canonical form (see canonical.py) as they are tagged, and compared
+                    with the schema's terms and the keywords by looking them up in the schema's indexes, instead of
+                    with equals_ignore_case().
+                    Added the pageSize option to runTranslator(), translate() and execute(), which splits the queries
+                    that return every node they match into pages, and next_page() (see paging.py).
+                    Added the narrow option to runTranslator(), translate() and execute(), which adds the labels that
+                    have the properties a query uses to its unlabeled nodes (see rewrite.py).
+                    The questions translated by Tokenize.py can be recorded in a workload log (see workload.py).
+                    Added streamTranslator() and translations(), which give each query as soon as its translation
+                    method has finished; stream.py sends them to the web page as they come.
+                    Added from_tagged(), which makes a Tokenize object for words that are already tagged.
+                    Misspelled labels, relationships and properties that WordNet doesn't know are corrected by the
+                    schema's matcher (see fuzzy.py), so that the label and property checks find them. Added
+                    known_word() and schema_word().
 
     Attributes:
-        keptStopWords(String[]): A list of words that we don't want to have scrubbed from input, even though
+        keptStopWords(String[]): A tuple of words that we don't want to have scrubbed from input, even though
             they appear in the NLTK modul stop words.
         stopWords (String[]): The words that are considered "stop words" by the NLTK module; words that will be scrubbed.
             There are 179 stop words as of 10/03/2018.
             Use the following two lines to see number of stop words and list of stop words:
             print (len(stopWords))  # Number of words
             print(stopWords)        # List of words
+        schema (Schema): The schema that the input is translated against. Every schema has its own caches.
+        schemaTagging (Boolean): Whether the words are tagged with a SchemaTagger.
+        translators (TranslatorRegistry): The translators that runTranslator() runs.
         words (String[]): The words of the sentence that is being tokenized.
         wordsUnFiltered (String[]): The words and their Stanford CoreNLP tags attached, so far unfiltered of stop words.
         wordsTagged (Tuple(String, String)): The words and their Stanford CoreNLP tags attached, after being filtered
-            of stop words.
-        labels [List]:  The list of unique labels that exist within a graph database.
-        relationships [List]:   The list of unique relationships that exist within a graph database.
+            of stop words. The words are in their canonical form.
+        labels (Tuple):  The unique labels that exist within a graph database.
+        relationships (Tuple):   The unique relationships that exist within a graph database.
         labelProperties [Dictionary]:   Has the properties attached to every label from the "labels" list.
         relationshipProperties [Dictionary]:   Has the properties attached to every
             relationship from the "relationships" list.
+        These last four come from the schema, and can't be changed.
+
+    The translation methods only read the object and the tagMap they are given; they never change either. So one
+    Tokenize object can be translated by any number of threads at the same time, without locks.
 
     """
     
-    keptStopWords = ["how", "all", "with", "have", "has", "who", "are", "and", "is", "each", "than"]
-    stopWords = set(stopwords.words('english')) - set(keptStopWords)
-    labels = []
-    relationships = []
-    labelProperties = {}
-    relationshipProperties = {}
+    keptStopWords = ("how", "all", "with", "have", "has", "who", "are", "and", "is", "each", "than")
 
-    def __init__(self, data):
+    def __init__(self, data, schemaId=DEFAULT_SCHEMA, schemas=registry, schemaTagging=False, translators=plugins):
+        """
+        :param data: The sentence to tokenize.
+        :param schemaId: The name of the schema, in the schema registry, to translate against.
+        :param schemas: The SchemaRegistry to look the schema up in.
+        :param schemaTagging: If True, the schema's labels and properties are always tagged as nouns (see tagger.py),
+            and the label and relationship checks don't need to ask WordNet about the other words.
+        :param translators: The TranslatorRegistry whose enabled translators are run (see translators.py).
+        """
 
+        self.schema = schemas.get(schemaId)
+        self.schemaTagging = schemaTagging
+        self.translators = translators
         self.initDatabaseDictionaries()
-        self.words = word_tokenize(data.lower())
-        self.wordsUnFiltered = nltk.pos_tag(self.words)
-        self.wordsTagged = []
-        for wt in self.wordsUnFiltered:
-            if wt[0] not in self.stopWords:
-                tuple = (singularize(wt[0]), wt[1])
-                self.wordsTagged.append(tuple)
+        self.words = resources.word_tokenize(data.lower())
+        self.wordsUnFiltered = resources.pos_tag(self.words, self.schema if schemaTagging else None)
+        self.wordsTagged = self.filter_words(self.wordsUnFiltered, self.stopWords)
+
+    @classmethod
+    def from_tagged(cls, tagMap, schemaId=DEFAULT_SCHEMA, schemas=registry, schemaTagging=False, translators=plugins):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Makes a Tokenize object for a question whose words have already been tagged, e.g. by another system or in the
+        unit tests, without the word tokenizer, the tagger or the stop words.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags. Stop words aren't taken
+            out, so it should only have the words that matter.
+        :param schemaId: The name of the schema, in the schema registry, to translate against.
+        :param schemas: The SchemaRegistry to look the schema up in.
+        :param schemaTagging: If True, the tags are taken to be right, as they are with a SchemaTagger.
+        :param translators: The TranslatorRegistry whose enabled translators are run (see translators.py).
+        :return: The Tokenize object, with wordsTagged ready to translate.
+        """
+        t = cls.__new__(cls)
+        t.schema = schemas.get(schemaId)
+        t.schemaTagging = schemaTagging
+        t.translators = translators
+        t.initDatabaseDictionaries()
+        t.words = [word for word, tag in tagMap]
+        t.wordsUnFiltered = list(tagMap)
+        t.wordsTagged = t.filter_words(t.wordsUnFiltered)
+        return t
+
+    def filter_words(self, wordsUnFiltered, stopWords=()):
+        """
+        :param wordsUnFiltered: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param stopWords: The words to take out.
+        :return: The tuples of the words that aren't stop words, with the words singularized and in their canonical
+            form.
+        """
+        wordsTagged = []
+        for wt in wordsUnFiltered:
+            if wt[0] not in stopWords:
+                tuple = (canonical(singularize(wt[0])), wt[1])
+                wordsTagged.append(tuple)
+        return wordsTagged
+
+    @property
+    def stopWords(self):
+        """The NLTK stop words, minus keptStopWords. These are loaded once and shared by every Tokenize object."""
+        return resources.stop_words(self.keptStopWords)
 
     def initDatabaseDictionaries(self):
         """
         Author: Angie Pinchbeck
         Date created: 27/03/2018
-        Date last modified: 27/03/2018
+        Date last modified: 19/10/2026
 
         This method initializes the lists that are used for language comparison in the translation methods.
-        For now, these are hardcoded to fit an "Outlaw" database. However, this can be extended for use with
-        actual databases. The Cypher query needed to return that information from the database is listed
-        above each initialization so that, in the future, this method can be scaled to include the feature of
-        linking to a real database.
+        They are taken from self.schema, which is looked up by name in the schema registry, and can't be changed,
+        so they are shared rather than copied. The "Outlaw"
+        database that these used to be hardcoded to is now the default schema; see schema.outlaw_schema(),
+        which also lists the Cypher queries needed to return this information from a real database.
 
         :return: nothing
         """
 
-        # MATCH (n) RETURN distinct labels(n)
-        self.labels = ["Person", "Animal", "Outlaw"]
-
-        # MATCH n-[r]-() RETURN distinct type(r)
-        self.relationships = ["likes", "dislikes", "parents", "brother"]
-
-        """ Note that the following Cypher query would need to run in a loop for every label that 
-        was already in self.labels to fill out the labelProperties dictionary """
-        # MATCH (n:Label) UNWIND keys(n) AS key RETURN collect(distinct key)
-        self.labelProperties = dict(Person=["name", "female", "size", "bounty"], Animal=["name", "species"],
-                                    Outlaw=["name", "bounty", "size"])
-
-        """ Note that the following Cypher query would need to run in a loop for every relationship that 
-        was already in self.relationships to fill out the relationshipProperties dictionary """
-        # MATCH (n:Label) UNWIND keys(n) AS key RETURN collect(distinct key)
-        self.relationshipProperties = dict(LIKES=["because"], DISLIKES=["because"], PARENTS=["gift"], BROTHER=[])
+        self.labels = self.schema.labels
+        self.relationships = self.schema.relationships
+        self.labelProperties = self.schema.labelProperties
+        self.relationshipProperties = self.schema.relationshipProperties
 
     def equals_ignore_case(self, s1, s2):
         """
         Author: Angie Pinchbeck
         Date created: 27/03/2018
-        Date last modified: 27/03/2018
+        Date last modified: 19/10/2026
 
         This method compares two strings case-insensitively and returns true if they're the same.
+        Both are put in their canonical form (see canonical.py), which is case folded and NFKD-normalized.
 
         :param s1: The first string to compare.
         :param s2: The second string to compare.
         :return: boolean: True if they are the same, False if they are different.
         """
 
-        string1 = u"{}".format(s1)
-        string2 = u"{}".format(s2)
-        return unicodedata.normalize('NFKD', string1.lower()) == unicodedata.normalize('NFKD', string2.lower())
+        return canonical(u"{}".format(s1)) is canonical(u"{}".format(s2))
 
-    def runTranslator(self, tagMap):
+    def runTranslator(self, tagMap, firstMatch=False, deadline=None, pageSize=None, narrow=False):
         """
         Author: Angie Pinchbeck
         Date created: 26/03/2018
-        Date last modified: 26/03/2018
+        Date last modified: 19/10/2026
 
         This is a method that will run an input tagMap through all the other translation methods, and then return a list
         of all the queries that are output.
 
         :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A list of Cypher queries.
-        """
-        results = []
-        if self.match_label_and_property(tagMap) != -1:
-            results.append("query1: " + self.match_label_and_property(tagMap))
-        if self.listAllWithProperty(tagMap) != -1:
-            results.append("query3: " + self.listAllWithProperty(tagMap))
-        if self.return_multiple_labels(tagMap) != -1:
-            results.append("query2: " + self.return_multiple_labels(tagMap))
-        if self.numberStartsWith(tagMap) != -1:
-            results.append("query5: " + self.numberStartsWith(tagMap))
-        if self.numberNullOrNot(tagMap) != -1:
-            results.append("query6: " + self.numberNullOrNot(tagMap))
-        if self.relationshipOrder(tagMap) != -1:
-            results.append("query7: " + self.relationshipOrder(tagMap))
+        :param firstMatch: If True, stop at the first query; see translate().
+        :param deadline: A translators.Deadline, or a number of seconds, after which no more translation is done;
+            see translate().
+        :param pageSize: If given, the queries that return every node they match only return the first page of this
+            many; see translate().
+        :param narrow: If True, the queries are narrowed to the labels that have the properties they use; see
+            translate().
+        :return: A list of Cypher queries, as a translators.Results list; its skipped attribute lists the translation
+            methods that were skipped because of the deadline, and its tokens attribute has the continuation token of
+            every paginated query.
+        """
+        results = self.translate(tagMap, firstMatch, deadline, pageSize, narrow)
+        return Results([queryId + ": " + query for queryId, query in results], results.skipped, results.tokens)
 
+    def translate(self, tagMap, firstMatch=False, deadline=None, pageSize=None, narrow=False):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Runs an input tagMap through all the enabled translation methods, like runTranslator(), but returns the
+        queries themselves. Each translation method is only run once, and not at all if its preconditions aren't met.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param firstMatch: If True, only the first query is returned, and the translation methods are run in the order
+            that is most likely to find it quickly, learned from how often and how fast each one has given a query
+            before (see TranslatorRegistry.ordered()). If False, every query is returned.
+        :param deadline: A translators.Deadline, or a number of seconds, or None for no deadline. It is checked
+            before each translation method, and before each WordNet comparison; once it has passed, the translation
+            methods that haven't finished are skipped, and the queries found so far are returned.
+        :param pageSize: The number of results on a page, or None to return every result. The queries that would
+            return a result for every node they match, such as "MATCH (n) where exists (n.species) RETURN n", are
+            ordered by node id and only return the first pageSize results, and a continuation token for the next page
+            is put in the tokens attribute of the results, under the query id; see next_page().
+        :param narrow: If True, the nodes that the queries match without a label are given the labels that have the
+            properties the query uses, e.g. MATCH (n {species :'dog'}) becomes MATCH (n :Animal {species :'dog'}),
+            so that the database can use its indexes (see rewrite.py).
+        :return: A list of (query id, query) tuples, as a translators.Results list. Its skipped attribute lists the
+            names of the translation methods that were skipped because of the deadline, and partial is True if there
+            are any. The queries are cypher.Query objects where the translation method built one; call
+            parameterized() on them to get the query text with $parameters and the parameter map.
+        """
+        results = Results()
+        for item in self.translations(tagMap, firstMatch, deadline, pageSize, narrow, results):
+            pass
         return results
 
+    def translations(self, tagMap, firstMatch=False, deadline=None, pageSize=None, narrow=False, results=None):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        The generator that translate() is built on. It gives each query as soon as its translation method has
+        finished, so that the first queries can be shown while slower translation methods, such as the ones that
+        compare words using WordNet, are still running. The translation methods are only run as the queries are
+        asked for.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param firstMatch: See translate().
+        :param deadline: See translate().
+        :param pageSize: See translate().
+        :param narrow: See translate().
+        :param results: A translators.Results list that every query is also added to, and whose skipped and tokens are
+            filled in, or None.
+        :return: A generator of (query id, query) tuples.
+        """
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
+        if results is None:
+            results = Results()
+        tagMap = tuple(tagMap)
+        for translator in self.translators.ordered() if firstMatch else self.translators.enabled():
+            if deadline is not None and deadline.expired():
+                results.skipped.append(translator.name)
+                continue
+            if not translator.applies(self, tagMap):
+                continue
+            try:
+                query = self.translators.timed_run(translator, self, tagMap, deadline)
+            except DeadlineExceeded:
+                results.skipped.append(translator.name)
+                continue
+            if query != -1:
+                if narrow:
+                    query = narrow_labels(query, self.schema)
+                if pageSize is not None and isinstance(query, Query) and query.unbounded():
+                    query = query.paginated(0, pageSize)
+                    results.tokens[translator.queryId] = encode_token(self.schema.name, translator.name, tagMap,
+                                                                      pageSize, 1, narrow)
+                results.append((translator.queryId, query))
+                yield translator.queryId, query
+                if firstMatch and query != "":
+                    break
+
+    def streamTranslator(self, tagMap, firstMatch=False, deadline=None, pageSize=None, narrow=False):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        The same as runTranslator(), but as a generator that gives each query as soon as its translation method has
+        finished, instead of a list once they all have. See translations().
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param firstMatch: See translate().
+        :param deadline: See translate().
+        :param pageSize: See translate().
+        :param narrow: See translate().
+        :return: A generator of Cypher queries, e.g. "query1: MATCH (n :Outlaw) RETURN n.name".
+        """
+        for queryId, query in self.translations(tagMap, firstMatch, deadline, pageSize, narrow):
+            yield queryId + ": " + query
+
+    def next_page(self, token):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Builds the query for the next page of a paginated query, from the continuation token that came with the page
+        before it. The translation method that gave the query is run again on the same tagMap.
+
+        :param token: A continuation token, from the tokens of runTranslator() or translate(), or from next_page().
+        :return: A tuple of the query id, the query for the page (a cypher.Query), and the token for the page after
+            it. There are no more pages once a page has fewer results than the page size.
+        :raises paging.InvalidToken: If the token can't be read, or is for another schema, or for a translator that
+            isn't enabled or no longer gives a query that can be paginated.
+        """
+        state = decode_token(token)
+        if state["schema"] != self.schema.name:
+            raise InvalidToken("The continuation token is for the schema " + repr(state["schema"]))
+        for translator in self.translators.enabled():
+            if translator.name == state["translator"]:
+                break
+        else:
+            raise InvalidToken("The continuation token is for an unknown translator " + repr(state["translator"]))
+        query = translator.run(self, state["tagMap"])
+        if state["narrow"]:
+            query = narrow_labels(query, self.schema)
+        if not isinstance(query, Query) or not query.unbounded():
+            raise InvalidToken("The continuation token's query can't be paginated")
+        pageSize, page = state["pageSize"], state["page"]
+        return (translator.queryId, query.paginated(page * pageSize, pageSize),
+                encode_token(self.schema.name, translator.name, state["tagMap"], pageSize, page + 1, state["narrow"]))
+
+    def execute(self, tagMap, executor, timeout=None, pageSize=None, narrow=False):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Translates an input tagMap, and runs every query that comes out on a graph database. Queries are sent with
+        $parameters, so that the database can reuse its plans. See execute.py for the executors.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param executor: The execute.Executor to run the queries with, e.g. a BoltExecutor or a LocalExecutor.
+        :param timeout: The longest each query may run for, in seconds, or None for the executor's default.
+        :param pageSize: If given, the queries that return every node they match only return the first page of this
+            many; see translate() and next_page().
+        :param narrow: If True, the queries are narrowed to the labels that have the properties they use; see
+            translate().
+        :return: A generator of (query id, query, records) tuples, where records is an iterator that streams the
+            records of that query as dictionaries.
+        """
+        for queryId, query in self.translate(tagMap, pageSize=pageSize, narrow=narrow):
+            if query != "":
+                yield queryId, query, executor.run(query, timeout=timeout)
+
     def similarity_score(self, wordx, wordy):
         """
         Author: Angie Pinchbeck
         Date created: 30/03/2018
-        Date last modified: 30/03/2018
+        Date last modified: 19/10/2026
 
         This is a method that determines how closely related two words are--not that they are similar in spelling or
         grammar, but that they are conceptually related. For example, if the words "tall" and "size" are checked,
         the method returns 0.9090909090909091, indicating that the words "tall" and "size" are closely related. However,
         if the words "cabbage" and "spaceship" are compared, it returns 0.38095238095238093. Words that are almost
         identical, such as "parent" and "parents" return 1.0.
+        Scores are looked up first in the schema's precomputed similarity table (from a bundle, see bundle.py), and
+        then in its similarity cache, so each pair of words only goes to WordNet once. If the request being translated
+        has a deadline that has passed, WordNet isn't asked, and DeadlineExceeded is raised instead.
 
         :param wordx: The first word for comparison.
         :param wordy: The second word for comparison.
         :return: A float representation of how closely related two words are. The closer to 1, the more related.
         """
-        sem1, sem2 = wn.synsets(wordx), wn.synsets(wordy)
+        key = (wordx, wordy)
+        maxscore = self.schema.similarityTable.get(key)
+        if maxscore is None:
+            maxscore = self.schema.similarityCache.get(key)
+        if maxscore is not None:
+            return maxscore
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+        sem1, sem2 = resources.synsets(wordx), resources.synsets(wordy)
         maxscore = float(0)
-        for i, j in list(product(sem1, sem2)):
+        for i, j in product(sem1, sem2):
             score = i.wup_similarity(j)  # Wu-Palmer
             if score is not None and maxscore < score:
                 maxscore = score
+        self.schema.similarityCache.put(key, maxscore)
         return maxscore
 
-    def match_label_and_property(self, tagMap):
+    def known_word(self, word):
         """
-        Author: Angie Pinchbeck, Kevin Feddema (where indicated)
-        Date created: 25/03/2018
-        Date last modified: 30/03/2018
-
-        This method filters a node for one label only, and returns a list of the properties asked for.
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
 
-        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
+        :param word: A word from the question.
+        :return: True if WordNet has any synsets for the word. A word that WordNet doesn't know can't be compared with
+            the terms, and may be a misspelling of one of them.
         """
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+        return len(resources.synsets(word)) > 0
 
+    def schema_word(self, word):
         """
-        Check that there aren't two labels in the words of the tagMap. If there are, this method shouldn't handle it; 
-        return -1.
-        NOTE: 
-            This feature has been added after some failed unittest; it was noted that occasionally nltk.pos_tag doesn't 
-            actually tag the words correctly. For example, in the sentence "Who are all the people that are outlaws?", 
-            'outlaws' is obviously a noun. But nltk.pos_tag gives in the Stanford CoreNLP tag of 'VBN', that is, a verb 
-            past participle. To combat this problem, we first do a quick check by running the words in the tagMap 
-            against the words in the labels list.  
-        
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        The label and property checks look words up in the schema's indexes, so a misspelled term has to be corrected
+        first. The tagMap itself isn't changed, so every other word is seen as it was written.
+        With schemaTagging, WordNet isn't asked about anything, so nothing is corrected.
+
+        :param word: A word from the question.
+        :return: The canonical form of the label, relationship or property that the word is a misspelling of (see
+            SchemaMatcher.correct()); else, the word itself.
         """
-        labelCount = 0
-        for tm in tagMap:
-            for l in self.labels:
-                if self.similarity_score(tm[0], l) > 0.9:
-                    labelCount += 1
-        if labelCount > 1:
-            return -1
+        correction = self.schema.matcher.correct(word, None if self.schemaTagging else self.known_word)
+        return word if correction is None else correction
 
+    def match_label_and_property(self, tagMap):
         """
-        Check that there are no relationship nouns in the words of the tagMap. If there are, this method shouldn't 
-        handle it; return -1;
+        Author: Angie Pinchbeck, Kevin Feddema (where indicated)
+        Date created: 25/03/2018
+        Date last modified: 19/10/2026
+
+        This method filters a node for one label only, and returns a list of the properties asked for.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
         """
-        relationshipCount = 0
-        for tm in tagMap:
-            for r in self.relationships:
-                # print(self.similarity_score(tm[0], r))
-                if self.similarity_score(tm[0], r) > 0.9:
-                    relationshipCount += 1
-        if relationshipCount > 0:
-            return -1
 
         """
         keywords: A list of words that indicate that the user wants an identifying quality of a Label returned.
@@ -284,11 +537,7 @@ class Tokenize():
         """
         Populate a list of the nouns that are labels.
         """
-        labelNouns = []
-        for n in nouns:
-            for l in self.labels:
-                if self.equals_ignore_case(n, l):
-                    labelNouns.append(n)
+        labelNouns = [n for n in nouns if canonical(self.schema_word(n)) in self.schema.labelIndex]
         """
         Check that there is only 1 "label" noun. If otherwise, this method should not handle it, return -1.
         If it only has one, assign that one to "label".
@@ -300,7 +549,36 @@ class Tokenize():
         if len(labelNouns) != 1:
             return -1
         else:
-            label = labelNouns[0].capitalize()
+            label = self.schema_word(labelNouns[0]).capitalize()
+
+        """
+        Check that there aren't two labels in the words of the tagMap. If there are, this method shouldn't handle it; 
+        return -1.
+        NOTE: 
+            This feature has been added after some failed unittest; it was noted that occasionally nltk.pos_tag doesn't 
+            actually tag the words correctly. For example, in the sentence "Who are all the people that are outlaws?", 
+            'outlaws' is obviously a noun. But nltk.pos_tag gives in the Stanford CoreNLP tag of 'VBN', that is, a verb 
+            past participle. To combat this problem, we first do a quick check by running the words in the tagMap 
+            against the words in the labels list.  
+            This check is done after the cheap checks above, and goes through the schema's matcher, so that WordNet 
+            is only asked about words that aren't known question words or the schema's own terms, synonyms and
+            properties (see matcher.py).
+            With schemaTagging the tags can be trusted, so WordNet isn't asked at all.
+        
+        """
+        similarity = None if self.schemaTagging else self.similarity_score
+        known = None if self.schemaTagging else self.known_word
+        labelCount = self.schema.matcher.count(tagMap, "labels", similarity, known)
+        if labelCount > 1:
+            return -1
+
+        """
+        Check that there are no relationship nouns in the words of the tagMap. If there are, this method shouldn't 
+        handle it; return -1;
+        """
+        relationshipCount = self.schema.matcher.count(tagMap, "relationships", similarity, known)
+        if relationshipCount > 0:
+            return -1
 
         """
         Populate a list of the nouns that are properties.
@@ -310,33 +588,27 @@ class Tokenize():
             We're assuming a lot.   
         """
         propertyNouns = []
-        for tm in tagMap:
-            for k in keywords:
-                if self.equals_ignore_case(tm[0], k) and self.labelProperties[label][0] not in propertyNouns:
-                    propertyNouns.append(self.labelProperties[label][0])
-
-        for n in nouns:
-            for item in self.labelProperties[label.capitalize()]:
-                if self.equals_ignore_case(n, item) and n not in propertyNouns:
-                    propertyNouns.append(n)
+        keywordSet = canonical_set(keywords)
+        if any(canonical(tm[0]) in keywordSet for tm in tagMap):
+            propertyNouns.append(self.labelProperties[label][0])
+
+        for n in map(self.schema_word, nouns):
+            if canonical(n) in self.schema.propertyIndex[label.capitalize()] and n not in propertyNouns:
+                propertyNouns.append(n)
+        if len(propertyNouns) == 0:
+            return -1
 
         """
         Build the final query.
         """
-        prop = "n." + propertyNouns[0]
-        if len(propertyNouns) > 1:
-            for idx, pn in enumerate(propertyNouns):
-                if idx != 0:
-                    prop += ", " "n." + pn
-
-        query1 = "MATCH (n :" + label + ") RETURN " + prop
+        query1 = Query(Node("n", [label]), returns=[Projection("n", pn) for pn in propertyNouns])
         return query1
 
     def numberStartsWith(self, tagMap):
         """
         Author: Kevin Feddema
         Date created: 19/03/2018
-        Date last modified: 02/04/2018
+        Date last modified: 19/10/2026
 
         The following method accepts a tokenized tag map and constructs a query for questions similar to "How many names
         begin with a J?" or "What is the number of people with a name starting with J?". These two questions are the
@@ -345,7 +617,7 @@ class Tokenize():
         The 3 indicators are the countIndicator, the letterIndicator, and the letterPosIndicator.
 
         :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
+        :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
         """
 
         query5 = ""  # the final query that is returned after processing
@@ -422,14 +694,15 @@ class Tokenize():
                             maxScore = score
         attribute = maxLabelProp
 
-        query5 = "MATCH (n) WHERE n." + attribute + " " + condition + " \"" + value + "\" " + "RETURN COUNT (n." + attribute + ")"
+        query5 = Query(Node("n"), where=Comparison("n", attribute, condition, Value(value, quote="\"")),
+                       returns=[Projection("n", attribute, count=True)])
         return query5
 
     def numberNullOrNot(self, tagMap):
         """
         Author: Kevin Feddema
         Date created: 31/03/2018
-        Date last modified: 01/04/2018
+        Date last modified: 19/10/2026
 
         The following method accepts a tokenized tag map and constructs a query for questions similar to "What
         is the number of animals with a known specie". Much like the numberStartsWith method, the numberNullOrNot
@@ -439,7 +712,7 @@ class Tokenize():
         correctly differentiate between a numberStartsWith and a numberNullOrNot question.
 
         :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
+        :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
         """
         print("Test test test")
 
@@ -491,17 +764,18 @@ class Tokenize():
                             maxLabelProp = labelProp
                             maxScore = score
         attribute = maxLabelProp
-        query6 = "MATCH (n) WHERE n." + attribute + " " + condition + " RETURN COUNT (n." + attribute + ")"
+        query6 = Query(Node("n"), where=Comparison("n", attribute, condition),
+                       returns=[Projection("n", attribute, count=True)])
         return query6
 
     def return_multiple_labels(self, tagMap):
         """
         Author: Osahon David Osemwegie
         Date created: 25/03/2018
-        Date last modified: 26/03/2018
+        Date last modified: 19/10/2026
 
         :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
+        :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
         """
 
         """Sample Question: What are the names of the outlaws and Animals"""
@@ -511,24 +785,6 @@ class Tokenize():
 
         nounTags = ["NN", "NNS", "NNP", "NNPS"]
 
-        """Check to see there are more than 1 labels in the words of the Tagmap
-        If so then return -1.
-        Also checks to see if there are any relationship words in the tagMap
-        If ss or less return -1
-        Note: This section of code is is a modified version of code written by Angie Pinchbeck"""
-
-        labelCount = 0
-        relationshipCount = 0
-        for t in tagMap:
-            for a in self.labels:
-                if self.similarity_score(t[0], a) > 0.9:
-                    labelCount += 1
-            for b in self.relationships:
-                if self.similarity_score(t[0], b) > 0.9:
-                    relationshipCount += 1
-        if labelCount <= 1 or relationshipCount > 1:
-            return -1
-
         """Check to see if the user is asking for a 'count' if so then return -1"""
         """Note: This section of code is is a modified version of code written by Kevin Feddema and Angie Pinchbeck"""
 
@@ -554,11 +810,7 @@ class Tokenize():
                 listOfNouns.append(i[0])
 
         """Get the nouns that are labels"""
-        nounLabels = []
-        for n in listOfNouns:
-            for l in self.labels:
-                if self.equals_ignore_case(n, l):
-                    nounLabels.append(n)
+        nounLabels = [n for n in map(self.schema_word, listOfNouns) if canonical(n) in self.schema.labelIndex]
 
         labels = []
 
@@ -572,36 +824,38 @@ class Tokenize():
             for i in nounLabels:
                 labels.append(i.capitalize())
 
+        """Check to see there are more than 1 labels in the words of the Tagmap
+        If so then return -1.
+        Also checks to see if there are any relationship words in the tagMap
+        If ss or less return -1
+        Note: This section of code is is a modified version of code written by Angie Pinchbeck
+        This is done after the cheap checks above, through the schema's matcher (see matcher.py)"""
+
+        similarity = None if self.schemaTagging else self.similarity_score
+        known = None if self.schemaTagging else self.known_word
+        labelCount = self.schema.matcher.count(tagMap, "labels", similarity, known)
+        relationshipCount = self.schema.matcher.count(tagMap, "relationships", similarity, known)
+        if labelCount <= 1 or relationshipCount > 1:
+            return -1
+
         """This is section of modified code written by Angie Pinchbek"""
 
         propertyNouns = []
-        for tm in tagMap:
+        keywordSet = canonical_set(keywords)
+        if any(canonical(tm[0]) in keywordSet for tm in tagMap):
             for i in labels:
-                for k in keywords:
-                    if self.equals_ignore_case(tm[0], k) and self.labelProperties[i][0] not in propertyNouns:
-                        propertyNouns.append(self.labelProperties[i][0])
+                if self.labelProperties[i][0] not in propertyNouns:
+                    propertyNouns.append(self.labelProperties[i][0])
 
-        for n in listOfNouns:
+        for n in map(self.schema_word, listOfNouns):
             for i in labels:
-                for item in self.labelProperties[i.capitalize()]:
-                    if self.equals_ignore_case(n, item) and n not in propertyNouns:
-                        propertyNouns.append(n)
-
-        properties = "n." + propertyNouns[0]
-
-        """NOTE: Code snippet from Angie Pinchbek"""
-        if len(propertyNouns) > 1:
-            for idx, pn in enumerate(propertyNouns):
-                if idx != 0:
-                    properties += ", " "n." + pn
-
-        labelList = ""
-
-        for i in labels:
-            labelList += " :" + i
+                if canonical(n) in self.schema.propertyIndex[i.capitalize()] and n not in propertyNouns:
+                    propertyNouns.append(n)
+        if len(propertyNouns) == 0:
+            return -1
 
         """Construct Query"""
-        query = "MATCH (n {} ) RETURN {}".format(labelList, properties)
+        query = Query(Node("n", labels, padded=True), returns=[Projection("n", pn) for pn in propertyNouns])
 
         return query
 
@@ -617,17 +871,19 @@ class Tokenize():
         """
         Author: Joseph Pruner & Kevin Feddema
         Date created: 25/03/2018
-        Date last modified: 02/04/2018
+        Date last modified: 19/10/2026
 
         This method lists all nodes that have a specific property, and optional subtype of property (i.e. Species that is dog).
         You can either have the list of results be the entire node, or just the list of the designated property.
 
-        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags. It isn't changed; the
+            retagging below is done on a copy.
+        :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
         """
         propertyIndicator = 0
         property = ""
         propertySubType = ""
+        tagMap = list(tagMap)
 
         """Do not handle this query if there are relationships or labels in it."""
         for elem in tagMap:
@@ -635,14 +891,12 @@ class Tokenize():
                 return -1
         for i in range(tagMap.__len__()):
             if tagMap[i][0] == "named":
-                tagMap.pop([i][0])
-                tagMap.insert([i][0], ("name", 'NN'))
+                tagMap[i] = ("name", 'NN')
                 property = "name"
                 propertyIndicator = 1
                 break
             if tagMap[i][0] == "list":
-                tagMap.pop([i][0])
-                tagMap.insert([i][0], ("list", 'VB'))
+                tagMap[i] = ("list", 'VB')
                 break
         if propertyIndicator == 0:
             for elem in tagMap:
@@ -684,26 +938,26 @@ class Tokenize():
         # print("nodeIsProperty is "+str(nodeIsProperty))
 
         if property != "" and propertySubType != "" and not nodeIsProperty:
-            query3 = "MATCH (n {" + property + " :\'" + propertySubType + "\'" + "}) RETURN n"
+            query3 = Query(Node("n", properties=[(property, Value(propertySubType))]), returns=[Projection("n")])
         elif property != "" and propertySubType == "" and nodeIsProperty:
-            query3 = "MATCH (n) RETURN n."+property
+            query3 = Query(Node("n"), returns=[Projection("n", property)])
             """Show me everything that is a species """
         elif property != "" and propertySubType == "" and not nodeIsProperty:
-            query3 = "MATCH (n) where exists (n." + property + ") RETURN n"
+            query3 = Query(Node("n"), where=Exists("n", property), returns=[Projection("n")], whereKeyword="where")
         return query3
 
     def relationshipOrder(self, tagMap):
 
         """Author: Joseph Pruner
         Date created: 30/03/2018
-        Date last modified: 30/03/2018
+        Date last modified: 19/10/2026
 
         This method returns results based on the nodes relationships with each other.
         (i.e. Who has a parent, who is a parent, or what are the names of everyone that likes something etc.)
         Your results can be return either has the node list, or as a property of that node.
 
          :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-         :return: A Cypher query as a string if appropriate; else, -1.
+         :return: A Cypher query (a cypher.Query, which is also a string) if appropriate; else, -1.
 
         """
         relationshipIndicator = 0
@@ -779,54 +1033,69 @@ class Tokenize():
         relationship += "s"
 
         if relationshipTarget == "" and property != "" and not relatorProperty and not relatedProperty:
-            query7 += "MATCH (p) -[:" + relationship + "] -> (n" + property + ") RETURN n"
+            query7 = Query(Path(Node("p"), relationship, Node("n" + property)), returns=[Projection("n")])
         elif relationshipTarget == "" and relatorProperty:
-            query7 += "MATCH (p) -[:" + relationship + "] -> (n) RETURN p." + property
+            query7 = Query(Path(Node("p"), relationship, Node("n")), returns=[Projection("p", property)])
         elif relationshipTarget == "" and relatedProperty and property != "":
-            query7 += "MATCH (p) -[:" + relationship + "] -> (n) RETURN n." + property
+            query7 = Query(Path(Node("p"), relationship, Node("n")), returns=[Projection("n", property)])
         elif relationshipTarget == "" and relatedProperty and property == "":
-            query7 += "MATCH (p) -[:" + relationship + "] -> (n) RETURN n"
+            query7 = Query(Path(Node("p"), relationship, Node("n")), returns=[Projection("n")])
         elif relationshipTarget == "" and property == "" and not relatedProperty and not relatorProperty:
-            query7 += "MATCH (p) -[:" + relationship + "] -> (n) RETURN p"
+            query7 = Query(Path(Node("p"), relationship, Node("n")), returns=[Projection("p")])
 
         return query7
 
-    def count_with_operators(self, tagMap):
-        """
-        Author: Angie Pinchbeck
-        Date created: 30/03/2018
-        Date last modified: 30/03/2018
 
-        This method returns queries that are used for aggregating the results of filtering Nodes based on
-        quantification of properties. It deals with the operators <, >, <>, =, >=, <=
-
-        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
-        :return: A Cypher query as a string if appropriate; else, -1.
-        """
-
-        """
-        This portion of the code is a modified version of code written by Kevin Feddema. It determines whether or not
-        there are words that indicate the user is asking for a "count" of some kind. If there is no count indicator, 
-        then this method should not handle it; return -1.
-
-        countIndicator: This will be 1 if "count" is indicated, 0 if not.   
-        """
-        countIndicator = 0
-        for elem in tagMap:
-            if elem[0] == 'number':
-                countIndicator = 1
-        chunkSequence = '''Chunk:{<WRB>+ <JJ>+}'''
-        NPChunker = nltk.RegexpParser(chunkSequence)
-        chunks = NPChunker.parse(tagMap)
-        for n in chunks:
-            if isinstance(n, nltk.tree.Tree):
-                if n.label() == 'Chunk':
-                    howMany = n
-                    countIndicator = 1
-        if countIndicator == 0:
-            return -1
-
-        keywords = ["than", "equal", "less", "greater"]
+def run_pipe(lines, out, schemaId=DEFAULT_SCHEMA, log=None, tokenize=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Translates one question per line, for as long as there are lines, and writes one JSON object per line to out:
+
+        {"question": ..., "queries": [...], "timings": {"tokenize": ms, "translate": ms}, "error": null}
+
+    Everything is loaded once for the first question and then stays warm, so this is much faster than starting
+    Tokenize.py once per question. Each result is flushed as soon as it is written, so that the other end of a pipe
+    can read it straight away. The translation methods' debugging output goes to stderr, so it can't get mixed in.
+    Each question is also recorded in the workload log, if there is one (see workload.py).
+
+    :param lines: An iterable of questions, e.g. sys.stdin. Blank lines are skipped.
+    :param out: Where to write the results, e.g. sys.stdout.
+    :param schemaId: The name of the schema to translate against.
+    :param log: The workload.WorkloadLog to record the questions in, or None for workload.default_log().
+    :param tokenize: The function of (question, schemaId) that makes the Tokenize object for a question; Tokenize
+        unless another is given.
+    :return: nothing
+    """
+    import json
+    import time
+    from contextlib import redirect_stdout
+
+    log = log or workload.default_log()
+    tokenize = tokenize or Tokenize
+    for line in lines:
+        question = line.strip()
+        if question == "":
+            continue
+        result = dict(question=question, queries=[], timings={}, error=None)
+        t = None
+        try:
+            with redirect_stdout(sys.stderr):
+                started = time.perf_counter()
+                t = tokenize(question, schemaId)
+                tokenized = time.perf_counter()
+                result["queries"] = t.runTranslator(t.wordsTagged)
+                translated = time.perf_counter()
+            result["timings"] = dict(tokenize=round((tokenized - started) * 1000, 3),
+                                     translate=round((translated - tokenized) * 1000, 3))
+        except Exception as e:
+            result["error"] = "%s: %s" % (type(e).__name__, e)
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+        if log is not None:
+            log.record(workload.entry(t, result["queries"], result["timings"], schemaId, result["error"]))
 
 
 """
@@ -835,57 +1104,58 @@ When running from website use:
     string = " ".join(sysin)
 When running from console use:
     string = input()  
-For testing purposes, a while-loop is included at the bottom (commented out) that will allow for continual input and 
-tokenization until "e" is entered. 
+For continual input, run with --pipe: every line of standard input is translated, and the results are written to 
+standard output as one JSON object per line (see run_pipe()). 
 """
-# string = input()
-sysin = sys.argv[1:]
-string = " ".join(sysin)
-#string = "What are the sizes of the animals and outlaws"
-# string = "What are the names of the animals"
-# string = "What are the female people"
-# string = "What are the names of people with parents?"
-# string = "How many outlaws have a bounty of less than $10,000 on them?"
-# string = "Who are the outlaws and what are the bounties on them?"
-# string = "What are the species of each the animals?"
-# string = "How many names start with J?"
-# string = "How many names have a J in any position"
-# string = "How many names contain a J"
-# string = "How many animals have an unknown specie"
-# string = "Who are all the females that are outlaws?"
-# string = "What are the names of people with parents from biggest smallest?"
-# string = "what are the names of the outlaws"
-# string = "Who are all the outlaws?"
-# string = "give me a list of all the outlaws"
-# string = "Which animals are also outlaws?"
-# string = "Who are the people that are outlaws?"
-
-""" Create a tokenize object on the input string and print the tuple of the scrubbed words and their tags. """
-t = Tokenize(string)
-tagMap = t.wordsTagged
-# print(tagMap)
-# print(t.matchLabelAndProperty(tagMap))
-# print(t.numberStartsWith(tagMap))
-# print(t.numberNullOrNot(tagMap))
-# print(t.listAllOf(tagMap))
-# print (t.labels)
-# print ("LOL")
-
-results = t.runTranslator(tagMap)
-for item in results:
-    print(item)
-
-# print(t.match_label_and_property(tagMap))
-# print(t.return_multiple_labels(tagMap))
-
-"""
-string = input()
-while (string != 'e'):
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--pipe"]:
+        run_pipe(sys.stdin, sys.stdout, *sys.argv[2:3])
+        sys.exit(0)
+    # string = input()
+    sysin = sys.argv[1:]
+    string = " ".join(sysin)
+    #string = "What are the sizes of the animals and outlaws"
+    # string = "What are the names of the animals"
+    # string = "What are the female people"
+    # string = "What are the names of people with parents?"
+    # string = "How many outlaws have a bounty of less than $10,000 on them?"
+    # string = "Who are the outlaws and what are the bounties on them?"
+    # string = "What are the species of each the animals?"
+    # string = "How many names start with J?"
+    # string = "How many names have a J in any position"
+    # string = "How many names contain a J"
+    # string = "How many animals have an unknown specie"
+    # string = "Who are all the females that are outlaws?"
+    # string = "What are the names of people with parents from biggest smallest?"
+    # string = "what are the names of the outlaws"
+    # string = "Who are all the outlaws?"
+    # string = "give me a list of all the outlaws"
+    # string = "Which animals are also outlaws?"
+    # string = "Who are the people that are outlaws?"
+
+    """ Create a tokenize object on the input string and print the tuple of the scrubbed words and their tags. """
+    import time
+    started = time.perf_counter()
     t = Tokenize(string)
+    tokenized = time.perf_counter()
     tagMap = t.wordsTagged
+    # print(tagMap)
+    # print(t.matchLabelAndProperty(tagMap))
+    # print(t.numberStartsWith(tagMap))
+    # print(t.numberNullOrNot(tagMap))
+    # print(t.listAllOf(tagMap))
+    # print (t.labels)
+    # print ("LOL")
+
     results = t.runTranslator(tagMap)
+    translated = time.perf_counter()
     for item in results:
         print(item)
-    print("Enter a sentence to tokenize (\"e\" to exit): ")
-    string = input()
-"""
+    log = workload.default_log()
+    if log is not None:
+        log.record(workload.entry(t, results, dict(tokenize=round((tokenized - started) * 1000, 3),
+                                                   translate=round((translated - tokenized) * 1000, 3)),
+                                  DEFAULT_SCHEMA))
+
+    # print(t.match_label_and_property(tagMap))
+    # print(t.return_multiple_labels(tagMap))
@@ -0,0 +1,396 @@
+"""
+bundle.py:
+Builds, and loads, a single binary file with everything the translator needs, so that it starts in milliseconds.
+
+File name: bundle.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Starting the translator from scratch means unpickling NLTK's tagger, reading the stop words corpus, loading the Punkt
+sentence model and building WordNet's indexes from its text files. A bundle is all of that, compiled ahead of time:
+
+    stopwords           The NLTK English stop words, minus Tokenize.keptStopWords.
+    tagger.*            The weights, tag dictionary and classes of the part of speech tagger.
+    punkt.*             The parameters of the Punkt sentence tokenizer used by word_tokenize().
+    schema:<name>       The labels, relationships and properties of every schema, and the terms its own words are
+                        related to (see matcher.related_terms()).
+    similarity:<name>   Precomputed similarity scores between the words questions use and the schema's terms.
+
+The file is opened with mmap, and the large sections are hash tables that are read in place, one entry at a time,
+when they are looked up. Nothing is decoded up front, so loading a bundle doesn't depend on its size and never touches
+nltk_data. Only the WordNet lookups for words that weren't precomputed still go to WordNet.
+
+To build a bundle (this needs nltk_data, and WordNet to precompute the similarity tables):
+    python bundle.py build outlaw.bundle --corpus questions.txt
+
+To use it, either call resources.use_bundle("outlaw.bundle"), or set the NL2CQ_BUNDLE environment variable to its path.
+
+File layout (all integers little-endian):
+    header          8 byte magic number, uint32 format version, uint32 number of sections
+    section table   for every section: 32 byte name, uint64 offset, uint64 length
+    sections        the sections themselves
+
+Every hash table section starts with uint32 number of slots, uint32 number of entries, followed by the slots, each
+(uint32 offset of the entry, uint16 length of the key, uint32 length of the value), and then the entries, each the key
+followed by the value. The slot for a key is found with zlib.crc32 and linear probing.
+
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import defaultdict
+
+try:
+    from sprint4.matcher import related_terms
+    from sprint4.schema import Schema
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from matcher import related_terms
+    from schema import Schema
+
+MAGIC = b"NL2CQBDL"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<32sQQ")
+_TABLE = struct.Struct("<II")
+_SLOT = struct.Struct("<IHI")
+_WEIGHT = struct.Struct("<Hd")
+_FLOAT = struct.Struct("<d")
+_INT = struct.Struct("<i")
+
+"""The words that the translation methods look for, on top of the schema's own terms and the kept stop words."""
+TRANSLATOR_WORDS = ["who", "every", "each", "all", "list", "return", "number", "name", "named", "start", "starting",
+                    "begin", "beginning", "first", "front", "end", "ending", "last", "back", "contain", "position",
+                    "known", "unknown", "many", "show", "give", "everyone", "everything", "someone", "something",
+                    "anything", "letter", "like", "dislike", "parent", "people", "person"]
+
+
+class BundleError(Exception):
+    """Raised when a file is not a bundle, or was built with a format version this code can't read."""
+
+
+def _key(key):
+    if isinstance(key, tuple):
+        key = "\t".join(key)
+    return key.encode("utf-8")
+
+
+def pack_table(items):
+    """
+    Pack a hash table section.
+
+    :param items: A dictionary from key (a string, or a tuple of strings) to the packed bytes of its value.
+    :return: The bytes of the section.
+    """
+    entries = [(_key(key), value) for key, value in items.items()]
+    slotCount = max(8, 2 * len(entries))
+    slots = [None] * slotCount
+    data = bytearray()
+    dataStart = _TABLE.size + slotCount * _SLOT.size
+    for key, value in entries:
+        slot = zlib.crc32(key) % slotCount
+        while slots[slot] is not None:
+            slot = (slot + 1) % slotCount
+        slots[slot] = (dataStart + len(data), len(key), len(value))
+        data += key
+        data += value
+    out = bytearray(_TABLE.pack(slotCount, len(entries)))
+    for slot in slots:
+        out += _SLOT.pack(*(slot or (0, 0, 0)))
+    return bytes(out + data)
+
+
+class MappedTable():
+    """
+    A read-only dictionary that looks its entries up directly in a hash table section of a mapped bundle.
+    """
+
+    def __init__(self, buffer, offset, decode, default=None):
+        self._buffer = buffer
+        self._offset = offset
+        self._decode = decode
+        self._default = default
+        self._slotCount, self._count = _TABLE.unpack_from(buffer, offset)
+
+    def _find(self, key):
+        key = _key(key)
+        slot = zlib.crc32(key) % self._slotCount
+        while True:
+            entry, keyLength, valueLength = _SLOT.unpack_from(self._buffer, self._offset + _TABLE.size + slot * _SLOT.size)
+            if entry == 0:
+                return None
+            start = self._offset + entry
+            if keyLength == len(key) and self._buffer[start:start + keyLength] == key:
+                return self._buffer[start + keyLength:start + keyLength + valueLength]
+            slot = (slot + 1) % self._slotCount
+
+    def get(self, key, default=None):
+        value = self._find(key)
+        return default if value is None else self._decode(value)
+
+    def __getitem__(self, key):
+        value = self._find(key)
+        if value is None:
+            if self._default is not None:
+                return self._default
+            raise KeyError(key)
+        return self._decode(value)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self._count
+
+
+def _weights(value):
+    return _WEIGHT.iter_unpack(value)
+
+
+class MappedPerceptron():
+    """
+    The part of the nltk AveragedPerceptron that tagging uses, reading its weights from a mapped bundle.
+    """
+
+    def __init__(self, weights, classes):
+        self.weights = weights
+        self.classes = classes
+        self._classList = sorted(classes)
+
+    def predict(self, features, return_conf=False):
+        """This is AveragedPerceptron.predict(), with the class of each weight stored as an index into the classes."""
+        scores = defaultdict(float)
+        for feat, value in features.items():
+            if value == 0:
+                continue
+            weights = self.weights.get(feat)
+            if weights is None:
+                continue
+            for label, weight in weights:
+                scores[self._classList[label]] += value * weight
+
+        # Do a secondary alphabetic sort, for stability
+        best_label = max(self.classes, key=lambda label: (scores[label], label))
+        conf = None
+        if return_conf:
+            top = max(scores.values())
+            conf = 1.0 / sum(math.exp(s - top) for s in scores.values())
+        return best_label, conf
+
+
+class Bundle():
+    """
+    A bundle file, mapped into memory.
+
+    Attributes:
+        path (String): The file the bundle was loaded from.
+        meta [Dictionary]: What the bundle was built from: the format version, the time it was built, the NLTK version,
+            the kept stop words and the names of its schemas.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise BundleError(path + " is not an NL2CQ bundle")
+        if version != FORMAT_VERSION:
+            raise BundleError("%s is bundle format version %d; this code reads version %d" % (path, version,
+                                                                                              FORMAT_VERSION))
+        self._sections = {}
+        for i in range(count):
+            name, offset, length = _ENTRY.unpack_from(self._buffer, _HEADER.size + i * _ENTRY.size)
+            self._sections[name.rstrip(b"\0").decode("utf-8")] = (offset, length)
+        self.meta = json.loads(self._bytes("meta").decode("utf-8"))
+        self._tagger = None
+        self._sentenceTokenizer = None
+
+    def _bytes(self, name):
+        offset, length = self._sections[name]
+        return self._buffer[offset:offset + length]
+
+    def _table(self, name, decode, default=None):
+        return MappedTable(self._buffer, self._sections[name][0], decode, default)
+
+    def stop_words(self):
+        """
+        :return: The frozenset of stop words, minus the kept stop words listed in meta.
+        """
+        return frozenset(self._bytes("stopwords").decode("utf-8").split("\n")) - frozenset([""])
+
+    def tagger(self):
+        """
+        :return: A PerceptronTagger whose model and tag dictionary are read from the bundle.
+        """
+        if self._tagger is None:
+            from nltk.tag.perceptron import PerceptronTagger
+            classes = set(self._bytes("tagger.classes").decode("utf-8").split("\n"))
+            tagger = PerceptronTagger(load=False)
+            tagger.classes = classes
+            tagger.tagdict = self._table("tagger.tagdict", lambda v: v.decode("utf-8"))
+            tagger.model = MappedPerceptron(self._table("tagger.weights", _weights), classes)
+            self._tagger = tagger
+        return self._tagger
+
+    def sentence_tokenizer(self):
+        """
+        :return: A Punkt sentence tokenizer whose parameters are read from the bundle.
+        """
+        if self._sentenceTokenizer is None:
+            from nltk.tokenize.punkt import PunktParameters, PunktSentenceTokenizer
+            params = PunktParameters()
+            params.abbrev_types = self._table("punkt.abbrev", bytes)
+            params.sent_starters = self._table("punkt.starters", bytes)
+            params.collocations = self._table("punkt.collocations", bytes)
+            params.ortho_context = self._table("punkt.ortho", lambda v: _INT.unpack(v)[0], default=0)
+            tokenizer = PunktSentenceTokenizer()
+            tokenizer._params = params
+            self._sentenceTokenizer = tokenizer
+        return self._sentenceTokenizer
+
+    def schemas(self):
+        """
+        :return: A list of the bundle's schemas, each with its precomputed similarity table attached.
+        """
+        schemas = []
+        for name in self.meta["schemas"]:
+            d = json.loads(self._bytes("schema:" + name).decode("utf-8"))
+            table = self._table("similarity:" + name, lambda v: _FLOAT.unpack(v)[0])
+            schemas.append(Schema(name, d["labels"], d["relationships"], d["labelProperties"],
+                                  d["relationshipProperties"], similarityTable=table, synonyms=d["synonyms"],
+                                  nonTerms=d["nonTerms"], relatedTerms=d.get("relatedTerms")))
+        return schemas
+
+
+def write_bundle(path, stopWords, keptStopWords, tagger, punktParams, schemas, similarities):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Writes a bundle file from resources that have already been loaded.
+
+    :param path: The file to write.
+    :param stopWords: The stop words, with the kept stop words already taken out.
+    :param keptStopWords: The kept stop words, recorded so the runtime can check they match.
+    :param tagger: An nltk PerceptronTagger.
+    :param punktParams: The nltk PunktParameters of the sentence tokenizer.
+    :param schemas: A list of Schema objects, with their relatedTerms worked out.
+    :param similarities: A dictionary from schema name to a dictionary from (word, word) to similarity score.
+    :return: nothing
+    """
+    import nltk
+    classList = sorted(tagger.classes)
+    classIndex = dict((c, i) for i, c in enumerate(classList))
+    sections = [
+        ("meta", json.dumps(dict(format=FORMAT_VERSION, created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                                 nltk=nltk.__version__, keptStopWords=sorted(keptStopWords),
+                                 schemas=[s.name for s in schemas])).encode("utf-8")),
+        ("stopwords", "\n".join(sorted(stopWords)).encode("utf-8")),
+        ("tagger.classes", "\n".join(classList).encode("utf-8")),
+        ("tagger.tagdict", pack_table(dict((w, t.encode("utf-8")) for w, t in tagger.tagdict.items()))),
+        ("tagger.weights", pack_table(dict((feat, b"".join(_WEIGHT.pack(classIndex[c], w) for c, w in ws.items()))
+                                           for feat, ws in tagger.model.weights.items()))),
+        ("punkt.abbrev", pack_table(dict((w, b"") for w in punktParams.abbrev_types))),
+        ("punkt.starters", pack_table(dict((w, b"") for w in punktParams.sent_starters))),
+        ("punkt.collocations", pack_table(dict((c, b"") for c in punktParams.collocations))),
+        ("punkt.ortho", pack_table(dict((w, _INT.pack(f)) for w, f in punktParams.ortho_context.items()))),
+    ]
+    for schema in schemas:
+        sections.append(("schema:" + schema.name, json.dumps(dict(
+            labels=schema.labels, relationships=schema.relationships, labelProperties=dict(schema.labelProperties),
+            relationshipProperties=dict(schema.relationshipProperties), synonyms=dict(schema.synonyms),
+            nonTerms=sorted(schema.nonTerms), relatedTerms=dict(schema.relatedTerms))).encode("utf-8")))
+        sections.append(("similarity:" + schema.name,
+                         pack_table(dict((k, _FLOAT.pack(v)) for k, v in similarities.get(schema.name, {}).items()))))
+
+    offset = _HEADER.size + len(sections) * _ENTRY.size
+    with open(path + ".tmp", "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        for name, data in sections:
+            f.write(_ENTRY.pack(name.encode("utf-8"), offset, len(data)))
+            offset += len(data)
+        for name, data in sections:
+            f.write(data)
+    os.replace(path + ".tmp", path)
+
+
+def _punkt_params():
+    import nltk.tokenize
+    if hasattr(nltk.tokenize, "_get_punkt_tokenizer"):
+        return nltk.tokenize._get_punkt_tokenizer("english")._params
+    return nltk.data.load("tokenizers/punkt/english.pickle")._params
+
+
+def build(path, schemaIds=None, corpus=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Builds a bundle from nltk_data and the schema registry. The similarity tables cover every pair of words that
+    the translation methods compare: each word that questions are expected to use, against every label, relationship
+    and property of the schema. The terms that each schema's own words are related to are worked out again as well.
+
+    :param path: The file to write.
+    :param schemaIds: The names of the schemas to include; every registered schema if None.
+    :param corpus: An optional list of questions whose words should be precomputed as well.
+    :return: nothing
+    """
+    try:
+        from sprint4 import resources
+        from sprint4.Tokenize import Tokenize
+        from sprint4.schema import registry
+    except ImportError:  # run as a script from inside sprint4/
+        import resources
+        from Tokenize import Tokenize
+        from schema import registry
+
+    schemas = []
+    similarities = {}
+    for schema in [registry.get(name) for name in (schemaIds or registry.names())]:
+        t = Tokenize("", schema.name)
+        schema = Schema(schema.name, schema.labels, schema.relationships, schema.labelProperties,
+                        schema.relationshipProperties, synonyms=schema.synonyms, nonTerms=schema.nonTerms,
+                        relatedTerms=related_terms(schema, t.similarity_score))
+        schemas.append(schema)
+        words = set(TRANSLATOR_WORDS) | set(Tokenize.keptStopWords) | set(schema.properties)
+        words |= set(schema.labelIndex) | set(schema.relationships) | set(r.rstrip("s") for r in schema.relationships)
+        words |= set(schema.synonyms)
+        for question in corpus or []:
+            words |= set(w for w, tag in Tokenize(question, schema.name).wordsTagged)
+        table = {}
+        for word in words:
+            for term in schema.labels + schema.relationships:
+                table[(word, term)] = t.similarity_score(word, term)
+            for prop in schema.properties:
+                table[(prop, word)] = t.similarity_score(prop, word)
+        similarities[schema.name] = table
+
+    write_bundle(path, resources.stop_words(Tokenize.keptStopWords), Tokenize.keptStopWords, resources.tagger(),
+                 _punkt_params(), schemas, similarities)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("usage: python bundle.py build OUTPUT [--schema NAME]... [--corpus QUESTIONS_FILE]")
+        sys.exit(2)
+    args = sys.argv[3:]
+    schemaIds = [args[i + 1] for i, a in enumerate(args) if a == "--schema"]
+    corpus = None
+    if "--corpus" in args:
+        with open(args[args.index("--corpus") + 1], encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+    started = time.time()
+    build(sys.argv[2], schemaIds or None, corpus)
+    print("Built %s in %.1f seconds" % (sys.argv[2], time.time() - started))
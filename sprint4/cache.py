@@ -0,0 +1,123 @@
+"""
+cache.py:
+A small, bounded, thread-safe least-recently-used cache.
+
+File name: cache.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Every schema in the SchemaRegistry owns its own LRUCache instances, so that one schema (one tenant) can never
+evict another schema's entries. The cache also counts hits and misses so that the load and memory tools can report
+on how well the caches are doing.
+
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache():
+    """
+    LRUCache is a dictionary-like cache that holds at most maxSize entries. When it is full, the entry that was used
+    least recently is evicted to make room for the new one.
+
+    Attributes:
+        maxSize (int): The largest number of entries the cache will hold.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that did not find an entry.
+
+    """
+
+    def __init__(self, maxSize=4096):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Look up a key, marking it as the most recently used entry.
+
+        :param key: The key to look up.
+        :param default: The value to return if the key is not cached.
+        :return: The cached value, or default.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        :param key: The key to store.
+        :param value: The value to store.
+        :return: nothing
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """
+        Remove a key from the cache if it is there.
+
+        :param key: The key to remove.
+        :return: nothing
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def keys(self):
+        """
+        :return: A list of the keys currently cached, least recently used first.
+        """
+        with self._lock:
+            return list(self._entries.keys())
+
+    def items(self):
+        """
+        :return: A list of the (key, value) pairs currently cached, least recently used first. This doesn't count as
+            using them, or as hits.
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics.
+
+        :return: nothing
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        :return: A dictionary with the size, capacity, hits, misses and hit rate of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(size=len(self._entries), maxSize=self.maxSize, hits=self.hits, misses=self.misses,
+                        hitRate=(float(self.hits) / lookups) if lookups else 0.0)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,56 @@
+"""
+canonical.py:
+The canonical form of a word, which is how words from questions are compared with schema terms and keywords.
+
+File name: canonical.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Tokenize.equals_ignore_case() lowercased and NFKD-normalized both of its strings on every single comparison, and the
+translation methods compared every noun with every label and property that way. Instead, every word is put in its
+canonical form once: when the question is tokenized, and when the schema is built. The canonical form is case folded
+and NFKD-normalized, and interned, so comparing two canonical words is an identity check, and finding one among the
+schema's terms is a set or dictionary lookup. Most words are plain ASCII, and for them lowercasing is all it takes.
+
+"""
+
+import sys
+import unicodedata
+
+"""How many words to remember the canonical form of. When it is full it is emptied, which is cheap to refill."""
+MAX_SIZE = 65536
+
+_canonical = {}
+
+
+def canonical(word):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param word: A string.
+    :return: The interned, case folded, NFKD-normalized form of the string.
+    """
+    form = _canonical.get(word)
+    if form is None:
+        try:
+            word.encode("ascii")
+            form = word.lower()
+        except UnicodeEncodeError:
+            form = unicodedata.normalize("NFKD", word.casefold())
+        form = sys.intern(form)
+        if len(_canonical) >= MAX_SIZE:
+            _canonical.clear()
+        _canonical[word] = form
+    return form
+
+
+def canonical_set(words):
+    """
+    :param words: Strings.
+    :return: A frozenset of their canonical forms.
+    """
+    return frozenset(canonical(word) for word in words)
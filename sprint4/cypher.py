@@ -0,0 +1,341 @@
+"""
+cypher.py:
+A small abstract syntax tree for the Cypher queries that the translation methods build.
+
+File name: cypher.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+The translation methods used to build their queries by gluing strings together, with the values from the question
+(a letter, a species, a name...) written straight into the query. Every different value made a different query, so
+Neo4j had to plan each one from scratch. The translation methods now build a Query out of the pieces below instead.
+
+A Query is also a string: its text is the same "literal" query that the translation methods have always returned, so
+nothing that compares or prints them has to change. Query.parameterized() renders the same query with every value
+replaced by a $parameter, along with the map of parameters to send with it, so the database can reuse its plan. Every
+parameter of a query has its own name: when two values have the same name, the second is numbered, $value and $value2.
+
+Conditions can be joined with And, and HasLabels tests a node's labels in the WHERE clause; these are what
+rewrite.py uses to narrow the queries to the labels that have the properties they use.
+
+A query that returns every node it matches, with no bound, can be split into pages: Query.paginated() adds an ORDER BY
+on the node's id, which is a stable order, and a SKIP and LIMIT, which are parameters too, so every page shares a plan.
+
+Example:
+    >>> q = Query(Node("n"), where=Comparison("n", "name", "STARTS WITH", Value("J", quote="\\"")),
+    ...           returns=[Projection("n", "name", count=True)])
+    >>> q
+    'MATCH (n) WHERE n.name STARTS WITH "J" RETURN COUNT (n.name)'
+    >>> q.parameterized()
+    ('MATCH (n) WHERE n.name STARTS WITH $value RETURN COUNT (n.name)', {'value': 'J'})
+
+"""
+
+
+def _literal(value):
+    return value.literal()
+
+
+class Value():
+    """
+    A value taken from the user's question. It is written into the literal query in quotes, or sent as a parameter.
+
+    Attributes:
+        value (String): The value itself.
+        name (String): The name of the parameter, without the $.
+        quote (String): The quote character used when the value is written into the literal query.
+
+    """
+
+    def __init__(self, value, name="value", quote="'"):
+        self.value = value
+        self.name = name
+        self.quote = quote
+
+    def literal(self):
+        return self.quote + str(self.value) + self.quote
+
+    def parameter(self):
+        return "$" + self.name
+
+
+class Node():
+    """
+    A node pattern, such as (n), (n :Outlaw) or (n {species :'dog'}).
+
+    Attributes:
+        variable (String): The name the node is bound to.
+        labels (Tuple): The labels the node must have.
+        properties (Tuple(String, Value)): Property keys and the values they must be equal to.
+        padded (Boolean): Write the labels with the extra spaces used by the multiple labels query, "(n  :A :B )".
+
+    """
+
+    def __init__(self, variable, labels=(), properties=(), padded=False):
+        self.variable = variable
+        self.labels = tuple(labels)
+        self.properties = tuple(properties)
+        self.padded = padded
+
+    def variables(self):
+        return [self.variable]
+
+    def nodes(self):
+        return [self]
+
+    def render(self, value):
+        labels = "".join(" :" + label for label in self.labels)
+        if self.padded:
+            return "(" + self.variable + " " + labels + " )"
+        props = ""
+        if self.properties:
+            props = " {" + ", ".join(key + " :" + value(v) for key, v in self.properties) + "}"
+        return "(" + self.variable + labels + props + ")"
+
+
+class Path():
+    """
+    A directed relationship between two node patterns, such as (p) -[:parents] -> (n).
+
+    Attributes:
+        start (Node): The node the relationship comes from.
+        relationship (String): The type of the relationship.
+        end (Node): The node the relationship goes to.
+
+    """
+
+    def __init__(self, start, relationship, end):
+        self.start = start
+        self.relationship = relationship
+        self.end = end
+
+    def variables(self):
+        return [self.start.variable, self.end.variable]
+
+    def nodes(self):
+        return [self.start, self.end]
+
+    def render(self, value):
+        return self.start.render(value) + " -[:" + self.relationship + "] -> " + self.end.render(value)
+
+
+class Comparison():
+    """
+    A condition on one property of a node, such as n.name STARTS WITH "J" or n.species IS NULL.
+
+    Attributes:
+        variable (String): The node the property belongs to.
+        property (String): The property being tested.
+        operator (String): The Cypher operator, e.g. "STARTS WITH", "CONTAINS" or "IS NOT NULL".
+        value (Value): The value the property is compared to, or None for operators such as IS NULL.
+
+    """
+
+    def __init__(self, variable, property, operator, value=None):
+        self.variable = variable
+        self.property = property
+        self.operator = operator
+        self.value = value
+
+    def properties(self):
+        return [(self.variable, self.property)]
+
+    def conditions(self):
+        return [self]
+
+    def render(self, value):
+        text = self.variable + "." + self.property + " " + self.operator
+        if self.value is not None:
+            text += " " + value(self.value)
+        return text
+
+
+class Exists():
+    """
+    A condition that a node has a property at all, exists (n.species).
+    """
+
+    def __init__(self, variable, property):
+        self.variable = variable
+        self.property = property
+
+    def properties(self):
+        return [(self.variable, self.property)]
+
+    def conditions(self):
+        return [self]
+
+    def render(self, value):
+        return "exists (" + self.variable + "." + self.property + ")"
+
+
+class HasLabels():
+    """
+    A condition that a node has at least one of some labels, (n:Person OR n:Outlaw).
+    """
+
+    def __init__(self, variable, labels):
+        self.variable = variable
+        self.labels = tuple(labels)
+
+    def properties(self):
+        return []
+
+    def conditions(self):
+        return [self]
+
+    def render(self, value):
+        return "(" + " OR ".join(self.variable + ":" + label for label in self.labels) + ")"
+
+
+class And():
+    """
+    Two conditions that must both be true.
+    """
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def properties(self):
+        return self.left.properties() + self.right.properties()
+
+    def conditions(self):
+        return self.left.conditions() + self.right.conditions()
+
+    def render(self, value):
+        return self.left.render(value) + " AND " + self.right.render(value)
+
+
+class Projection():
+    """
+    One item of a RETURN clause: a whole node (n), one of its properties (n.name), or a count (COUNT (n.name)).
+    """
+
+    def __init__(self, variable, property=None, count=False):
+        self.variable = variable
+        self.property = property
+        self.count = count
+
+    def render(self):
+        text = self.variable if self.property is None else self.variable + "." + self.property
+        if self.count:
+            text = "COUNT (" + text + ")"
+        return text
+
+
+class Page():
+    """
+    One page of a query's results, ORDER BY id(n) SKIP 0 LIMIT 100.
+
+    Attributes:
+        variable (String): The node whose id the results are ordered by.
+        skip (Value): How many results come before the page.
+        limit (Value): How many results are on the page.
+
+    """
+
+    def __init__(self, variable, skip, limit):
+        self.variable = variable
+        self.skip = Value(skip, name="skip", quote="")
+        self.limit = Value(limit, name="limit", quote="")
+
+    def render(self, value):
+        return "ORDER BY id(" + self.variable + ") SKIP " + value(self.skip) + " LIMIT " + value(self.limit)
+
+
+class Query(str):
+    """
+    A MATCH ... [WHERE ...] RETURN ... [ORDER BY ... SKIP ... LIMIT ...] query. The string value of a Query is its
+    literal rendering.
+
+    Attributes:
+        pattern (Node or Path): The MATCH pattern.
+        where: The condition of the WHERE clause, or None.
+        returns (Tuple(Projection)): What the query returns.
+        whereKeyword (String): How the WHERE keyword is written; query 3 has always used "where".
+        page (Page): The page of the results that the query returns, or None for all of them.
+
+    """
+
+    def __new__(cls, pattern, where=None, returns=(), whereKeyword="WHERE", page=None):
+        self = str.__new__(cls, cls._render(pattern, where, returns, whereKeyword, page, _literal))
+        self.pattern = pattern
+        self.where = where
+        self.returns = tuple(returns)
+        self.whereKeyword = whereKeyword
+        self.page = page
+        return self
+
+    @staticmethod
+    def _render(pattern, where, returns, whereKeyword, page, value):
+        text = "MATCH " + pattern.render(value)
+        if where is not None:
+            text += " " + whereKeyword + " " + where.render(value)
+        text += " RETURN " + ", ".join(r.render() for r in returns)
+        if page is not None:
+            text += " " + page.render(value)
+        return text
+
+    def unbounded(self):
+        """
+        :return: True if the query returns a row for every match, with no limit; counts only ever return one row.
+        """
+        return self.page is None and not any(r.count for r in self.returns)
+
+    def paginated(self, skip, limit):
+        """
+        :param skip: How many results come before the page.
+        :param limit: How many results are on the page.
+        :return: The same query, but returning only one page of its results, in the order of the first returned
+            node's id.
+        """
+        return Query(self.pattern, self.where, self.returns, self.whereKeyword,
+                     Page(self.returns[0].variable, skip, limit))
+
+    def values(self):
+        """
+        :return: A list of every Value in the query, in the order they appear.
+        """
+        found = []
+        for node in self.pattern.nodes():
+            found.extend(v for key, v in node.properties)
+        if self.where is not None:
+            found.extend(c.value for c in self.where.conditions() if getattr(c, "value", None) is not None)
+        if self.page is not None:
+            found.extend([self.page.skip, self.page.limit])
+        return found
+
+    def literal(self):
+        """
+        :return: The query with every value written into it, exactly as the translation methods have always returned it.
+        """
+        return str(self)
+
+    def parameter_names(self):
+        """
+        :return: A dictionary from the id of every Value in the query to the name of its parameter. The first value
+            with a name keeps it, and the values after it with the same name are numbered: value, value2, value3.
+        """
+        names = {}
+        used = set()
+        for v in self.values():
+            name = v.name
+            number = 1
+            while name in used:
+                number += 1
+                name = v.name + str(number)
+            used.add(name)
+            names[id(v)] = name
+        return names
+
+    def parameterized(self):
+        """
+        :return: A tuple of the query with every value replaced by a $parameter, and the dictionary of parameters.
+        """
+        names = self.parameter_names()
+        text = self._render(self.pattern, self.where, self.returns, self.whereKeyword, self.page,
+                            lambda v: "$" + names[id(v)])
+        return text, dict((names[id(v)], v.value) for v in self.values())
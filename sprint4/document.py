@@ -0,0 +1,152 @@
+"""
+document.py:
+Translates a whole document of questions, one sentence at a time, as a stream.
+
+File name: document.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Tokenize treats everything it is given as one question, so pasting in several questions gives one tagMap with all of
+their words, and the wrong queries. Document mode splits the text into sentences first, in the same way as
+streamSentences() in sprint2/index.py (see sentences.py): the lines are read one at a time, and every sentence is given
+out as soon as it is known to be complete, so a document never has to be read into memory all at once.
+
+Each sentence is translated on its own, and several are translated at the same time, on a pool of threads that share
+the loaded tagger, WordNet and the schema's caches (a pool of processes would have to load them all again in each
+one). The results are still given out in the order of the sentences. Sentences are often repeated in a document (or
+across documents), so the queries for each sentence are kept in a cache, under the sentence's canonical form; a
+sentence that has been translated before, or that is being translated right now, isn't translated again. For example:
+
+    python document.py questions.txt --workers 4
+
+writes one JSON object per sentence: {"index": 0, "sentence": ..., "queries": [...], "cached": false, "error": null}.
+
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+try:
+    from sprint4 import resources
+    from sprint4.cache import LRUCache
+    from sprint4.canonical import canonical
+    from sprint4.schema import DEFAULT_SCHEMA
+    from sprint4.sentences import stream_sentences as split_lines
+except ImportError:  # run as a script from inside sprint4/
+    import resources
+    from cache import LRUCache
+    from canonical import canonical
+    from schema import DEFAULT_SCHEMA
+    from sentences import stream_sentences as split_lines
+
+"""The queries of the sentences that have been translated, shared by every document."""
+sentenceCache = LRUCache(maxSize=4096)
+
+
+def stream_sentences(lines, split=None):
+    """
+    :param lines: An iterable of lines, e.g. an open file.
+    :param split: The function that splits text into sentences; resources.sent_tokenize() unless another is given.
+    :return: A generator of the sentences, each given out as soon as it is complete (see sentences.py).
+    """
+    return split_lines(lines, split or resources.sent_tokenize)
+
+
+def translator(schemaId=DEFAULT_SCHEMA):
+    """
+    :param schemaId: The schema to translate against.
+    :return: A function that translates one sentence into the list of its queries.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+
+    def translate(sentence):
+        t = Tokenize(sentence, schemaId)
+        return list(t.runTranslator(t.wordsTagged))
+    return translate
+
+
+def translate_document(sentences, translate=None, workers=4, cache=sentenceCache, schemaId=DEFAULT_SCHEMA):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Translates sentences on a pool of threads, and gives out the results in order, each as soon as it and every
+    sentence before it have been translated. Only a few sentences more than there are workers are read ahead, so the
+    sentences can come from a stream.
+
+    :param sentences: An iterable of sentences, e.g. from stream_sentences().
+    :param translate: The function that translates a sentence into a list of queries; translator(schemaId) unless
+        another is given.
+    :param workers: How many sentences are translated at the same time.
+    :param cache: The LRUCache of the queries of sentences that have been translated, or None for no cache.
+    :param schemaId: The schema to translate against. It is part of the cache key.
+    :return: A generator of dictionaries with index, sentence, queries, cached (True if the queries came from the
+        cache, or from the same sentence earlier in the document) and error.
+    """
+    translate = translate or translator(schemaId)
+    pending = deque()
+    inFlight = {}
+
+    def result(index, sentence, key, future, cached):
+        try:
+            queries = future.result()
+            error = None
+            if cache is not None and not cached:
+                cache.put(key, queries)
+        except Exception as e:
+            queries = []
+            error = "%s: %s" % (type(e).__name__, e)
+        if inFlight.get(key) is future:
+            del inFlight[key]
+        return dict(index=index, sentence=sentence, queries=list(queries), cached=cached, error=error)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, sentence in enumerate(sentences):
+            key = (schemaId, canonical(" ".join(sentence.split())))
+            queries = cache.get(key) if cache is not None else None
+            if queries is not None:
+                future = Future()
+                future.set_result(queries)
+                pending.append((index, sentence, key, future, True))
+            elif key in inFlight:
+                pending.append((index, sentence, key, inFlight[key], True))
+            else:
+                inFlight[key] = pool.submit(translate, sentence)
+                pending.append((index, sentence, key, inFlight[key], False))
+            while pending and (len(pending) > workers * 2 or pending[0][3].done()):
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Translate every sentence of a document.")
+    parser.add_argument("document", nargs="?", help="the file to translate (default: standard input)")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    lines = open(args.document, encoding="utf-8") if args.document else sys.stdin
+    out = sys.stdout
+    try:
+        with redirect_stdout(sys.stderr):  # the translators print while debugging
+            for item in translate_document(stream_sentences(lines), workers=args.workers, schemaId=args.schema):
+                out.write(json.dumps(item) + "\n")
+                out.flush()
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+
+
+if __name__ == "__main__":
+    main()
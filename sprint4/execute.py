@@ -0,0 +1,322 @@
+"""
+execute.py:
+Runs the queries that Tokenize produces against a graph database.
+
+File name: execute.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Tokenize only ever produced Cypher; it never ran it. This module is the optional layer that does. An executor takes a
+query (a cypher.Query, or any Cypher string) and returns an iterator over the records, which are streamed as they
+arrive rather than collected first. There are two executors:
+
+    BoltExecutor    Talks to a real Neo4j database through the official "neo4j" driver, which is only imported
+                    when a BoltExecutor is created. The driver keeps a bounded pool of connections that are
+                    reused between queries.
+    LocalExecutor   A stand-in for a database, for tests and for running without Neo4j. It runs cypher.Query objects
+                    against a small in-memory graph, and answers any other Cypher from a table of canned responses.
+                    It hands out its connections from the same kind of bounded pool, so pooling and timeouts can be
+                    tested without a server.
+
+Example:
+    executor = BoltExecutor("bolt://localhost:7687", auth=("neo4j", "password"), maxPoolSize=10)
+    t = Tokenize("Who has a bounty?")
+    for queryId, query, records in t.execute(t.wordsTagged, executor):
+        for record in records:
+            print(queryId, record)
+
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+try:
+    from sprint4.cypher import And, Comparison, Exists, HasLabels, Path, Query
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from cypher import And, Comparison, Exists, HasLabels, Path, Query
+
+
+class ExecutionError(Exception):
+    """Raised when a query can't be run."""
+
+
+class PoolTimeout(ExecutionError):
+    """Raised when no connection became free in the pool before the acquire timeout ran out."""
+
+
+class QueryTimeout(ExecutionError):
+    """Raised when a query ran for longer than its timeout."""
+
+
+class ConnectionPool():
+    """
+    ConnectionPool hands out at most maxSize connections at a time, and reuses connections that have been given back
+    instead of opening new ones.
+
+    Attributes:
+        maxSize (int): The largest number of connections that can be open at once.
+        acquireTimeout (float): How many seconds acquire() waits for a free connection before giving up.
+        opened (int): How many connections the pool has opened so far.
+
+    """
+
+    def __init__(self, connect, maxSize=10, acquireTimeout=30.0):
+        self._connect = connect
+        self.maxSize = maxSize
+        self.acquireTimeout = acquireTimeout
+        self.opened = 0
+        self._idle = []
+        self._inUse = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """
+        Borrow a connection for the length of a with-block.
+
+        :param timeout: Seconds to wait for a free connection; defaults to acquireTimeout.
+        :return: A connection.
+        :raises PoolTimeout: If no connection became free in time.
+        """
+        connection = self._take(self.acquireTimeout if timeout is None else timeout)
+        try:
+            yield connection
+        finally:
+            with self._condition:
+                self._inUse -= 1
+                self._idle.append(connection)
+                self._condition.notify()
+
+    def _take(self, timeout):
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not self._idle and self._inUse >= self.maxSize:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout("No connection became free within %.1f seconds" % timeout)
+                self._condition.wait(remaining)
+            self._inUse += 1
+            if self._idle:
+                return self._idle.pop()
+            self.opened += 1
+        try:
+            return self._connect()
+        except Exception:
+            with self._condition:
+                self._inUse -= 1
+                self.opened -= 1
+                self._condition.notify()
+            raise
+
+    def stats(self):
+        """
+        :return: A dictionary with the size of the pool, and how many connections are opened, in use and idle.
+        """
+        with self._condition:
+            return dict(maxSize=self.maxSize, opened=self.opened, inUse=self._inUse, idle=len(self._idle))
+
+
+class Executor(ABC):
+    """
+    The interface every executor provides.
+    """
+
+    @abstractmethod
+    def run(self, query, params=None, timeout=None):
+        """
+        Run a query and stream its records.
+
+        :param query: A cypher.Query, or a string of Cypher.
+        :param params: The parameters for a string query. A cypher.Query carries its own.
+        :param timeout: The longest the query may run for, in seconds, or None for no limit.
+        :return: An iterator of records, each a dictionary from column name to value.
+        """
+
+    def close(self):
+        """Close every connection."""
+
+
+def _text_and_params(query, params):
+    if isinstance(query, Query):
+        return query.parameterized()
+    return query, dict(params or {})
+
+
+class BoltExecutor(Executor):
+    """
+    BoltExecutor runs queries on a Neo4j database, through a driver that keeps a bounded pool of reused connections.
+    The "neo4j" package is only needed once one of these is created.
+    """
+
+    def __init__(self, uri, auth=None, maxPoolSize=10, acquireTimeout=30.0, connectTimeout=5.0, queryTimeout=None):
+        """
+        :param uri: The address of the database, e.g. "bolt://localhost:7687".
+        :param auth: A (user, password) tuple.
+        :param maxPoolSize: The most connections the driver will open at once.
+        :param acquireTimeout: Seconds to wait for a free connection from the pool.
+        :param connectTimeout: Seconds to wait while opening a new connection.
+        :param queryTimeout: The default timeout for every query, in seconds, or None for no limit.
+        """
+        try:
+            import neo4j
+        except ImportError:
+            raise ExecutionError("The neo4j package is needed to run queries on a database: pip install neo4j")
+        self._neo4j = neo4j
+        self.queryTimeout = queryTimeout
+        self.driver = neo4j.GraphDatabase.driver(uri, auth=auth, max_connection_pool_size=maxPoolSize,
+                                                 connection_acquisition_timeout=acquireTimeout,
+                                                 connection_timeout=connectTimeout)
+
+    def run(self, query, params=None, timeout=None):
+        text, params = _text_and_params(query, params)
+        timeout = self.queryTimeout if timeout is None else timeout
+        with self.driver.session() as session:
+            result = session.run(self._neo4j.Query(text, timeout=timeout), params)
+            for record in result:
+                yield record.data()
+
+    def close(self):
+        self.driver.close()
+
+
+class LocalConnection():
+    """A connection handed out by a LocalExecutor. It only counts the queries that have been run on it."""
+
+    def __init__(self):
+        self.queries = 0
+
+
+class LocalExecutor(Executor):
+    """
+    LocalExecutor is an in-process stand-in for a Neo4j database.
+
+    cypher.Query objects are run against an in-memory graph of nodes and relationships. Any other query is looked up,
+    by its text, in a table of canned responses. Connections come from a bounded ConnectionPool, and each record is
+    produced only when it is asked for, the same as with a real database.
+
+    Attributes:
+        nodes [List]: Every node, as a dictionary with an "id", a set of "labels" and a dictionary of "properties".
+        relationships [List]: Every relationship, as a (start id, type, end id) tuple.
+        responses [Dictionary]: Maps the text of a Cypher query to the list of records it returns.
+        pool (ConnectionPool): The pool that connections are borrowed from.
+        delay (float): Seconds to wait before producing each record, to simulate a slow database.
+
+    """
+
+    def __init__(self, nodes=(), relationships=(), responses=None, maxPoolSize=10, acquireTimeout=30.0,
+                 queryTimeout=None, delay=0.0):
+        self.nodes = [dict(id=n.get("id", i), labels=set(n.get("labels", ())), properties=dict(n.get("properties", {})))
+                      for i, n in enumerate(nodes)]
+        self.relationships = list(relationships)
+        self.responses = dict(responses or {})
+        self.queryTimeout = queryTimeout
+        self.delay = delay
+        self.pool = ConnectionPool(LocalConnection, maxSize=maxPoolSize, acquireTimeout=acquireTimeout)
+
+    def run(self, query, params=None, timeout=None):
+        timeout = self.queryTimeout if timeout is None else timeout
+        with self.pool.acquire() as connection:
+            connection.queries += 1
+            started = time.monotonic()
+            if isinstance(query, Query):
+                names = query.parameter_names()
+                params = query.parameterized()[1]
+                records = self._evaluate(query, dict((key, params[name]) for key, name in names.items()))
+            elif query in self.responses:
+                records = iter(self.responses[query])
+            else:
+                raise ExecutionError("The local executor has no response for: " + query)
+            for record in records:
+                if self.delay:
+                    time.sleep(self.delay)
+                if timeout is not None and time.monotonic() - started > timeout:
+                    raise QueryTimeout("The query ran for longer than %.1f seconds" % timeout)
+                yield record
+
+    def _evaluate(self, query, params):
+        rows = self._match(query.pattern, params)
+        if query.where is not None:
+            rows = (row for row in rows if self._test(query.where, row, params))
+        names = [r.render() for r in query.returns]
+        if any(r.count for r in query.returns):
+            groups = {}
+            for row in rows:
+                values = [self._project(r, row) for r in query.returns]
+                key = tuple(repr(v) for v, r in zip(values, query.returns) if not r.count)
+                group = groups.setdefault(key, [values, [0] * len(values)])
+                for i, (value, r) in enumerate(zip(values, query.returns)):
+                    if r.count and value is not None:
+                        group[1][i] += 1
+            if not groups and all(r.count for r in query.returns):
+                groups[()] = [[None] * len(names), [0] * len(names)]
+            for values, counts in groups.values():
+                yield dict((name, counts[i] if r.count else values[i])
+                           for i, (name, r) in enumerate(zip(names, query.returns)))
+        else:
+            if query.page is not None:
+                rows = sorted(rows, key=lambda row: self._bound(query.page.variable, row)["id"])
+                skip, limit = params[id(query.page.skip)], params[id(query.page.limit)]
+                rows = rows[skip:skip + limit]
+            for row in rows:
+                yield dict((name, self._project(r, row)) for name, r in zip(names, query.returns))
+
+    def _match(self, pattern, params):
+        if isinstance(pattern, Path):
+            byId = dict((n["id"], n) for n in self.nodes)
+            for start, relType, end in self.relationships:
+                if relType == pattern.relationship and self._fits(pattern.start, byId[start], params) \
+                        and self._fits(pattern.end, byId[end], params):
+                    yield {pattern.start.variable: byId[start], pattern.end.variable: byId[end]}
+        else:
+            for node in self.nodes:
+                if self._fits(pattern, node, params):
+                    yield {pattern.variable: node}
+
+    def _fits(self, pattern, node, params):
+        if not set(pattern.labels) <= node["labels"]:
+            return False
+        for key, value in pattern.properties:
+            if node["properties"].get(key) != params[id(value)]:
+                return False
+        return True
+
+    def _test(self, condition, row, params):
+        if isinstance(condition, And):
+            return self._test(condition.left, row, params) and self._test(condition.right, row, params)
+        node = self._bound(condition.variable, row)
+        if isinstance(condition, HasLabels):
+            return any(label in node["labels"] for label in condition.labels)
+        actual = node["properties"].get(condition.property)
+        if isinstance(condition, Exists):
+            return actual is not None
+        if isinstance(condition, Comparison):
+            if condition.operator == "IS NULL":
+                return actual is None
+            if condition.operator == "IS NOT NULL":
+                return actual is not None
+            expected = params[id(condition.value)]
+            if not isinstance(actual, str):
+                return False
+            if condition.operator == "STARTS WITH":
+                return actual.startswith(expected)
+            if condition.operator == "ENDS WITH":
+                return actual.endswith(expected)
+            if condition.operator == "CONTAINS":
+                return expected in actual
+        raise ExecutionError("The local executor can't evaluate: " + condition.render(lambda v: v.literal()))
+
+    def _project(self, projection, row):
+        node = self._bound(projection.variable, row)
+        if projection.property is None:
+            return dict(node["properties"])
+        return node["properties"].get(projection.property)
+
+    def _bound(self, variable, row):
+        try:
+            return row[variable]
+        except KeyError:
+            raise ExecutionError("Variable `" + variable + "` not defined")
@@ -0,0 +1,134 @@
+"""
+fuzzy.py:
+Finds the schema term that a misspelled word was meant to be, using an index of deletes (the SymSpell method).
+
+File name: fuzzy.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+A misspelled schema word, such as "outlw", "bountey" or "speces", isn't a term and isn't in the lexicon, so the
+matcher used to compare it with every term using WordNet, which has never heard of it, and the question got no query.
+A FuzzyIndex holds every term of a schema (its labels, relationships and properties), and every string that can be
+made from a term by deleting up to two letters. Two words are within an edit distance of n of each other only if
+deleting at most n letters from each gives the same string, so to find the terms near a word, only the deletes of the
+word have to be looked up in the index, and then the few terms found are checked with the true edit distance (the
+optimal string alignment distance, which counts swapping two letters next to each other as one edit). That takes a
+few dictionary lookups, rather than a comparison with every term, and the index is built once, with the schema.
+
+Short words are too easily one letter away from a term they have nothing to do with, so how far a word may be from a
+term depends on its length:
+
+    4 letters or fewer      not corrected
+    5 to 7 letters          1 edit      "outlw" is Outlaw, "speces" is species
+    8 letters or more       2 edits     "dsilkies" is dislikes
+
+A word is only corrected if exactly one term is nearest to it.
+
+"""
+
+try:
+    from sprint4.canonical import canonical
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from canonical import canonical
+
+
+def max_distance(word):
+    """
+    :param word: A word.
+    :return: How many edits away from a term the word may be, for it to be corrected to that term.
+    """
+    if len(word) <= 4:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+def deletes(word, distance):
+    """
+    :param word: A word.
+    :param distance: The most letters to delete.
+    :return: The set of every string that can be made by deleting up to that many letters from the word, including the
+        word itself.
+    """
+    found = set([word])
+    edge = set([word])
+    for i in range(distance):
+        edge = set(w[:j] + w[j + 1:] for w in edge for j in range(len(w)))
+        found |= edge
+    return found
+
+
+def edit_distance(a, b):
+    """
+    :param a: A word.
+    :param b: Another word.
+    :return: The optimal string alignment distance between them: the number of insertions, deletions, substitutions
+        and swaps of two adjacent letters that turn one into the other.
+    """
+    previous = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, row = previous, row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before[j - 2] + 1)
+    return row[len(b)]
+
+
+class FuzzyIndex():
+    """
+    FuzzyIndex finds the term that a misspelled word is nearest to.
+
+    Attributes:
+        terms [Set]: The canonical form of every term in the index.
+
+    """
+
+    def __init__(self, terms, distance=2):
+        """
+        :param terms: The words to correct to, e.g. the labels, relationships and properties of a schema.
+        :param distance: The most edits that any word can be corrected by.
+        """
+        self.terms = frozenset(canonical(term) for term in terms)
+        self._deletes = {}
+        for term in self.terms:
+            for d in deletes(term, distance):
+                self._deletes.setdefault(d, set()).add(term)
+
+    def correct(self, word):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        :param word: A word from a question.
+        :return: The canonical form of the one term nearest to the word, if it is close enough (see max_distance()) and
+            no other term is as near; else None. A word that is a term itself isn't corrected, and gives None.
+        """
+        word = canonical(word)
+        distance = max_distance(word)
+        if distance == 0 or word in self.terms:
+            return None
+        candidates = set()
+        for d in deletes(word, distance):
+            candidates |= self._deletes.get(d, set())
+        best = None
+        ties = 0
+        for term in candidates:
+            if abs(len(term) - len(word)) > distance:
+                continue
+            edits = edit_distance(word, term)
+            if edits > distance:
+                continue
+            if best is None or edits < best[0]:
+                best, ties = (edits, term), 0
+            elif edits == best[0]:
+                ties += 1
+        if best is None or ties > 0:
+            return None
+        return best[1]
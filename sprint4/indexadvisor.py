@@ -0,0 +1,174 @@
+"""
+indexadvisor.py:
+Recommends the graph database indexes that would serve the most of the queries that the translators produce.
+
+File name: indexadvisor.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+The questions in a log are translated again, and the conditions of the queries that come out are read from their
+cypher.Query objects, the same ones that numberStartsWith(), numberNullOrNot() and listAllWithProperty() build:
+
+    inline property maps            (n {species :'dog'})                    a range index on :Animal(species)
+    exists() and IS NOT NULL        n.species IS NOT NULL                   a range index
+    STARTS WITH                     n.name STARTS WITH "J"                  a range index, which can seek a prefix
+    ENDS WITH and CONTAINS          n.name CONTAINS "J"                     a text index
+
+Neo4j can't use an index to find the nodes where a property IS NULL (a node without the property isn't in the index),
+so those conditions don't count towards any index.
+
+Indexes are on a label and a property, so a node without a label counts towards an index on each label that has the
+property (see rewrite.py, which adds those labels to the queries). Each recommendation says how many of the queries
+it would serve, and what share of all the queries that is; they are ranked by that. For example:
+
+    python indexadvisor.py
+    python indexadvisor.py --log workload.ndjson --top 5
+
+The log has one question per line, or one JSON object per line with a "question", like the output of
+"Tokenize.py --pipe" or the workload log (see workload.py). Without --log, the questions in the tests are used.
+
+"""
+
+import argparse
+import json
+import os
+from contextlib import redirect_stdout
+
+try:
+    from sprint4.cypher import Comparison, Exists, Query
+    from sprint4.loadgen import corpus_questions
+    from sprint4.schema import DEFAULT_SCHEMA, registry
+    from sprint4.workload import read_log
+except ImportError:  # run as a script from inside sprint4/
+    from cypher import Comparison, Exists, Query
+    from loadgen import corpus_questions
+    from schema import DEFAULT_SCHEMA, registry
+    from workload import read_log
+
+RANGE = "range"
+TEXT = "text"
+
+"""The kind of index that serves each operator. IS NULL isn't here, because no index can serve it."""
+INDEX_TYPES = {"=": RANGE, "exists": RANGE, "IS NOT NULL": RANGE, "STARTS WITH": RANGE, "ENDS WITH": TEXT,
+               "CONTAINS": TEXT}
+
+
+def log_questions(path):
+    """
+    :param path: A file with one question per line, or one JSON object with a "question" per line. A JSON line that
+        was only partly written is skipped, as read_log() does.
+    :return: The list of questions, in order, with repeats, since how often a question is asked is what counts.
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    if any(line.startswith("{") for line in lines):
+        return [entry.get("question") for entry in read_log(path)
+                if isinstance(entry, dict) and entry.get("question")]
+    return [line for line in lines if line]
+
+
+def index_uses(query, schema):
+    """
+    :param query: A cypher.Query.
+    :param schema: The Schema it was translated against.
+    :return: A list of (label, property, index type, operator) tuples, one for every index that could serve one of the
+        query's conditions. A condition that no index can serve, e.g. IS NULL, is left out.
+    """
+    conditions = []
+    for node in query.pattern.nodes():
+        conditions.extend((node, key, "=") for key, value in node.properties)
+    if query.where is not None:
+        nodes = dict((node.variable, node) for node in query.pattern.nodes())
+        for condition in query.where.conditions():
+            if isinstance(condition, (Comparison, Exists)) and condition.variable in nodes:
+                operator = condition.operator if isinstance(condition, Comparison) else "exists"
+                conditions.append((nodes[condition.variable], condition.property, operator))
+
+    uses = []
+    for node, prop, operator in conditions:
+        if operator not in INDEX_TYPES:
+            continue
+        labels = node.labels or schema.labelsByProperty.get(prop, ())
+        for label in labels:
+            uses.append((label, prop, INDEX_TYPES[operator], operator))
+    return uses
+
+
+def statement(label, prop, indexType):
+    """
+    :return: The Cypher that creates the index.
+    """
+    name = label.lower() + "_" + prop.lower() + ("_text" if indexType == TEXT else "")
+    kind = "TEXT INDEX" if indexType == TEXT else "INDEX"
+    return "CREATE %s %s IF NOT EXISTS FOR (n:%s) ON (n.%s)" % (kind, name, label, prop)
+
+
+def recommend(queries, schema):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param queries: The queries produced for the questions in the log; strings that aren't cypher.Query objects can't
+        be read, and only count towards the total.
+    :param schema: The Schema they were translated against.
+    :return: A list of recommendations, as dictionaries with label, property, type, statement, queries (how many
+        queries it would serve), share (of all the queries) and operators (how many times each operator used it),
+        with the ones that would serve the most queries first.
+    """
+    served = {}
+    operators = {}
+    for i, query in enumerate(queries):
+        if not isinstance(query, Query):
+            continue
+        for label, prop, indexType, operator in index_uses(query, schema):
+            key = (label, prop, indexType)
+            served.setdefault(key, set()).add(i)
+            counts = operators.setdefault(key, {})
+            counts[operator] = counts.get(operator, 0) + 1
+
+    recommendations = []
+    for key in sorted(served, key=lambda k: (-len(served[k]), k)):
+        label, prop, indexType = key
+        recommendations.append(dict(label=label, property=prop, type=indexType,
+                                    statement=statement(label, prop, indexType), queries=len(served[key]),
+                                    share=round(len(served[key]) / len(queries), 3), operators=operators[key]))
+    return recommendations
+
+
+def workload_queries(questions, schemaId=DEFAULT_SCHEMA):
+    """
+    :param questions: The questions from the log.
+    :param schemaId: The schema to translate them against.
+    :return: Every query that the translators produce for them, in order, leaving out the empty ones.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+    queries = []
+    for question in questions:
+        t = Tokenize(question, schemaId)
+        queries.extend(query for queryId, query in t.translate(t.wordsTagged) if query != "")
+    return queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recommend indexes for the queries the translators produce.")
+    parser.add_argument("--log", help="a file of questions, or of JSON lines with a question (default: the tests)")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA)
+    parser.add_argument("--top", type=int, help="how many recommendations to list (default: all)")
+    args = parser.parse_args(argv)
+
+    questions = log_questions(args.log) if args.log else corpus_questions()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # the translators print while debugging
+        queries = workload_queries(questions, args.schema)
+    recommendations = recommend(queries, registry.get(args.schema))
+    print(json.dumps(dict(questions=len(questions), queries=len(queries),
+                          recommendations=recommendations[:args.top] if args.top else recommendations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
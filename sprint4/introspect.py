@@ -0,0 +1,193 @@
+"""
+introspect.py:
+Loads a Schema from a graph database, in a few batched queries.
+
+File name: introspect.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+schema.outlaw_schema() lists the queries that would fill in the labelProperties and relationshipProperties from a real
+database, but run "in a loop for every label", which is one round trip and one scan of the graph for every label and
+relationship. The SchemaLoader asks for all of them at once instead:
+
+    procedures  db.schema.nodeTypeProperties() and db.schema.relTypeProperties() give every label and relationship
+                type with its property keys, in one query each, from the database's own statistics.
+    sampling    If the procedures aren't there (older versions of Neo4j, or no permission to call them), one query
+                looks at a sample of the nodes and collects their labels and keys, and one does the same for a sample
+                of the relationships. The sample has a limit, so that a huge graph isn't scanned from end to end.
+
+The relationships of a Schema are named the way the translators look for them, in lower case ("likes"), while the
+relationshipProperties keep the database's relationship types ("LIKES") as their keys, as in schema.outlaw_schema().
+
+The queries are run through an executor from execute.py, so the loader can be tested with a LocalExecutor. Loading
+the schema mustn't hold up translation, so load_in_background() loads it on another thread and registers it when it is
+ready; until then, questions are translated against the schema that was registered before. For example:
+
+    executor = BoltExecutor("bolt://localhost:7687", auth=("neo4j", "password"))
+    future = load_in_background(SchemaLoader(executor), "outlaw")
+
+"""
+
+import threading
+from concurrent.futures import Future
+
+try:
+    from sprint4.matcher import related_terms
+    from sprint4.schema import Schema, registry
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from matcher import related_terms
+    from schema import Schema, registry
+
+NODE_PROPERTIES = "CALL db.schema.nodeTypeProperties() YIELD nodeLabels, propertyName RETURN nodeLabels, propertyName"
+RELATIONSHIP_PROPERTIES = "CALL db.schema.relTypeProperties() YIELD relType, propertyName RETURN relType, propertyName"
+SAMPLED_NODES = ("MATCH (n) WITH n LIMIT $sample UNWIND labels(n) AS label "
+                 "RETURN label, collect(DISTINCT keys(n)) AS keys")
+SAMPLED_RELATIONSHIPS = ("MATCH ()-[r]->() WITH r LIMIT $sample "
+                         "RETURN type(r) AS type, collect(DISTINCT keys(r)) AS keys")
+
+
+def _add(properties, name, key):
+    """Adds a property key to a name, keeping the keys in the order they were first seen."""
+    keys = properties.setdefault(name, [])
+    if key is not None and key not in keys:
+        keys.append(key)
+
+
+def _relationships(relationshipProperties):
+    """The relationships of the schema: the relationship types, in lower case, without repeats."""
+    relationships = []
+    for relType in relationshipProperties:
+        if relType.lower() not in relationships:
+            relationships.append(relType.lower())
+    return relationships
+
+
+class SchemaLoader():
+    """
+    SchemaLoader reads the labels, relationship types and property keys of a graph database.
+
+    Attributes:
+        executor (Executor): The executor that the queries are run with.
+        sample (int): The most nodes, and the most relationships, that are looked at when sampling.
+        useProcedures (Boolean): Whether to try the db.schema procedures before sampling.
+        method (String): "procedures" or "sampling", whichever the last load() used.
+
+    """
+
+    def __init__(self, executor, sample=10000, useProcedures=True):
+        self.executor = executor
+        self.sample = sample
+        self.useProcedures = useProcedures
+        self.method = None
+
+    def properties(self):
+        """
+        :return: A tuple of two dictionaries: every label and every relationship type, each mapped to the list of its
+            property keys.
+        """
+        if self.useProcedures:
+            try:
+                result = self._from_procedures()
+                self.method = "procedures"
+                return result
+            except Exception:  # an ExecutionError, or the driver's error when the procedures don't exist
+                pass
+        result = self._from_sample()
+        self.method = "sampling"
+        return result
+
+    def load(self, name, similarity=None, **kwargs):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        :param name: The name to give the schema.
+        :param similarity: A function of (word, term) to find the terms that the schema's own words are related to
+            (see matcher.related_terms()), or None to leave them out.
+        :param kwargs: Passed on to Schema, e.g. synonyms.
+        :return: A Schema of the database.
+        """
+        labelProperties, relationshipProperties = self.properties()
+        args = (name, list(labelProperties), _relationships(relationshipProperties), labelProperties,
+                relationshipProperties)
+        schema = Schema(*args, **kwargs)
+        if similarity is not None:
+            schema = Schema(*args, **dict(kwargs, relatedTerms=related_terms(schema, similarity)))
+        return schema
+
+    def refresh(self, name, schemas=registry, similarity=None):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Reads the database again, and replaces a registered schema with one that keeps what hasn't changed (see
+        SchemaRegistry.refresh()).
+
+        :param name: The name of the registered schema.
+        :param schemas: The SchemaRegistry it is registered in.
+        :param similarity: A function of (word, term) to compute the similarity scores of the new terms, or None.
+        :return: What changed, as Schema.diff() gives it.
+        """
+        labelProperties, relationshipProperties = self.properties()
+        return schemas.refresh(name, list(labelProperties), _relationships(relationshipProperties), labelProperties,
+                               relationshipProperties, similarity)
+
+    def _from_procedures(self):
+        labelProperties = {}
+        for record in self.executor.run(NODE_PROPERTIES):
+            for label in record["nodeLabels"]:
+                _add(labelProperties, label, record["propertyName"])
+        relationshipProperties = {}
+        for record in self.executor.run(RELATIONSHIP_PROPERTIES):
+            relType = record["relType"]  # written as :`LIKES`
+            _add(relationshipProperties, relType.lstrip(":").strip("`"), record["propertyName"])
+        return labelProperties, relationshipProperties
+
+    def _from_sample(self):
+        labelProperties = {}
+        for record in self.executor.run(SAMPLED_NODES, dict(sample=self.sample)):
+            _add(labelProperties, record["label"], None)
+            for keys in record["keys"]:
+                for key in keys:
+                    _add(labelProperties, record["label"], key)
+        relationshipProperties = {}
+        for record in self.executor.run(SAMPLED_RELATIONSHIPS, dict(sample=self.sample)):
+            _add(relationshipProperties, record["type"], None)
+            for keys in record["keys"]:
+                for key in keys:
+                    _add(relationshipProperties, record["type"], key)
+        return labelProperties, relationshipProperties
+
+
+def load_in_background(loader, name, schemas=registry, **kwargs):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Loads a schema on another thread, and registers it once it has loaded, in place of any schema with the same name.
+    Questions that are translated in the meantime use the schema that was registered before.
+
+    :param loader: The SchemaLoader.
+    :param name: The name to register the schema under.
+    :param schemas: The SchemaRegistry to register it in.
+    :param kwargs: Passed on to Schema.
+    :return: A concurrent.futures.Future of the registered Schema. If loading fails, the future holds the exception,
+        and nothing is registered.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(schemas.register(loader.load(name, **kwargs)))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="schema-loader", daemon=True).start()
+    return future
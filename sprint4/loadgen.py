@@ -0,0 +1,225 @@
+"""
+loadgen.py:
+Replays a corpus of questions against the translator, and reports how it held up, as JSON.
+
+File name: loadgen.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+The corpus is every question in test_tokenize.py, unless another file (one question per line) is given. The questions
+are sent either to the translator in this process, or to a running service over HTTP, as a GET request with the
+question in the "question" parameter. For example:
+
+    python loadgen.py --concurrency 8 --requests 2000
+    python loadgen.py --url http://localhost:8000/translate --rate 50 --duration 30
+
+Without --rate, each of the --concurrency workers sends its next question as soon as it has an answer (a closed loop).
+With --rate, questions arrive at that many per second whether or not the earlier ones have been answered (an open loop),
+and the latency of each one is measured from when it should have been sent, so a backlog shows up in the latencies.
+
+The report has the number of requests and errors, the throughput, the 50th, 95th and 99th percentile latencies, and
+the hit rates of the caches (for the in-process translator only).
+
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+try:
+    from sprint4 import resources
+    from sprint4.schema import DEFAULT_SCHEMA, registry
+    from sprint4.translators import plugins
+except ImportError:  # run as a script from inside sprint4/
+    import resources
+    from schema import DEFAULT_SCHEMA, registry
+    from translators import plugins
+
+TEST_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_tokenize.py")
+
+
+def corpus_questions(path=TEST_CORPUS):
+    """
+    :param path: A file of unit tests, in which each question is assigned to a variable called "string".
+    :return: The list of questions, in the order they appear, without duplicates.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    questions = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "string" for t in node.targets):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+            if isinstance(value, str) and value not in questions:
+                questions.append(value)
+    return questions
+
+
+def file_questions(path):
+    """
+    :param path: A file with one question per line.
+    :return: The list of questions.
+    """
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def in_process(schemaId=DEFAULT_SCHEMA):
+    """
+    :param schemaId: The schema to translate against.
+    :return: A function that translates a question in this process.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+
+    def translate(question):
+        t = Tokenize(question, schemaId)
+        return t.runTranslator(t.wordsTagged)
+    return translate
+
+
+def over_http(url, timeout=30.0):
+    """
+    :param url: The URL of a running service.
+    :param timeout: How long to wait for each answer, in seconds.
+    :return: A function that sends a question to the service.
+    """
+    def translate(question):
+        separator = "&" if "?" in url else "?"
+        with urlopen(url + separator + urlencode(dict(question=question)), timeout=timeout) as response:
+            return response.read()
+    return translate
+
+
+def percentile(values, p):
+    """
+    :param values: A sorted list of numbers.
+    :param p: The percentile, from 0 to 100.
+    :return: The nearest-rank percentile, or None if there are no values.
+    """
+    if not values:
+        return None
+    rank = max(1, int(-(-p * len(values) // 100)))
+    return values[min(rank, len(values)) - 1]
+
+
+def run_load(questions, target, concurrency=4, rate=None, requests=None, duration=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Sends questions from the corpus, round robin, to a target, and measures every answer.
+
+    :param questions: The list of questions to replay.
+    :param target: A function that takes a question and answers it, e.g. in_process() or over_http().
+    :param concurrency: How many questions can be answered at the same time.
+    :param rate: How many questions arrive per second, or None to send them as fast as they are answered.
+    :param requests: How many questions to send in all. If neither this nor duration is given, the corpus is sent once.
+    :param duration: How long to keep sending questions for, in seconds.
+    :return: A dictionary with requests, errors, errorRate, seconds, throughput and the latency percentiles in ms.
+    """
+    if requests is None and duration is None:
+        requests = len(questions)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    started = time.perf_counter()
+
+    def send(i, due):
+        try:
+            target(questions[i % len(questions)])
+            failed = None
+        except Exception as e:
+            failed = "%s: %s" % (type(e).__name__, e)
+        finished = time.perf_counter()
+        with lock:
+            latencies.append(finished - due)
+            if failed is not None:
+                errors.append(failed)
+
+    def more(i):
+        if requests is not None and i >= requests:
+            return False
+        return duration is None or time.perf_counter() - started < duration
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if rate is None:
+            counter = iter(range(sys.maxsize))
+
+            def worker():
+                while True:
+                    with lock:
+                        i = next(counter)
+                    if not more(i):
+                        return
+                    send(i, time.perf_counter())
+            for w in range(concurrency):
+                pool.submit(worker)
+        else:
+            i = 0
+            while more(i):
+                due = started + i / rate
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(send, i, due)
+                i += 1
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    return dict(requests=len(latencies), errors=len(errors), errorRate=len(errors) / len(latencies) if latencies else 0.0,
+                firstErrors=errors[:5], seconds=round(seconds, 3),
+                throughput=round(len(latencies) / seconds, 3) if seconds > 0 else None, concurrency=concurrency,
+                rate=rate, latencyMs=dict(p50=percentile(ms, 50), p95=percentile(ms, 95), p99=percentile(ms, 99),
+                                          max=ms[-1] if ms else None))
+
+
+def cache_report(schemaId=DEFAULT_SCHEMA):
+    """
+    :param schemaId: The schema that was translated against.
+    :return: The statistics of the in-process caches, matcher tiers and translators.
+    """
+    schema = registry.get(schemaId)
+    return dict(similarity=schema.similarityCache.stats(), synsets=resources.cache_stats()["synsets"],
+                matcherTiers=schema.matcher.stats(), translators=plugins.stats())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a corpus of questions against the translator.")
+    parser.add_argument("--corpus", help="a file with one question per line (default: the questions in the tests)")
+    parser.add_argument("--url", help="the URL of a running service (default: translate in this process)")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, help="questions per second (default: as fast as they are answered)")
+    parser.add_argument("--requests", type=int)
+    parser.add_argument("--duration", type=float, help="seconds")
+    args = parser.parse_args(argv)
+
+    questions = file_questions(args.corpus) if args.corpus else corpus_questions()
+    target = over_http(args.url) if args.url else in_process(args.schema)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # the translators print while debugging
+        report = run_load(questions, target, args.concurrency, args.rate, args.requests, args.duration)
+    report["target"] = args.url or "in-process"
+    if not args.url:
+        report["caches"] = cache_report(args.schema)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
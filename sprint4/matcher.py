@@ -0,0 +1,261 @@
+"""
+matcher.py:
+Decides which schema labels and relationships a word from a question refers to, trying the cheapest ways first.
+
+File name: matcher.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+The translation methods used to compare every word of a question with every label and relationship using WordNet,
+before they even looked for a word that simply was a label. Most questions use the schema's own words ("outlaws",
+"bounty", "species"), so the SchemaMatcher goes through these tiers, and stops at the first one that can decide:
+
+    exact       The word is one of the schema's own terms, e.g. "outlaw" is the label Outlaw, and "parent" is the
+                relationship parents.
+    lexicon     The word is in the schema's lexicon: a synonym of a term ("someone" is a Person), one of the properties
+                of the labels, a word known not to refer to any term (the question words "who", "list", "how" and so
+                on), or a word whose similarity scores were precomputed in a bundle (see bundle.py).
+    fuzzy       The word is a misspelling of one of the schema's terms or properties, e.g. "outlw" is the label Outlaw,
+                and "bountey" is the property bounty, which isn't a label or relationship (see fuzzy.py). A word is
+                only taken to be a misspelling if WordNet doesn't know it: "county" is one letter from bounty, and
+                "lives" from likes, but they are words of their own.
+    wordnet     Only if none of those could decide is the word compared with every term using WordNet.
+    none        No tier could decide, and no similarity function was given, so the word matches nothing.
+
+A term, synonym or property is the schema's own vocabulary, but it can still be close enough to another term in WordNet
+to count as that term too, as the translation methods have always counted it: "female" is a property, but WordNet
+counts it as an Animal. related_terms() works these out when a schema or a bundle is built, and the schema keeps them
+(Schema.relatedTerms), so the exact and lexicon tiers never ask WordNet, and a question whose words they can all decide
+never loads it.
+
+Every Decision says which tier it came from, and the matcher counts how many decisions each tier made.
+
+"""
+
+import threading
+
+try:
+    from sprint4.canonical import canonical, canonical_set
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from canonical import canonical, canonical_set
+
+"""Above this similarity score, a word is taken to mean a schema term. This is the threshold the translators use."""
+SIMILARITY_THRESHOLD = 0.9
+
+"""
+Words that appear in questions all the time but never mean a label or relationship: the kept stop words (and the forms
+singularize() turns them into), and the words the translation methods look for.
+"""
+QUESTION_WORDS = frozenset(["how", "all", "with", "have", "has", "ha", "who", "are", "and", "is", "i", "each", "than",
+                            "what", "which", "whos", "every", "list", "return", "number", "many", "show", "give",
+                            "start", "starting", "begin", "beginning", "first", "front", "end", "ending", "last",
+                            "back", "contain", "position", "known", "unknown", "letter", "named"])
+
+EXACT = "exact"
+LEXICON = "lexicon"
+FUZZY = "fuzzy"
+WORDNET = "wordnet"
+NONE = "none"
+
+
+class Decision():
+    """
+    Which schema terms a word refers to, and which tier of the matcher decided it.
+
+    Attributes:
+        word (String): The word from the question.
+        terms (Tuple): The terms (labels or relationships) that the word refers to. Often empty.
+        tier (String): EXACT, LEXICON, FUZZY, WORDNET or NONE.
+
+    """
+
+    def __init__(self, word, terms, tier):
+        self.word = word
+        self.terms = tuple(terms)
+        self.tier = tier
+
+    def __repr__(self):
+        return "Decision(%r, %r, %r)" % (self.word, self.terms, self.tier)
+
+
+def related_terms(schema, similarity, previous=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Works out which other terms each word of a schema's own vocabulary is close enough to, to count as that term as
+    well. This asks WordNet about every pair of word and term, so it is done when a schema or a bundle is built, not
+    while a question is being translated.
+
+    :param schema: The Schema.
+    :param similarity: A function of (word, term) that computes a similarity score, e.g. Tokenize.similarity_score.
+    :param previous: An older Schema of the same database, or None. The words that were in its vocabulary are only
+        compared with the terms that are new, and the schema's relatedTerms are taken as right for the old terms.
+    :return: A dictionary from the words that are related to any other term to the lists of those terms.
+    """
+    terms = schema.labels + schema.relationships
+    oldWords = previous.matcher.vocabulary() if previous is not None else frozenset()
+    oldTerms = set(previous.labels + previous.relationships) if previous is not None else set()
+    related = {}
+    for form in sorted(schema.matcher.vocabulary()):
+        declared = schema.matcher._declared(form)
+        found = list(schema.relatedTerms.get(form, ())) if form in oldWords else []
+        for t in terms:
+            if t in declared or t in found or (form in oldWords and t in oldTerms):
+                continue
+            if similarity(form, t) > SIMILARITY_THRESHOLD:
+                found.append(t)
+        if found:
+            related[form] = [t for t in terms if t in found]
+    return related
+
+
+class SchemaMatcher():
+    """
+    SchemaMatcher matches words against the labels and relationships of one schema.
+
+    Attributes:
+        schema (Schema): The schema whose terms are matched.
+        tierCounts [Dictionary]: How many decisions each tier has made.
+
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.tierCounts = {EXACT: 0, LEXICON: 0, FUZZY: 0, WORDNET: 0, NONE: 0}
+        self._lock = threading.Lock()
+        self._properties = canonical_set(schema.properties)
+
+        self._exact = {}
+        for label in schema.labels:
+            self._exact.setdefault(canonical(label), set()).add(label)
+        for rel in schema.relationships:
+            plural = canonical(rel)
+            for form in (plural, canonical(plural[:-1]) if plural.endswith("s") else plural):
+                self._exact.setdefault(form, set()).add(rel)
+
+        """Every word of the vocabulary, with the terms it is declared to mean and the ones it is related to."""
+        self._related = dict((form, frozenset(self._declared(form)) | frozenset(schema.relatedTerms.get(form, ())))
+                             for form in set(self._exact) | set(schema.synonyms) | self._properties)
+
+    def vocabulary(self):
+        """
+        :return: The canonical form of every word of the schema's own vocabulary: its terms, the singular forms of its
+            relationships, its synonyms and its properties.
+        """
+        return frozenset(self._related)
+
+    def labels(self, word, similarity, known=None):
+        """
+        :param word: A word from the question.
+        :param similarity: The function used for the WordNet tier, e.g. Tokenize.similarity_score.
+        :param known: The function used for the fuzzy tier; see correct().
+        :return: A Decision with the labels that the word refers to.
+        """
+        return self._decide(word, self.schema.labels, similarity, known)
+
+    def relationships(self, word, similarity, known=None):
+        """
+        :param word: A word from the question.
+        :param similarity: The function used for the WordNet tier, e.g. Tokenize.similarity_score.
+        :param known: The function used for the fuzzy tier; see correct().
+        :return: A Decision with the relationships that the word refers to.
+        """
+        return self._decide(word, self.schema.relationships, similarity, known)
+
+    def count(self, tagMap, terms, similarity, known=None):
+        """
+        Counts the pairs of (word, term) that match. This is what the translation methods used to count by comparing
+        every word with every term using WordNet.
+
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param terms: Either "labels" or "relationships".
+        :param similarity: The function used for the WordNet tier, or None to leave out the WordNet tier; words that
+            the other tiers can't decide then match nothing.
+        :param known: The function used for the fuzzy tier; see correct().
+        :return: The number of matching (word, term) pairs.
+        """
+        decide = self.labels if terms == "labels" else self.relationships
+        return sum(len(decide(tm[0], similarity, known).terms) for tm in tagMap)
+
+    def correct(self, word, known):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Finds the term or property that a misspelled word was meant to be. The schema's own vocabulary, the question
+        words and the schema's other non-terms are never corrected, and neither is a word that WordNet knows, however
+        near it is to a term. WordNet is only asked about the few words that are near a term.
+
+        :param word: A word from the question.
+        :param known: A function of a word that says whether WordNet knows it, e.g. Tokenize.known_word, or None, in
+            which case nothing is corrected.
+        :return: The canonical form of the term or property, or None if the word isn't taken to be a misspelling.
+        """
+        form = canonical(word)
+        if known is None or form in self._related or form in self.schema.nonTerms or form in QUESTION_WORDS:
+            return None
+        correction = self.schema.fuzzy.correct(form)
+        if correction is None or known(form):
+            return None
+        return correction
+
+    def _declared(self, form):
+        """
+        :param form: The canonical form of a word.
+        :return: The terms that the schema itself says the word means (a set, empty for a property), or None if the
+            word isn't a term, a synonym or a property.
+        """
+        if form in self._exact:
+            return self._exact[form]
+        if form in self.schema.synonyms:
+            return set(self.schema.synonyms[form])
+        if form in self._properties:
+            return set()
+        return None
+
+    def _vocabulary(self, word, form, terms, tier):
+        """
+        Decides a word of the schema's own vocabulary: the terms it is declared to mean, and the ones it is related to.
+        """
+        related = self._related.get(form, frozenset())
+        return self._record(Decision(word, [t for t in terms if t in related], tier))
+
+    def _decide(self, word, terms, similarity, known):
+        form = canonical(word)
+        if form in self._exact:
+            return self._vocabulary(word, form, terms, EXACT)
+        if form in self._related:
+            return self._vocabulary(word, form, terms, LEXICON)
+        if form in self.schema.nonTerms or not any(c.isalpha() for c in form):
+            return self._record(Decision(word, [], LEXICON))
+        table = self.schema.similarityTable
+        if table:
+            scores = [table.get((word, t)) for t in terms]
+            if None not in scores:
+                return self._record(Decision(word, [t for t, s in zip(terms, scores) if s > SIMILARITY_THRESHOLD],
+                                             LEXICON))
+
+        correction = self.correct(form, known)
+        if correction is not None:
+            return self._vocabulary(word, correction, terms, FUZZY)
+
+        if similarity is None:
+            return self._record(Decision(word, [], NONE))
+        return self._record(Decision(word, [t for t in terms if similarity(word, t) > SIMILARITY_THRESHOLD], WORDNET))
+
+    def _record(self, decision):
+        with self._lock:
+            self.tierCounts[decision.tier] += 1
+        return decision
+
+    def stats(self):
+        """
+        :return: A copy of tierCounts.
+        """
+        with self._lock:
+            return dict(self.tierCounts)
@@ -0,0 +1,179 @@
+"""
+memreport.py:
+Reports how much memory each resource and each stage of the translation pipeline takes, using tracemalloc.
+
+File name: memreport.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+A snapshot is taken before and after each step, and the report has, for each step, the memory it left allocated (net),
+the most it had allocated at once while it ran (peak, on Python 3.9 and later), and the lines of code that left the most
+allocated. The steps are:
+
+    resources   Loading the stop words, the tagger, the sentence tokenizer and WordNet, one at a time.
+    pipeline    For every question in the corpus: word_tokenize, pos_tag, the whole of Tokenize(), and each translator.
+                These are added up over the corpus, per step.
+    caches      What the similarity and synset caches are holding once the corpus has been translated.
+
+For example:
+
+    python memreport.py
+    python memreport.py --corpus questions.txt --top 5
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+
+try:
+    from sprint4 import resources
+    from sprint4.loadgen import corpus_questions, file_questions
+    from sprint4.schema import DEFAULT_SCHEMA, registry
+except ImportError:  # run as a script from inside sprint4/
+    import resources
+    from loadgen import corpus_questions, file_questions
+    from schema import DEFAULT_SCHEMA, registry
+
+
+def measure(stage, function, *args, top=3):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Runs a function between two tracemalloc snapshots. tracemalloc has to be tracing already.
+
+    :param stage: The name of the step, for the report.
+    :param function: The function to run.
+    :param args: The arguments to run it with.
+    :param top: How many of the lines that allocated the most to list.
+    :return: A tuple of what the function returned, and a dictionary with stage, netKB, peakKB, blocks and top.
+    """
+    before = tracemalloc.take_snapshot()
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]  # the peak is traced for the whole process, so it starts from here
+    result = function(*args)
+    peak = tracemalloc.get_traced_memory()[1] - start if hasattr(tracemalloc, "reset_peak") else None
+    after = tracemalloc.take_snapshot()
+
+    diff = [d for d in after.compare_to(before, "lineno") if d.size_diff != 0]
+    diff.sort(key=lambda d: d.size_diff, reverse=True)
+    entry = dict(stage=stage, netKB=round(sum(d.size_diff for d in diff) / 1024, 1),
+                 peakKB=round(peak / 1024, 1) if peak is not None else None,
+                 blocks=sum(d.count_diff for d in diff),
+                 top=["%s: %.1f KB" % (d.traceback, d.size_diff / 1024) for d in diff[:top]])
+    return result, entry
+
+
+def add(total, entry):
+    """Adds up the entries of one step over every question of the corpus."""
+    if total is None:
+        return dict(entry, count=1)
+    total["netKB"] = round(total["netKB"] + entry["netKB"], 1)
+    if entry["peakKB"] is not None:
+        total["peakKB"] = max(total["peakKB"], entry["peakKB"])
+    total["blocks"] += entry["blocks"]
+    total["count"] += 1
+    return total
+
+
+def resource_report(top=3):
+    """
+    :param top: How many lines to list for each step.
+    :return: A list of entries, one for each resource as it is loaded.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+    steps = [("stop words", resources.stop_words, Tokenize.keptStopWords),
+             ("tagger", resources.tagger),
+             ("sentence tokenizer", resources.sent_tokenize, "Load the tokenizer. It is Punkt."),
+             ("wordnet", resources.synsets, "outlaw")]
+    return [measure(step[0], step[1], *step[2:], top=top)[1] for step in steps]
+
+
+def pipeline_report(questions, schemaId=DEFAULT_SCHEMA, top=3):
+    """
+    :param questions: The questions to translate.
+    :param schemaId: The schema to translate against.
+    :param top: How many lines to list for each step.
+    :return: A list of entries, one for each step of the pipeline, added up over the questions.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+    totals = {}
+    order = []
+
+    def record(entry):
+        if entry["stage"] not in totals:
+            order.append(entry["stage"])
+        totals[entry["stage"]] = add(totals.get(entry["stage"]), entry)
+
+    for question in questions:
+        words, entry = measure("word_tokenize", resources.word_tokenize, question.lower(), top=top)
+        record(entry)
+        record(measure("pos_tag", resources.pos_tag, words, top=top)[1])
+        t, entry = measure("Tokenize", Tokenize, question, schemaId, top=top)
+        record(entry)
+        tagMap = tuple(t.wordsTagged)
+        for translator in t.translators.enabled():
+            if translator.applies(t, tagMap):
+                record(measure("translator " + translator.name, translator.run, t, tagMap, top=top)[1])
+    return [totals[stage] for stage in order]
+
+
+def cache_report(schemaId=DEFAULT_SCHEMA):
+    """
+    :param schemaId: The schema that was translated against.
+    :return: The number of entries in each cache, and roughly how much memory they hold.
+    """
+    schema = registry.get(schemaId)
+    similarity = schema.similarityCache
+    synsets = resources.caches()["synsets"]
+    return dict(similarity=dict(similarity.stats(), approxKB=round(_deep_size(similarity) / 1024, 1)),
+                synsets=dict(synsets.stats(), approxKB=round(_deep_size(synsets) / 1024, 1)))
+
+
+def _deep_size(cache):
+    """The size of the keys and values of an LRUCache; synsets are shared with WordNet, so only the tuples count."""
+    size = 0
+    for key, value in cache.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+        if isinstance(key, tuple):
+            size += sum(sys.getsizeof(k) for k in key)
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report memory use by resource and pipeline stage.")
+    parser.add_argument("--corpus", help="a file with one question per line (default: the questions in the tests)")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA)
+    parser.add_argument("--top", type=int, default=3, help="how many lines of code to list for each step")
+    args = parser.parse_args(argv)
+
+    questions = file_questions(args.corpus) if args.corpus else corpus_questions()
+    tracemalloc.start()
+    try:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # the translators print while debugging
+            report = dict(resources=resource_report(args.top),
+                          pipeline=pipeline_report(questions, args.schema, args.top),
+                          caches=cache_report(args.schema), questions=len(questions))
+        current, peak = tracemalloc.get_traced_memory()
+        report["tracedKB"] = dict(current=round(current / 1024, 1), peak=round(peak / 1024, 1))
+    finally:
+        tracemalloc.stop()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
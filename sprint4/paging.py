@@ -0,0 +1,67 @@
+"""
+paging.py:
+Continuation tokens, which ask for the next page of a paginated query.
+
+File name: paging.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Queries such as "MATCH (n) where exists (n.species) RETURN n" return every node they match, which on a large graph is
+far more than a web page can show. When runTranslator() is given a pageSize, each of those queries only returns its
+first page (see cypher.Query.paginated()), and comes with a continuation token. Tokenize.next_page() takes the token,
+and returns the query for the next page, with the token for the page after that. There are no more pages once a page
+comes back with fewer than pageSize results.
+
+A token holds everything needed to build its page again: the schema, the translator, the tagged words of the question,
+whether the query was narrowed to labels (see rewrite.py), the page size and the page number. It is URL-safe base64 of
+JSON, so it can be passed around in a link; nothing is kept on the server between pages.
+
+"""
+
+import base64
+import binascii
+import json
+
+"""The number of results on a page, when no other size is given."""
+PAGE_SIZE = 100
+
+
+class InvalidToken(ValueError):
+    """Raised when a continuation token can't be read, or doesn't belong to the schema or translators it's used with."""
+
+
+def encode_token(schemaId, translator, tagMap, pageSize, page, narrow=False):
+    """
+    :param schemaId: The name of the schema the question was translated against.
+    :param translator: The name of the translator that gave the query.
+    :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+    :param pageSize: The number of results on a page.
+    :param page: The number of the page the token asks for; the first page is 0.
+    :param narrow: Whether the query was narrowed to the labels that have its properties.
+    :return: The continuation token, as a string.
+    """
+    state = dict(schema=schemaId, translator=translator, tagMap=[list(tm) for tm in tagMap], pageSize=pageSize,
+                 page=page, narrow=narrow)
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_token(token):
+    """
+    :param token: A continuation token from encode_token().
+    :return: A dictionary with schema, translator, tagMap (as a tuple of tuples), pageSize, page and narrow.
+    :raises InvalidToken: If the token can't be read.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+        state["tagMap"] = tuple((word, tag) for word, tag in state["tagMap"])
+        if not isinstance(state["schema"], str) or not isinstance(state["translator"], str):
+            raise ValueError("No schema or translator")
+        if not isinstance(state["pageSize"], int) or not isinstance(state["page"], int) \
+                or state["pageSize"] < 1 or state["page"] < 0:
+            raise ValueError("No page")
+        state["narrow"] = state.get("narrow") is True
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidToken("Invalid continuation token")
+    return state
@@ -0,0 +1,231 @@
+"""
+resources.py:
+The NLTK resources that every Tokenize object needs, loaded once per process and shared between all schemas.
+
+File name: resources.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+nltk.pos_tag() builds a brand new PerceptronTagger, unpickling the whole model, on every single call, and the stop
+words were being read from the corpus at import time. Everything in here is loaded lazily, the first time it is asked
+for, and then kept for the life of the process. These resources are read-only, so they are safe to share between
+schemas; anything that is specific to a schema (similarity scores and so on) lives on the Schema object instead.
+
+If a bundle is in use (see bundle.py), the stop words, the tagger and the sentence tokenizer all come from the bundle
+instead of nltk_data. A bundle is used if use_bundle() has been called, or if the NL2CQ_BUNDLE environment variable is
+set to the path of one when this module is imported. In the same way, a tagger trained by tagger.py is used instead of
+the perceptron tagger if use_tagger() has been called, or if NL2CQ_TAGGER is set to the path of one.
+
+"""
+
+import os
+import threading
+import weakref
+
+import nltk
+from nltk.tokenize import NLTKWordTokenizer
+
+try:
+    from sprint4.bundle import Bundle
+    from sprint4.cache import LRUCache
+    from sprint4.schema import registry
+    from sprint4.tagger import SchemaTagger, load_tagger
+    from sprint4.tokenizer import fast_tokenize
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from bundle import Bundle
+    from cache import LRUCache
+    from schema import registry
+    from tagger import SchemaTagger, load_tagger
+    from tokenizer import fast_tokenize
+
+_lock = threading.RLock()
+_bundle = None
+_stopWords = {}
+_tagger = None
+_customTagger = None
+_schemaTaggers = weakref.WeakKeyDictionary()
+_synsets = LRUCache(maxSize=16384)
+_wordTokenizer = NLTKWordTokenizer()
+
+
+def use_bundle(path, schemas=registry):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Maps a bundle built by bundle.py, and uses it for every resource from now on. The bundle's schemas, with their
+    precomputed similarity tables, are registered in the schema registry, replacing any with the same names.
+
+    :param path: The path of the bundle file.
+    :param schemas: The SchemaRegistry to register the bundle's schemas in.
+    :return: The Bundle.
+    """
+    global _bundle, _tagger
+    bundle = Bundle(path)
+    with _lock:
+        _bundle = bundle
+        _tagger = None
+        _schemaTaggers.clear()
+        _stopWords.clear()
+        for schema in bundle.schemas():
+            schemas.register(schema)
+    return bundle
+
+
+def use_tagger(tagger):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Uses another part of speech tagger from now on, e.g. a fast tagger trained by tagger.py.
+
+    :param tagger: Any object with a tag() method like nltk's taggers, or None to go back to the perceptron tagger.
+    :return: nothing
+    """
+    global _customTagger
+    with _lock:
+        _customTagger = tagger
+        _schemaTaggers.clear()
+
+
+def stop_words(keptStopWords=()):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Returns the NLTK English stop words, minus the words that we want to keep. The corpus is only read once.
+
+    :param keptStopWords: Words that should not be treated as stop words.
+    :return: A frozenset of stop words.
+    """
+    key = frozenset(keptStopWords)
+    words = _stopWords.get(key)
+    if words is None:
+        with _lock:
+            words = _stopWords.get(key)
+            if words is None:
+                if _bundle is not None and key == frozenset(_bundle.meta["keptStopWords"]):
+                    words = _bundle.stop_words()
+                else:
+                    from nltk.corpus import stopwords
+                    words = frozenset(stopwords.words('english')) - key
+                _stopWords[key] = words
+    return words
+
+
+def tagger():
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Returns the shared part of speech tagger, building it the first time it is needed.
+
+    :return: An nltk PerceptronTagger, or the tagger given to use_tagger().
+    """
+    global _tagger
+    if _customTagger is not None:
+        return _customTagger
+    if _tagger is None:
+        with _lock:
+            if _tagger is None:
+                _tagger = _bundle.tagger() if _bundle is not None else nltk.tag.PerceptronTagger()
+    return _tagger
+
+
+def word_tokenize(text):
+    """
+    This does the same thing as nltk.word_tokenize(). Questions of the usual shapes are split by the fast tokenizer
+    (see tokenizer.py), which gives the same words; the rest go to nltk, using the bundle's sentence tokenizer if there
+    is one.
+
+    :param text: The text to split into words.
+    :return: A list of words.
+    """
+    words = fast_tokenize(text)
+    if words is not None:
+        return words
+    if _bundle is None:
+        return nltk.word_tokenize(text)
+    sentences = _bundle.sentence_tokenizer().tokenize(text)
+    return [token for sentence in sentences for token in _wordTokenizer.tokenize(sentence)]
+
+
+def sent_tokenize(text):
+    """
+    This does the same thing as nltk.sent_tokenize(), using the bundle's sentence tokenizer if there is one.
+
+    :param text: The text to split into sentences.
+    :return: A list of sentences.
+    """
+    if _bundle is None:
+        return nltk.sent_tokenize(text)
+    return _bundle.sentence_tokenizer().tokenize(text)
+
+
+def schema_tagger(schema):
+    """
+    :param schema: A Schema.
+    :return: The shared tagger, wrapped in a SchemaTagger for that schema (see tagger.py). One is kept per schema.
+    """
+    wrapped = _schemaTaggers.get(schema)
+    if wrapped is None:
+        with _lock:
+            wrapped = _schemaTaggers.get(schema)
+            if wrapped is None:
+                wrapped = _schemaTaggers[schema] = SchemaTagger(tagger(), schema)
+    return wrapped
+
+
+def pos_tag(words, schema=None):
+    """
+    This does the same thing as nltk.pos_tag(), but with the shared tagger instead of a new one every call.
+
+    :param words: A list of words.
+    :param schema: If given, the labels and properties of this schema are always tagged as nouns.
+    :return: A list of tuples consisting of words and their Stanford CoreNLP tags.
+    """
+    if schema is not None:
+        return schema_tagger(schema).tag(words)
+    return tagger().tag(words)
+
+
+def synsets(word):
+    """
+    Returns the WordNet synsets of a word. The lookups are cached because the same schema words are looked up over
+    and over again by the translators.
+
+    :param word: The word to look up.
+    :return: A tuple of WordNet synsets.
+    """
+    result = _synsets.get(word)
+    if result is None:
+        from nltk.corpus import wordnet as wn
+        result = tuple(wn.synsets(word))
+        _synsets.put(word, result)
+    return result
+
+
+def caches():
+    """
+    :return: A dictionary from the name of each shared cache to the LRUCache.
+    """
+    return dict(synsets=_synsets)
+
+
+def cache_stats():
+    """
+    :return: A dictionary from the name of each shared cache to its LRUCache statistics.
+    """
+    return dict((name, cache.stats()) for name, cache in caches().items())
+
+
+if os.environ.get("NL2CQ_BUNDLE"):
+    use_bundle(os.environ["NL2CQ_BUNDLE"])
+if os.environ.get("NL2CQ_TAGGER"):
+    use_tagger(load_tagger(os.environ["NL2CQ_TAGGER"]))
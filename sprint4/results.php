@@ -19,10 +19,37 @@ error_reporting(E_ALL);
 
             $question = $_GET["question"];
 
-            $result = shell_exec("python Tokenize.py ". $question ." 2>&1");
+            /* If stream.py is running, the queries are streamed to the page as each one is ready (see stream.py);
+               otherwise Tokenize.py is run, and the page waits for all of them. */
+            $streamUrl = getenv("NL2CQ_STREAM_URL");
+            $result = $streamUrl ? "" : shell_exec("python Tokenize.py ". $question ." 2>&1");
             ?>
             <h1 id="resultHeader">The Cypher Query:</h1>
             <h2 id="output"><?=$result?></h2>
+            <?php if ($streamUrl) { ?>
+            <script>
+                var output = document.getElementById("output");
+                var source = new EventSource(<?=json_encode($streamUrl)?> + "?question="
+                                             + encodeURIComponent(<?=json_encode($question)?>));
+                source.addEventListener("query", function (e) {
+                    var data = JSON.parse(e.data);
+                    output.appendChild(document.createTextNode(data.queryId + ": " + data.query));
+                    output.appendChild(document.createElement("br"));
+                });
+                source.addEventListener("done", function (e) {
+                    source.close();
+                    if (JSON.parse(e.data).partial) {
+                        output.appendChild(document.createTextNode("(Some translations ran out of time.)"));
+                    }
+                });
+                source.addEventListener("error", function (e) {
+                    source.close();
+                    if (e.data) {
+                        output.appendChild(document.createTextNode(JSON.parse(e.data).error));
+                    }
+                });
+            </script>
+            <?php } ?>
         
             <a href="index.php" class="largeButton">Ask another Question</a>
         </main>
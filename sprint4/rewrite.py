@@ -0,0 +1,99 @@
+"""
+rewrite.py:
+Rewrites the queries that the translation methods build so that the database can use its label and property indexes.
+
+File name: rewrite.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Most of the translation methods match (n) without a label, e.g. numberStartsWith() gives
+MATCH (n) WHERE n.name STARTS WITH "J", and listAllWithProperty() gives MATCH (n {species :'dog'}). Without a label the
+database has to scan every node, because its indexes are on a label and a property. But the schema knows which labels
+have each property: species is only ever on an Animal. narrow_labels() adds those labels to the query:
+
+    MATCH (n {species :'dog'}) RETURN n
+        becomes MATCH (n :Animal {species :'dog'}) RETURN n
+    MATCH (n) WHERE n.bounty IS NOT NULL RETURN COUNT (n.bounty)
+        becomes MATCH (n) WHERE (n:Person OR n:Outlaw) AND n.bounty IS NOT NULL RETURN COUNT (n.bounty)
+
+When more than one label has the property, they are tested in the WHERE clause rather than written as a UNION of one
+query per label, because a UNION would count a node with two of the labels twice, or drop rows that happen to be the
+same. Only the properties that a node must have for the query to match it are used; n.species IS NULL and RETURN
+n.name don't say anything about the node's labels. A node is left as it is if it already has a label, if a property it
+must have isn't on any label (the schema may not know it), or if every label has the property, since then nothing is
+narrowed.
+
+"""
+
+try:
+    from sprint4.cypher import And, Comparison, Exists, HasLabels, Node, Path, Query
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from cypher import And, Comparison, Exists, HasLabels, Node, Path, Query
+
+
+def required_properties(query, variable):
+    """
+    :param query: A cypher.Query.
+    :param variable: The variable of one of its nodes.
+    :return: The set of properties that the node must have for the query to match it.
+    """
+    required = set()
+    for node in query.pattern.nodes():
+        if node.variable == variable:
+            required.update(key for key, value in node.properties)
+    if query.where is not None:
+        for condition in query.where.conditions():
+            if isinstance(condition, Exists) or (isinstance(condition, Comparison) and condition.operator != "IS NULL"):
+                if condition.variable == variable:
+                    required.add(condition.property)
+    return required
+
+
+def candidate_labels(schema, properties):
+    """
+    :param schema: The Schema the query was translated against.
+    :param properties: Properties that a node must have.
+    :return: The labels, in schema order, that have every one of the properties, or None if they can't be narrowed.
+    """
+    if not properties:
+        return None
+    labels = set(schema.labels)
+    for prop in properties:
+        labels &= set(schema.labelsByProperty.get(prop, ()))
+    if not labels or len(labels) == len(schema.labels):
+        return None
+    return [label for label in schema.labels if label in labels]
+
+
+def narrow_labels(query, schema):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param query: A cypher.Query, or a query string, which is returned as it is.
+    :param schema: The Schema the query was translated against.
+    :return: The query, with its unlabeled nodes narrowed to the labels that have the properties they must have.
+    """
+    if not isinstance(query, Query):
+        return query
+    where = query.where
+    nodes = {}
+    for node in query.pattern.nodes():
+        labels = None if node.labels else candidate_labels(schema, required_properties(query, node.variable))
+        if labels is None:
+            nodes[node.variable] = node
+        elif len(labels) == 1:
+            nodes[node.variable] = Node(node.variable, labels, node.properties, node.padded)
+        else:
+            nodes[node.variable] = node
+            test = HasLabels(node.variable, labels)
+            where = test if where is None else And(test, where)
+    pattern = query.pattern
+    if isinstance(pattern, Path):
+        pattern = Path(nodes[pattern.start.variable], pattern.relationship, nodes[pattern.end.variable])
+    else:
+        pattern = nodes[pattern.variable]
+    return Query(pattern, where, query.returns, query.whereKeyword, query.page)
@@ -0,0 +1,314 @@
+"""
+schema.py:
+The graph database schemas that the translator knows about, each with its own precomputed indexes and caches.
+
+File name: schema.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+A Schema holds the labels, relationships and properties of one graph database. Before this module existed these were
+hardcoded in Tokenize.initDatabaseDictionaries(), so the translator could only ever talk about the "Outlaw" database.
+Schemas are registered by name in a SchemaRegistry, and Tokenize takes the name of the schema it should use.
+
+A Schema can't be changed once it has been made: its lists are tuples, its dictionaries are read-only views, and
+setting an attribute raises an AttributeError. That makes it safe for any number of threads to translate against one
+schema at the same time without locks. To change a schema, make a new one and register it in place of the old one.
+
+When the database changes, SchemaRegistry.refresh() makes the new schema from the old one with refreshed(). The
+indexes are cheap, and are built again, but the similarity scores are what took WordNet to compute; refreshed() keeps
+the scores of every term that is still in the schema, drops the ones of the terms that are gone, and only computes
+scores for the terms that are new. The new schema is swapped in with one assignment. A Tokenize object looks its schema
+up once, when it is made, so a translation that is already running finishes against the old schema.
+
+Each schema gets its own similarity cache, so that a busy schema can't push another schema's hot entries out, and its
+own SchemaMatcher (see matcher.py), which uses the schema's lexicon of synonyms before it ever asks WordNet, and its
+own FuzzyIndex (see fuzzy.py), which finds the term that a misspelled word was meant to be. The terms that the schema's
+own words are related to in WordNet (relatedTerms) are worked out when the schema is made, with
+matcher.related_terms(), so the matcher never has to ask WordNet about them while a question is translated.
+
+The indexes that words from questions are looked up in are keyed by the canonical form of each term (see canonical.py),
+which is computed once, here, rather than every time a word is compared with a term.
+
+"""
+
+import threading
+from types import MappingProxyType
+
+try:
+    from sprint4.cache import LRUCache
+    from sprint4.canonical import canonical, canonical_set
+    from sprint4.fuzzy import FuzzyIndex
+    from sprint4.matcher import QUESTION_WORDS, SchemaMatcher, related_terms
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from cache import LRUCache
+    from canonical import canonical, canonical_set
+    from fuzzy import FuzzyIndex
+    from matcher import QUESTION_WORDS, SchemaMatcher, related_terms
+
+DEFAULT_SCHEMA = "outlaw"
+
+
+class Schema():
+    """
+    Schema describes one graph database, and precomputes the lookups that the translation methods need. It is
+    immutable; the caches and the matcher are the only parts that change, and they do their own locking.
+
+    Attributes:
+        name (String): The name the schema is registered under.
+        labels (Tuple):  The unique labels that exist within a graph database.
+        relationships (Tuple):   The unique relationships that exist within a graph database.
+        labelProperties [Dictionary]:   Has the properties (a tuple) attached to every label from the "labels" list.
+        relationshipProperties [Dictionary]:   Has the properties (a tuple) attached to every
+            relationship from the "relationships" list.
+        labelIndex [Dictionary]: Maps the canonical form of every label to the label.
+        relationshipIndex [Set]: The canonical form of every relationship.
+        propertyIndex [Dictionary]: Maps every label to the set of the canonical forms of its properties.
+        properties [Set]: Every property that appears on any label.
+        labelsByProperty [Dictionary]: Maps every property to the tuple of labels that have it.
+        similarityTable [Dictionary]: Similarity scores for pairs of words that were precomputed when a bundle was built.
+            These are never evicted. Empty unless the schema was loaded from a bundle (see bundle.py).
+        similarityCache (LRUCache): Cached similarity scores for pairs of words, for this schema only.
+        cacheSize (int): The most scores the similarity cache holds.
+        synonyms [Dictionary]: Maps words to the labels or relationships they are synonyms of, e.g. "someone" to
+            ("Person",). Part of the schema's lexicon.
+        nonTerms [Set]: Words that are known not to mean any label or relationship. The rest of the lexicon. The
+            properties aren't listed here; the matcher takes them from labelProperties.
+        relatedTerms [Dictionary]: Maps words of the schema's own vocabulary (its terms, synonyms and properties) to
+            the other terms that WordNet counts them as, e.g. "female" to ("Animal",). See matcher.related_terms().
+        fuzzy (FuzzyIndex): Corrects misspellings of the labels, relationships and properties; see fuzzy.py.
+        matcher (SchemaMatcher): Matches words against the labels and relationships; see matcher.py.
+
+    """
+
+    def __init__(self, name, labels, relationships, labelProperties, relationshipProperties, cacheSize=4096,
+                 similarityTable=None, synonyms=None, nonTerms=QUESTION_WORDS, relatedTerms=None):
+        self.name = name
+        self.labels = tuple(labels)
+        self.relationships = tuple(relationships)
+        self.labelProperties = _frozen_map(labelProperties)
+        self.relationshipProperties = _frozen_map(relationshipProperties)
+
+        self.labelIndex = MappingProxyType(dict((canonical(label), label) for label in self.labels))
+        self.relationshipIndex = canonical_set(self.relationships)
+        self.propertyIndex = MappingProxyType(dict((label, canonical_set(props))
+                                                   for label, props in self.labelProperties.items()))
+        self.properties = frozenset(prop for props in self.labelProperties.values() for prop in props)
+        labelsByProperty = {}
+        for label, props in self.labelProperties.items():
+            for prop in props:
+                labelsByProperty.setdefault(prop, []).append(label)
+        self.labelsByProperty = _frozen_map(labelsByProperty)
+
+        self.similarityTable = MappingProxyType({}) if similarityTable is None else similarityTable
+        self.similarityCache = LRUCache(maxSize=cacheSize)
+        self.cacheSize = cacheSize
+        self.synonyms = _frozen_map((canonical(word), terms) for word, terms in (synonyms or {}).items())
+        self.nonTerms = canonical_set(nonTerms)
+        self.relatedTerms = _frozen_map((canonical(word), terms) for word, terms in (relatedTerms or {}).items())
+        self.fuzzy = FuzzyIndex(list(self.labels) + list(self.relationships) + list(self.properties)
+                                + [rel[:-1] for rel in self.relationships if rel.lower().endswith("s")])
+        self.matcher = SchemaMatcher(self)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if "_frozen" in self.__dict__:
+            raise AttributeError("Schema %r can't be changed; register a new Schema instead" % self.name)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return "Schema(%r, labels=%r, relationships=%r)" % (self.name, self.labels, self.relationships)
+
+    def diff(self, other):
+        """
+        :param other: A newer Schema of the same database.
+        :return: A dictionary of what changed: addedLabels, removedLabels, addedRelationships, removedRelationships,
+            addedProperties and removedProperties (sets), and changedLabels, the labels whose properties changed.
+        """
+        return dict(addedLabels=set(other.labels) - set(self.labels),
+                    removedLabels=set(self.labels) - set(other.labels),
+                    addedRelationships=set(other.relationships) - set(self.relationships),
+                    removedRelationships=set(self.relationships) - set(other.relationships),
+                    addedProperties=other.properties - self.properties,
+                    removedProperties=self.properties - other.properties,
+                    changedLabels=set(label for label in set(self.labels) & set(other.labels)
+                                      if self.labelProperties[label] != other.labelProperties[label]))
+
+    def refreshed(self, labels, relationships, labelProperties, relationshipProperties, similarity=None):
+        """
+        Author: Joseph Pruner
+        Date created: 19/10/2026
+        Date last modified: 19/10/2026
+
+        Makes a new Schema for the same database after it has changed, keeping as much as it can of what this one
+        computed. The lexicon and the related terms are kept, apart from the terms that are gone. The properties come
+        from the new labelProperties, as they do for any schema.
+
+        :param labels: The labels now in the database.
+        :param relationships: The relationships now in the database.
+        :param labelProperties: The properties of each label.
+        :param relationshipProperties: The properties of each relationship.
+        :param similarity: A function of (word, term) that computes a similarity score, used to add scores to the
+            similarity table for the new terms, and to find the related terms of the new words and the new terms; or
+            None to leave them out, so that words are compared with the new terms using WordNet when they come up, and
+            the schema's own words are only related to the terms they were related to before.
+        :return: A tuple of the new Schema and its diff() from this one.
+        """
+        terms = set(labels) | set(relationships)
+        removed = (set(self.labels) | set(self.relationships)) - terms
+        added = terms - set(self.labels) - set(self.relationships)
+
+        table = dict((key, score) for key, score in self.similarityTable.items() if key[1] not in removed)
+        if similarity is not None and table:
+            words = set(key[0] for key in table)
+            for word in words:
+                for term in added:
+                    table[(word, term)] = similarity(word, term)
+
+        synonyms = dict((word, [t for t in ts if t in terms]) for word, ts in self.synonyms.items())
+        related = dict((word, [t for t in ts if t in terms]) for word, ts in self.relatedTerms.items())
+        args = (self.name, labels, relationships, labelProperties, relationshipProperties, self.cacheSize,
+                MappingProxyType(table) if table else None, dict((w, ts) for w, ts in synonyms.items() if ts),
+                self.nonTerms)
+        schema = Schema(*args, relatedTerms=dict((w, ts) for w, ts in related.items() if ts))
+        if similarity is not None:
+            schema = Schema(*args, relatedTerms=related_terms(schema, similarity, self))
+        for key, score in self.similarityCache.items():
+            if key[1] not in removed:
+                schema.similarityCache.put(key, score)
+        return schema, self.diff(schema)
+
+
+def _frozen_map(items):
+    """
+    :param items: A dictionary, or (key, values) pairs, where the values are lists.
+    :return: A read-only view of a dictionary with the values as tuples.
+    """
+    return MappingProxyType(dict((key, tuple(values)) for key, values in dict(items).items()))
+
+
+class SchemaRegistry():
+    """
+    SchemaRegistry keeps every known Schema under its name.
+    """
+
+    def __init__(self):
+        self._schemas = {}
+        self._lock = threading.Lock()
+        self._refreshLock = threading.Lock()
+
+    def register(self, schema):
+        """
+        Add a schema to the registry, replacing any schema that already has the same name.
+
+        :param schema: The Schema to register.
+        :return: The registered Schema.
+        """
+        with self._lock:
+            self._schemas[schema.name] = schema
+        return schema
+
+    def refresh(self, name, labels, relationships, labelProperties, relationshipProperties, similarity=None):
+        """
+        Replace a registered schema with a refreshed one (see Schema.refreshed()). Refreshes of the registry are done
+        one at a time, but translations go on while the new schema is being made, against the old one.
+
+        :param name: The name of the schema.
+        :param labels: The labels now in the database.
+        :param relationships: The relationships now in the database.
+        :param labelProperties: The properties of each label.
+        :param relationshipProperties: The properties of each relationship.
+        :param similarity: A function of (word, term) to compute the similarity scores of the new terms, or None.
+        :return: The diff() between the old and the new schema.
+        :raises KeyError: If no schema has been registered under that name.
+        """
+        with self._refreshLock:
+            schema, diff = self.get(name).refreshed(labels, relationships, labelProperties, relationshipProperties,
+                                                    similarity)
+            self.register(schema)
+        return diff
+
+    def unregister(self, name):
+        """
+        Remove a schema from the registry.
+
+        :param name: The name of the schema.
+        :return: nothing
+        """
+        with self._lock:
+            self._schemas.pop(name, None)
+
+    def get(self, name=DEFAULT_SCHEMA):
+        """
+        Look up a schema by name.
+
+        :param name: The name of the schema.
+        :return: The Schema.
+        :raises KeyError: If no schema has been registered under that name.
+        """
+        try:
+            return self._schemas[name]
+        except KeyError:
+            raise KeyError("Unknown schema: " + repr(name))
+
+    def names(self):
+        """
+        :return: A sorted list of the names of every registered schema.
+        """
+        return sorted(self._schemas)
+
+    def __contains__(self, name):
+        return name in self._schemas
+
+
+def outlaw_schema():
+    """
+    Author: Angie Pinchbeck
+    Date created: 27/03/2018
+    Date last modified: 19/10/2026
+
+    The "Outlaw" database that the translation methods were written against. This used to be hardcoded in
+    Tokenize.initDatabaseDictionaries(). The Cypher query needed to return each piece of information from the database
+    is listed above it, so that this can be scaled to include the feature of linking to a real database.
+    introspect.SchemaLoader now does that, in a few batched queries rather than one for every label.
+
+    :return: The Outlaw Schema.
+    """
+
+    # MATCH (n) RETURN distinct labels(n)
+    labels = ["Person", "Animal", "Outlaw"]
+
+    # MATCH n-[r]-() RETURN distinct type(r)
+    relationships = ["likes", "dislikes", "parents", "brother"]
+
+    """ Note that the following Cypher query would need to run in a loop for every label that
+    was already in labels to fill out the labelProperties dictionary """
+    # MATCH (n:Label) UNWIND keys(n) AS key RETURN collect(distinct key)
+    labelProperties = dict(Person=["name", "female", "size", "bounty"], Animal=["name", "species"],
+                           Outlaw=["name", "bounty", "size"])
+
+    """ Note that the following Cypher query would need to run in a loop for every relationship that
+    was already in relationships to fill out the relationshipProperties dictionary """
+    # MATCH (n:Label) UNWIND keys(n) AS key RETURN collect(distinct key)
+    relationshipProperties = dict(LIKES=["because"], DISLIKES=["because"], PARENTS=["gift"], BROTHER=[])
+
+    """ The lexicon: words that share a WordNet synset with a label (so their similarity score is 1.0). The words
+    that are known not to mean any label or relationship are the question words, the default. Any other word is still
+    compared using WordNet (see matcher.py). """
+    synonyms = dict(someone=["Person"], somebody=["Person"], individual=["Person"], mortal=["Person"], soul=["Person"],
+                    creature=["Animal"], beast=["Animal"], brute=["Animal"], fauna=["Animal"],
+                    criminal=["Outlaw"], felon=["Outlaw"], crook=["Outlaw"], malefactor=["Outlaw"])
+
+    """ The words of the schema's own vocabulary that WordNet counts as another term as well (a score above
+    matcher.SIMILARITY_THRESHOLD), found with matcher.related_terms() and Tokenize.similarity_score. They are listed
+    here so that WordNet doesn't have to be asked about them while questions are translated. """
+    relatedTerms = dict(female=["Animal"])
+
+    return Schema(DEFAULT_SCHEMA, labels, relationships, labelProperties, relationshipProperties, synonyms=synonyms,
+                  relatedTerms=relatedTerms)
+
+
+"""The registry used by Tokenize unless it is given another one."""
+registry = SchemaRegistry()
+registry.register(outlaw_schema())
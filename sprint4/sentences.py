@@ -0,0 +1,56 @@
+"""
+sentences.py:
+Splits a stream of lines into sentences, giving out each sentence as soon as it is known to be complete.
+
+File name: sentences.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+This is shared by document.py and by streamSentences() in sprint2/index.py, which is still run by Python 2, so it
+uses nothing that Python 2 doesn't have, and imports nothing.
+
+Lines are collected until a blank line (the end of a paragraph). A sentence tokenizer such as Punkt only ends a
+sentence after a word that ends in ".", "?" or "!", and it decides whether to end it there by looking at that word and
+the one after it. So when a line is read, only the last line of the sentence that isn't finished yet, and the new line,
+need to be split: any end of a sentence that the new line makes possible is in there. Every sentence that is found to
+be complete is given out straight away, and the last piece is kept, because it might carry on onto the next line. At
+the end of a paragraph, what was kept is given out as its last sentence. A long sentence that runs over many lines is therefore never
+split again from its start, and each line is only split about twice, however long the paragraph is.
+
+"""
+
+
+def stream_sentences(lines, split):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param lines: An iterable of lines, e.g. an open file.
+    :param split: The function that splits text into sentences, e.g. nltk.sent_tokenize.
+    :return: A generator of the sentences. The lines of a sentence are joined with single spaces.
+    """
+    pending = []  # the lines of the sentence that isn't known to be complete yet; the last one may be part of a line
+    for line in lines:
+        text = line.strip()
+        if text == "":
+            if pending:
+                yield " ".join(pending)
+            pending = []
+            continue
+        if not pending:
+            sentences = split(text)
+        else:
+            sentences = split(pending[-1] + " " + text)
+            if len(sentences) > 1:
+                sentences[0] = " ".join(pending[:-1] + [sentences[0]])
+        if len(sentences) <= 1:
+            pending.append(text)
+            continue
+        for sentence in sentences[:-1]:
+            yield sentence
+        pending = [sentences[-1]]
+    if pending:
+        yield " ".join(pending)
@@ -0,0 +1,133 @@
+"""
+stream.py:
+An HTTP endpoint that sends the queries for a question to the web page as Server-Sent Events, one as soon as it is ready.
+
+File name: stream.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+results.php used to run Tokenize.py for every question and wait for it to finish before it showed anything. This
+server keeps the translator loaded, and answers GET /stream?question=...&schema=... with a stream of events:
+
+    event: query        data: {"queryId": "query1", "query": "MATCH (n :Outlaw) RETURN n.name"}
+    event: done         data: {"skipped": [], "partial": false}
+    event: error        data: {"error": "KeyError: ..."}
+
+A query event is sent as soon as its translation method has finished (see Tokenize.streamTranslator()), so the first
+query shows up while the translation methods that use WordNet are still running. The stream always ends with a done or
+an error event. An optional "deadline" parameter gives the number of seconds the translation may take.
+
+To use it from results.php, run it and set NL2CQ_STREAM_URL for the web server to its address:
+
+    python stream.py --port 8001
+    NL2CQ_STREAM_URL=http://localhost:8001/stream
+
+"""
+
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+try:
+    from sprint4.schema import DEFAULT_SCHEMA
+    from sprint4.translators import Results
+except ImportError:  # run as a script from inside sprint4/
+    from schema import DEFAULT_SCHEMA
+    from translators import Results
+
+
+def event(name, data):
+    """
+    :param name: The name of the event.
+    :param data: What the event carries, which is sent as JSON.
+    :return: The event, as Server-Sent Events text.
+    """
+    return "event: " + name + "\ndata: " + json.dumps(data) + "\n\n"
+
+
+def events(question, schemaId=DEFAULT_SCHEMA, deadline=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param question: The question to translate.
+    :param schemaId: The name of the schema to translate against.
+    :param deadline: The number of seconds the translation may take, or None.
+    :return: A generator of the events for the question: a query event for every query as soon as it is ready, and
+        then a done event, or an error event if the translation failed.
+    """
+    try:
+        from sprint4.Tokenize import Tokenize
+    except ImportError:
+        from Tokenize import Tokenize
+    try:
+        t = Tokenize(question, schemaId)
+        results = Results()
+        for queryId, query in t.translations(t.wordsTagged, deadline=deadline, results=results):
+            yield event("query", dict(queryId=queryId, query=query))
+        yield event("done", dict(skipped=results.skipped, partial=results.partial))
+    except Exception as e:
+        yield event("error", dict(error="%s: %s" % (type(e).__name__, e)))
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET /stream with the events for the question. Every request is handled on its own thread.
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/stream":
+            self.send_error(404)
+            return
+        params = parse_qs(url.query)
+        question = params.get("question", [""])[0]
+        if question.strip() == "":
+            self.send_error(400, "No question")
+            return
+        try:
+            deadline = float(params["deadline"][0]) if "deadline" in params else None
+        except ValueError:
+            self.send_error(400, "The deadline must be a number of seconds")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")  # results.php is served from another origin
+        self.end_headers()
+        try:
+            for text in events(question, params.get("schema", [DEFAULT_SCHEMA])[0], deadline):
+                self.wfile.write(text.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the page was closed; the rest of the translation isn't needed
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StreamServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream the queries for questions as Server-Sent Events.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args(argv)
+    server = StreamServer((args.host, args.port), StreamHandler)
+    print("Streaming at http://%s:%d/stream" % (args.host, server.server_address[1]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
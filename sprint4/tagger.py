@@ -0,0 +1,172 @@
+"""
+tagger.py:
+Part of speech taggers that know about the schema, and a small fast tagger that can be trained on our own questions.
+
+File name: tagger.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+The perceptron tagger often tags schema words wrongly; in "Who are all the people that are outlaws?" it tags "outlaws"
+as a verb past participle (VBN). The translation methods work around this by comparing every word with every label,
+which is slow (see matcher.py). A SchemaTagger wraps any tagger and forces the labels and properties of the schema, in
+their singular and plural forms, to be tagged as nouns. Relationships are left alone, because "likes" really is a
+verb in "who likes someone".
+
+A general purpose tagger is much bigger than we need for the kind of questions we get. train_fast_tagger() trains a
+bigram tagger, backed off to a unigram tagger, on a corpus of our questions (tagged by the tagger we have now), which
+tags a question with a handful of dictionary lookups. To build one:
+
+    python tagger.py train OUTPUT --corpus FILE
+
+where FILE has one question per line. Then point the NL2CQ_TAGGER environment variable at OUTPUT, or call
+resources.use_tagger(load_tagger(OUTPUT)).
+
+Whether the fast tagger is worth it can be checked against the perceptron tagger on the questions of the unit tests
+(or any FILE of questions, preferably ones it wasn't trained on):
+
+    python tagger.py compare OUTPUT [--corpus FILE]
+
+which reports how many of the words it tags the same way as the perceptron tagger, and how long each takes per question
+(see compare_taggers()). Measured on 19/10/2026 with the 90 unit test questions, against the perceptron model
+averaged_perceptron_tagger_eng:
+
+    trained and compared on all 90 questions            agreement 0.972    8 us per question, perceptron 176 us
+    trained on every other question, compared on rest   agreement 0.925    8 us per question, perceptron 147 us
+
+The same perceptron model tags "sizes" as VBZ in test25 of test_tokenize.py, which then fails, as it does on the code of
+sprint 4 before any of these changes; with schemaTagging it is tagged NNS and the question gets its query (test26).
+
+"""
+
+import json
+import pickle
+import sys
+import time
+
+import nltk
+from inflection import pluralize
+
+NOUN_TAGS = ("NN", "NNS", "NNP", "NNPS")
+
+
+class SchemaTagger():
+    """
+    SchemaTagger tags words with another tagger, then corrects the tags of the schema's labels and properties.
+
+    Attributes:
+        tagger: The tagger that does the tagging, e.g. an nltk PerceptronTagger.
+        nouns [Dictionary]: Maps each form of each label and property to the noun tag it should get.
+
+    """
+
+    def __init__(self, tagger, schema):
+        self.tagger = tagger
+        self.nouns = {}
+        for term in [label.lower() for label in schema.labels] + sorted(schema.properties):
+            plural = pluralize(term)
+            self.nouns[term] = "NN"
+            if plural != term:
+                self.nouns[plural] = "NNS"
+
+    def tag(self, words):
+        """
+        :param words: A list of words.
+        :return: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        """
+        nouns = self.nouns
+        return [(word, tag if tag in NOUN_TAGS or word not in nouns else nouns[word])
+                for word, tag in self.tagger.tag(words)]
+
+
+def train_fast_tagger(taggedSentences):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Trains a small tagger on questions that have already been tagged. Words it has never seen are tagged as nouns,
+    which is what most unseen words in our questions are (names, letters, and so on).
+
+    :param taggedSentences: A list of lists of (word, tag) tuples.
+    :return: An nltk BigramTagger, backed off to a UnigramTagger.
+    """
+    default = nltk.DefaultTagger("NN")
+    unigram = nltk.UnigramTagger(taggedSentences, backoff=default)
+    return nltk.BigramTagger(taggedSentences, backoff=unigram)
+
+
+def compare_taggers(tagger, reference, questions, repeat=5):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    Measures a tagger against another: how often they agree, and how long each takes to tag a question.
+
+    :param tagger: The tagger to measure, e.g. one from train_fast_tagger().
+    :param reference: The tagger whose tags are taken to be right, e.g. the nltk PerceptronTagger.
+    :param questions: A list of questions, each a list of words.
+    :param repeat: How many times every question is tagged by each tagger, for the timings.
+    :return: A dictionary with questions, words, agreement (the share of the words that got the same tag from both),
+        and taggerMicros and referenceMicros: how many microseconds each took per question, on average.
+    """
+    same = words = 0
+    for question in questions:
+        expected = reference.tag(question)
+        same += sum(1 for got, want in zip(tagger.tag(question), expected) if got[1] == want[1])
+        words += len(question)
+
+    def micros(t):
+        started = time.perf_counter()
+        for i in range(repeat):
+            for question in questions:
+                t.tag(question)
+        return (time.perf_counter() - started) * 1e6 / max(1, repeat * len(questions))
+
+    return dict(questions=len(questions), words=words, agreement=round(same / words, 4) if words else 1.0,
+                taggerMicros=round(micros(tagger), 1), referenceMicros=round(micros(reference), 1))
+
+
+def load_tagger(path):
+    """
+    :param path: A file written by save_tagger().
+    :return: The tagger.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def save_tagger(tagger, path):
+    """
+    :param tagger: The tagger to save.
+    :param path: The file to write it to.
+    :return: nothing
+    """
+    with open(path, "wb") as f:
+        pickle.dump(tagger, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+if __name__ == "__main__":
+    usage = "usage: python tagger.py train OUTPUT --corpus FILE\n       python tagger.py compare TAGGER [--corpus FILE]"
+    if len(sys.argv) not in (3, 5) or sys.argv[1] not in ("train", "compare") \
+            or sys.argv[3:4] not in ([], ["--corpus"]) or (sys.argv[1] == "train" and len(sys.argv) != 5):
+        sys.exit(usage)
+    try:
+        from sprint4 import loadgen, resources
+    except ImportError:
+        import loadgen
+        import resources
+    if len(sys.argv) == 5:
+        with open(sys.argv[4], encoding="utf-8") as f:
+            questions = [line.strip().lower() for line in f if line.strip()]
+    else:
+        questions = [question.lower() for question in loadgen.corpus_questions()]
+    if sys.argv[1] == "train":
+        tagged = [resources.pos_tag(resources.word_tokenize(question)) for question in questions]
+        save_tagger(train_fast_tagger(tagged), sys.argv[2])
+        print("Trained on %d questions" % len(tagged))
+    else:
+        words = [resources.word_tokenize(question) for question in questions]
+        print(json.dumps(compare_taggers(load_tagger(sys.argv[2]), nltk.tag.PerceptronTagger(), words), indent=2))
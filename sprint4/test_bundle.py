@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from nltk.tag.perceptron import PerceptronTagger
+from nltk.tokenize.punkt import PunktSentenceTokenizer, PunktTrainer
+from sprint4.bundle import Bundle, BundleError, MappedTable, write_bundle
+from sprint4.schema import outlaw_schema
+
+TRAINING = [[("who", "WP"), ("are", "VBP"), ("the", "DT"), ("outlaws", "NNS"), ("?", ".")],
+            [("how", "WRB"), ("many", "JJ"), ("names", "NNS"), ("start", "VBP"), ("with", "IN"), ("j", "NN")],
+            [("list", "VB"), ("the", "DT"), ("species", "NNS")],
+            [("who", "WP"), ("has", "VBZ"), ("a", "DT"), ("bounty", "NN"), ("?", ".")]]
+
+TEXT = "Mr. Smith asked Dr. Jones a question. Who are the outlaws? How many names start with J. " \
+       "Show me everyone named Michael. The U.S. marshal asked who has a bounty."
+
+
+class TestBundle(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tagger = PerceptronTagger(load=False)
+        cls.tagger.train(TRAINING, nr_iter=5)
+        trainer = PunktTrainer()
+        trainer.train(TEXT * 3, finalize=True)
+        cls.punkt = PunktSentenceTokenizer(trainer.get_params())
+        cls.path = os.path.join(tempfile.mkdtemp(), "test.bundle")
+        similarities = {"outlaw": {("outlaw", "Outlaw"): 1.0, ("species", "dog"): 0.25}}
+        write_bundle(cls.path, {"the", "a", "of"}, ["how", "all"], cls.tagger, cls.punkt._params, [outlaw_schema()],
+                     similarities)
+
+    """
+    Test that the bundle records what it was built from, and that the stop words come back.
+    """
+    def test_meta_and_stop_words(self):
+        bundle = Bundle(self.path)
+        self.assertEqual(bundle.meta["keptStopWords"], ["all", "how"])
+        self.assertEqual(bundle.stop_words(), frozenset(["the", "a", "of"]))
+
+    """
+    Test that the mapped tagger tags exactly like the tagger it was built from.
+    """
+    def test_tagger_parity(self):
+        mapped = Bundle(self.path).tagger()
+        for sentence in ["who are all the outlaws ?".split(), "how many species have a bounty".split(),
+                         "list every name that starts with an unseen letter z".split()]:
+            self.assertEqual(mapped.tag(sentence), self.tagger.tag(sentence))
+
+    """
+    Test that the mapped sentence tokenizer splits exactly like the one it was built from.
+    """
+    def test_sentence_tokenizer_parity(self):
+        mapped = Bundle(self.path).sentence_tokenizer()
+        self.assertEqual(mapped.tokenize(TEXT), self.punkt.tokenize(TEXT))
+
+    """
+    Test that the schemas come back with their precomputed similarity tables.
+    """
+    def test_schemas(self):
+        schema, = Bundle(self.path).schemas()
+        self.assertEqual(schema.labels, ("Person", "Animal", "Outlaw"))
+        self.assertEqual(schema.similarityTable.get(("outlaw", "Outlaw")), 1.0)
+        self.assertEqual(schema.similarityTable.get(("species", "dog")), 0.25)
+        self.assertIsNone(schema.similarityTable.get(("dog", "species")))
+        self.assertEqual(schema.synonyms["someone"], ("Person",))
+        self.assertEqual(schema.relatedTerms["female"], ("Animal",))
+        self.assertIn("who", schema.nonTerms)
+
+    """
+    Test that mapping a bundle is quick, because nothing is decoded until it is used: the similarity tables are read
+    in place, and the tagger and sentence tokenizer aren't built until they are asked for.
+    """
+    def test_lazy_load(self):
+        bundle = Bundle(self.path)
+        schema, = bundle.schemas()
+        self.assertIsInstance(schema.similarityTable, MappedTable)
+        self.assertIsNone(bundle._tagger)
+        self.assertIsNone(bundle._sentenceTokenizer)
+        bundle.tagger()
+        self.assertIsNotNone(bundle._tagger)
+
+    """
+    Test that a file which isn't a bundle is refused.
+    """
+    def test_not_a_bundle(self):
+        path = os.path.join(tempfile.mkdtemp(), "not.bundle")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(BundleError):
+            Bundle(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from sprint4.canonical import canonical, canonical_set
+from sprint4.schema import outlaw_schema
+
+
+class TestCanonical(unittest.TestCase):
+
+    """
+    Test that plain ASCII words are lowercased, and that the same form is always the same object.
+    """
+    def test_ascii(self):
+        self.assertEqual(canonical("Outlaw"), "outlaw")
+        self.assertIs(canonical("OUTLAW"), canonical("out" + "law"))
+
+    """
+    Test that other words are case folded and NFKD-normalized, as equals_ignore_case() used to compare them.
+    """
+    def test_unicode(self):
+        self.assertEqual(canonical("Straße"), "strasse")
+        self.assertIs(canonical("Café"), canonical("café"))
+        self.assertIs(canonical("ﬁsh"), canonical("fish"))
+        self.assertEqual(canonical_set(["Who", "WHO", "list"]), frozenset(["who", "list"]))
+
+    """
+    Test that the schema's indexes are keyed by canonical forms.
+    """
+    def test_schema_indexes(self):
+        schema = outlaw_schema()
+        self.assertEqual(schema.labelIndex[canonical("OUTLAW")], "Outlaw")
+        self.assertIn(canonical("Species"), schema.propertyIndex["Animal"])
+        self.assertNotIn(canonical("species"), schema.propertyIndex["Person"])
+        self.assertEqual(schema.matcher.labels("CRIMINAL", None).terms, ("Outlaw",))
+
+
+if __name__ == '__main__':
+    unittest.main()
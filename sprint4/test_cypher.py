@@ -0,0 +1,72 @@
+import unittest
+from sprint4.cypher import Comparison, Exists, Node, Path, Projection, Query, Value
+
+
+class TestCypher(unittest.TestCase):
+
+    """
+    Test that the literal rendering is exactly what the translation methods have always returned.
+    """
+    def test_literal_rendering(self):
+        self.assertEqual(Query(Node("n", ["Outlaw"]), returns=[Projection("n", "name"), Projection("n", "bounty")]),
+                         "MATCH (n :Outlaw) RETURN n.name, n.bounty")
+        self.assertEqual(Query(Node("n", ["Animal", "Outlaw"], padded=True), returns=[Projection("n", "name")]),
+                         "MATCH (n  :Animal :Outlaw ) RETURN n.name")
+        self.assertEqual(Query(Node("n", properties=[("species", Value("dog"))]), returns=[Projection("n")]),
+                         "MATCH (n {species :'dog'}) RETURN n")
+        self.assertEqual(Query(Node("n"), where=Exists("n", "species"), returns=[Projection("n")], whereKeyword="where"),
+                         "MATCH (n) where exists (n.species) RETURN n")
+        self.assertEqual(Query(Node("n"), where=Comparison("n", "species", "IS NOT NULL"),
+                               returns=[Projection("n", "species", count=True)]),
+                         "MATCH (n) WHERE n.species IS NOT NULL RETURN COUNT (n.species)")
+        self.assertEqual(Query(Path(Node("p"), "parents", Node("n")), returns=[Projection("n", "name")]),
+                         "MATCH (p) -[:parents] -> (n) RETURN n.name")
+
+    """
+    Test that values are sent as parameters, so that different letters share one query plan.
+    """
+    def test_parameterized(self):
+        j = Query(Node("n"), where=Comparison("n", "name", "STARTS WITH", Value("J", quote="\"")),
+                  returns=[Projection("n", "name", count=True)])
+        k = Query(Node("n"), where=Comparison("n", "name", "STARTS WITH", Value("K", quote="\"")),
+                  returns=[Projection("n", "name", count=True)])
+        self.assertEqual(j, "MATCH (n) WHERE n.name STARTS WITH \"J\" RETURN COUNT (n.name)")
+        self.assertEqual(j.parameterized(),
+                         ("MATCH (n) WHERE n.name STARTS WITH $value RETURN COUNT (n.name)", {"value": "J"}))
+        self.assertEqual(j.parameterized()[0], k.parameterized()[0])
+
+    """
+    Test that inline property maps are parameterized too, and that queries without values have no parameters.
+    """
+    def test_parameterized_property_map(self):
+        q = Query(Node("n", properties=[("name", Value("o'brien"))]), returns=[Projection("n")])
+        self.assertEqual(q.parameterized(), ("MATCH (n {name :$value}) RETURN n", {"value": "o'brien"}))
+        q = Query(Path(Node("p"), "likes", Node("n")), returns=[Projection("p")])
+        self.assertEqual(q.parameterized(), ("MATCH (p) -[:likes] -> (n) RETURN p", {}))
+
+    """
+    Test that two values with the same name are sent as two parameters, rather than the last one replacing the first.
+    """
+    def test_parameter_names_unique(self):
+        q = Query(Node("n", properties=[("species", Value("dog"))]),
+                  where=Comparison("n", "name", "STARTS WITH", Value("J", quote="\"")), returns=[Projection("n")])
+        self.assertEqual(q, "MATCH (n {species :'dog'}) WHERE n.name STARTS WITH \"J\" RETURN n")
+        self.assertEqual(q.parameterized(), ("MATCH (n {species :$value}) WHERE n.name STARTS WITH $value2 RETURN n",
+                                             {"value": "dog", "value2": "J"}))
+
+    """
+    Test that a paginated query is ordered by node id, with the skip and limit sent as parameters.
+    """
+    def test_paginated(self):
+        q = Query(Node("n"), where=Exists("n", "species"), returns=[Projection("n")], whereKeyword="where")
+        self.assertTrue(q.unbounded())
+        page = q.paginated(20, 10)
+        self.assertEqual(page, "MATCH (n) where exists (n.species) RETURN n ORDER BY id(n) SKIP 20 LIMIT 10")
+        self.assertEqual(page.parameterized(), ("MATCH (n) where exists (n.species) RETURN n ORDER BY id(n) "
+                                                "SKIP $skip LIMIT $limit", {"skip": 20, "limit": 10}))
+        self.assertFalse(page.unbounded())
+        self.assertFalse(Query(Node("n"), returns=[Projection("n", "name", count=True)]).unbounded())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import re
+import threading
+import time
+import unittest
+from sprint4.cache import LRUCache
+from sprint4.document import stream_sentences, translate_document
+
+
+def split(text):
+    """A stand-in for the sentence tokenizer, which needs nltk_data: a sentence ends with ? or . and a space."""
+    return [s for s in re.split(r"(?<=[?.])\s+", text) if s]
+
+
+class TestDocument(unittest.TestCase):
+
+    """
+    Test that sentences are given out as soon as they are complete, including ones that run over several lines.
+    """
+    def test_stream_sentences(self):
+        read = []
+
+        def lines():
+            for line in ["Who are all the outlaws? How many names", "start with J?", "",
+                         "What are the species", "of the animals?"]:
+                read.append(line)
+                yield line
+
+        sentences = stream_sentences(lines(), split)
+        self.assertEqual(next(sentences), "Who are all the outlaws?")
+        self.assertEqual(len(read), 1)
+        self.assertEqual(list(sentences), ["How many names start with J?", "What are the species of the animals?"])
+
+    """
+    Test that the sentences are translated in parallel, and given out in order.
+    """
+    def test_parallel_in_order(self):
+        running = []
+        most = []
+        lock = threading.Lock()
+
+        def translate(sentence):
+            with lock:
+                running.append(sentence)
+                most.append(len(running))
+            time.sleep(0.05 if sentence == "first?" else 0.01)
+            with lock:
+                running.remove(sentence)
+            return ["query for " + sentence]
+
+        sentences = ["first?", "second?", "third?", "fourth?"]
+        results = list(translate_document(sentences, translate, workers=4, cache=None))
+        self.assertEqual([r["sentence"] for r in results], sentences)
+        self.assertEqual([r["index"] for r in results], [0, 1, 2, 3])
+        self.assertEqual(results[0]["queries"], ["query for first?"])
+        self.assertGreater(max(most), 1)
+
+    """
+    Test that repeated sentences are only translated once, within a document and across documents, and that errors
+    are reported for their sentence only.
+    """
+    def test_cache_and_errors(self):
+        calls = []
+
+        def translate(sentence):
+            calls.append(sentence)
+            if "broken" in sentence:
+                raise ValueError("can't translate")
+            return ["query"]
+
+        cache = LRUCache()
+        results = list(translate_document(["Who are  the outlaws?", "who are the OUTLAWS?", "broken?"], translate,
+                                          workers=2, cache=cache))
+        self.assertEqual([r["cached"] for r in results], [False, True, False])
+        self.assertEqual(results[2]["error"], "ValueError: can't translate")
+        results = list(translate_document(["Who are the outlaws?"], translate, cache=cache))
+        self.assertEqual((results[0]["queries"], results[0]["cached"]), (["query"], True))
+        self.assertEqual(calls, ["Who are  the outlaws?", "broken?"])
+
+
+if __name__ == '__main__':
+    unittest.main()
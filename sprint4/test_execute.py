@@ -0,0 +1,135 @@
+import threading
+import unittest
+from sprint4.cypher import Comparison, Exists, Node, Path, Projection, Query, Value
+from sprint4.execute import ConnectionPool, ExecutionError, Executor, LocalExecutor, PoolTimeout, QueryTimeout
+
+
+def outlaw_graph(**kwargs):
+    nodes = [dict(id=1, labels=["Person"], properties=dict(name="Jeffery", size=10)),
+             dict(id=2, labels=["Person", "Outlaw"], properties=dict(name="Jesse", bounty="1000")),
+             dict(id=3, labels=["Animal"], properties=dict(name="Rex", species="dog")),
+             dict(id=4, labels=["Animal"], properties=dict(name="Michael"))]
+    relationships = [(2, "parents", 1), (1, "likes", 3)]
+    return LocalExecutor(nodes, relationships, **kwargs)
+
+
+class TestExecute(unittest.TestCase):
+
+    """
+    Test that the local stand-in runs the label and property query.
+    """
+    def test_label_query(self):
+        executor = outlaw_graph()
+        q = Query(Node("n", ["Outlaw"]), returns=[Projection("n", "name"), Projection("n", "bounty")])
+        self.assertEqual(list(executor.run(q)), [{"n.name": "Jesse", "n.bounty": "1000"}])
+
+    """
+    Test that the local stand-in runs the inline property query, using the parameter value.
+    """
+    def test_property_query(self):
+        executor = outlaw_graph()
+        q = Query(Node("n", properties=[("species", Value("dog"))]), returns=[Projection("n")])
+        self.assertEqual(list(executor.run(q)), [{"n": dict(name="Rex", species="dog")}])
+        q = Query(Node("n", properties=[("species", Value("dog"))]),
+                  where=Comparison("n", "name", "STARTS WITH", Value("R")), returns=[Projection("n", "name")])
+        self.assertEqual(list(executor.run(q)), [{"n.name": "Rex"}])
+
+    """
+    Test the count queries.
+    """
+    def test_count_queries(self):
+        executor = outlaw_graph()
+        q = Query(Node("n"), where=Comparison("n", "name", "STARTS WITH", Value("J", quote="\"")),
+                  returns=[Projection("n", "name", count=True)])
+        self.assertEqual(list(executor.run(q)), [{"COUNT (n.name)": 2}])
+        q = Query(Node("n", ["Animal"]), where=Comparison("n", "species", "IS NULL"),
+                  returns=[Projection("n", "name", count=True)])
+        self.assertEqual(list(executor.run(q)), [{"COUNT (n.name)": 1}])
+        q = Query(Node("n"), where=Exists("n", "bounty"), returns=[Projection("n", "name")], whereKeyword="where")
+        self.assertEqual(list(executor.run(q)), [{"n.name": "Jesse"}])
+
+    """
+    Test that an executor must say how it runs queries.
+    """
+    def test_executor_is_abstract(self):
+        self.assertRaises(TypeError, Executor)
+
+        class Incomplete(Executor):
+            pass
+        self.assertRaises(TypeError, Incomplete)
+
+    """
+    Test the relationship query.
+    """
+    def test_relationship_query(self):
+        executor = outlaw_graph()
+        q = Query(Path(Node("p"), "parents", Node("n")), returns=[Projection("n", "name")])
+        self.assertEqual(list(executor.run(q)), [{"n.name": "Jeffery"}])
+
+    """
+    Test that the local stand-in returns the pages of a paginated query in node id order.
+    """
+    def test_paginated_query(self):
+        executor = outlaw_graph()
+        q = Query(Node("n"), where=Exists("n", "name"), returns=[Projection("n", "name")])
+        self.assertEqual(list(executor.run(q.paginated(0, 3))), [{"n.name": n} for n in ["Jeffery", "Jesse", "Rex"]])
+        self.assertEqual(list(executor.run(q.paginated(3, 3))), [{"n.name": "Michael"}])
+        self.assertEqual(list(executor.run(q.paginated(6, 3))), [])
+
+    """
+    Test that Cypher strings are answered from the canned responses.
+    """
+    def test_canned_responses(self):
+        executor = LocalExecutor(responses={"CALL db.labels()": [{"label": "Person"}]})
+        self.assertEqual(list(executor.run("CALL db.labels()")), [{"label": "Person"}])
+        with self.assertRaises(ExecutionError):
+            list(executor.run("MATCH (n) RETURN n"))
+
+    """
+    Test that connections are reused rather than opened for every query.
+    """
+    def test_connections_reused(self):
+        executor = outlaw_graph(maxPoolSize=2)
+        q = Query(Node("n"), returns=[Projection("n", "name")])
+        for i in range(5):
+            list(executor.run(q))
+        self.assertEqual(executor.pool.stats()["opened"], 1)
+
+    """
+    Test that the pool never opens more than its size, and gives up when no connection frees up in time.
+    """
+    def test_pool_bounded(self):
+        pool = ConnectionPool(object, maxSize=1, acquireTimeout=0.05)
+        with pool.acquire():
+            with self.assertRaises(PoolTimeout):
+                with pool.acquire():
+                    pass
+        with pool.acquire():
+            pass
+        self.assertEqual(pool.stats(), dict(maxSize=1, opened=1, inUse=0, idle=1))
+
+    """
+    Test that a waiting thread gets the connection as soon as it is given back.
+    """
+    def test_pool_waits(self):
+        pool = ConnectionPool(object, maxSize=1, acquireTimeout=5.0)
+        got = []
+        with pool.acquire() as first:
+            thread = threading.Thread(target=lambda: got.append(pool.acquire().__enter__()))
+            thread.start()
+        thread.join(5.0)
+        self.assertEqual(got, [first])
+
+    """
+    Test that records are streamed, and that a slow query is stopped at its timeout.
+    """
+    def test_streaming_and_timeout(self):
+        executor = outlaw_graph(delay=0.02)
+        records = executor.run(Query(Node("n"), returns=[Projection("n", "name")]), timeout=0.03)
+        self.assertEqual(next(records), {"n.name": "Jeffery"})
+        with self.assertRaises(QueryTimeout):
+            list(records)
+
+
+if __name__ == '__main__':
+    unittest.main()
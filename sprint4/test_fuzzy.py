@@ -0,0 +1,148 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from sprint4.Tokenize import Tokenize
+from sprint4.fuzzy import FuzzyIndex, deletes, edit_distance
+from sprint4.matcher import FUZZY, WORDNET
+from sprint4.schema import SchemaRegistry, outlaw_schema
+from sprint4.test_translators import bundled_outlaw_schema
+
+"""Words near a term that WordNet knows, so that they aren't misspellings."""
+REAL_WORDS = frozenset(["county", "lives", "bother", "patent", "seize", "outlay", "anima"])
+
+
+class KnownWords(Tokenize):
+    """A Tokenize whose WordNet knows only the words in REAL_WORDS, finds no word close to any term, and fails if it is
+    asked about a question word."""
+
+    def similarity_score(self, wordx, wordy):
+        return 0.0
+
+    def known_word(self, word):
+        if word == "named":
+            raise AssertionError("WordNet was asked about %s" % word)
+        return word in REAL_WORDS
+
+
+class TestFuzzy(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = outlaw_schema()
+        self.asked = []
+
+    def similarity(self, wordx, wordy):
+        self.asked.append((wordx, wordy))
+        return 0.0
+
+    def known(self, word):
+        self.asked.append(word)
+        return word in REAL_WORDS
+
+    """
+    Test that swapping two letters next to each other counts as one edit.
+    """
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("outlaw", "outlaw"), 0)
+        self.assertEqual(edit_distance("outlw", "outlaw"), 1)
+        self.assertEqual(edit_distance("dislkies", "dislikes"), 1)
+        self.assertEqual(edit_distance("bnty", "bounty"), 2)
+        self.assertEqual(edit_distance("parnet", "parent"), 1)
+        self.assertIn("ab", deletes("abc", 1))
+        self.assertEqual(len(deletes("abc", 2)), 7)
+
+    """
+    Test that misspelled labels, relationships and properties are corrected to their canonical form.
+    """
+    def test_correct(self):
+        fuzzy = self.schema.fuzzy
+        self.assertEqual(fuzzy.correct("outlw"), "outlaw")
+        self.assertEqual(fuzzy.correct("Outlw"), "outlaw")
+        self.assertEqual(fuzzy.correct("bountey"), "bounty")
+        self.assertEqual(fuzzy.correct("speces"), "species")
+        self.assertEqual(fuzzy.correct("dislkies"), "dislikes")
+        self.assertEqual(fuzzy.correct("dsilkies"), "dislikes")
+        self.assertEqual(fuzzy.correct("parnet"), "parent")
+
+    """
+    Test that terms, short words, words too far from any term and words as near to two terms are not corrected.
+    """
+    def test_not_corrected(self):
+        fuzzy = self.schema.fuzzy
+        for word in ["outlaw", "female", "nam", "sise", "horse", "question"]:
+            self.assertIsNone(fuzzy.correct(word), word)
+        self.assertIsNone(FuzzyIndex(["rabbit", "rabbis"]).correct("rabbik"))
+        self.assertEqual(FuzzyIndex(["rabbit", "rabbis"]).correct("rabit"), "rabbit")
+
+    """
+    Test that the matcher decides misspelled words with the fuzzy tier, in the same way as the words they were meant
+    to be, without asking WordNet again.
+    """
+    def test_matcher_tier(self):
+        decision = self.schema.matcher.labels("outlw", self.similarity, self.known)
+        self.assertEqual((decision.terms, decision.tier), (("Outlaw",), FUZZY))
+        decision = self.schema.matcher.relationships("parnet", self.similarity, self.known)
+        self.assertEqual((decision.terms, decision.tier), (("parents",), FUZZY))
+        decision = self.schema.matcher.labels("bountey", self.similarity, self.known)
+        self.assertEqual((decision.terms, decision.tier), ((), FUZZY))
+        self.assertEqual(self.asked, ["outlw", "parnet", "bountey"])
+        self.assertEqual(self.schema.matcher.stats()[FUZZY], 3)
+
+    """
+    Test that words WordNet knows, the schema's own words and the question words are never corrected, and that
+    WordNet is only asked about words near a term.
+    """
+    def test_matcher_not_corrected(self):
+        matcher = self.schema.matcher
+        for word in REAL_WORDS:
+            self.assertIsNone(matcher.correct(word, self.known), word)
+            self.assertEqual(matcher.relationships(word, self.similarity, self.known).tier, WORDNET)
+        self.assertEqual(sorted(word for word in self.asked if isinstance(word, str)), sorted(list(REAL_WORDS) * 2))
+        del self.asked[:]
+        for word in ["named", "letter", "outlaw", "female", "parents", "horse"]:
+            self.assertIsNone(matcher.correct(word, self.known), word)
+        self.assertIsNone(matcher.correct("outlw", None))
+        self.assertEqual(self.asked, [])
+
+    def translate(self, tagMap):
+        schemas = SchemaRegistry()
+        schemas.register(bundled_outlaw_schema())
+        t = KnownWords.from_tagged(tagMap, schemas=schemas)
+        with redirect_stdout(io.StringIO()):  # the translators print while debugging
+            return t.wordsTagged, t.translate(t.wordsTagged)
+
+    """
+    Test that a misspelled question gets the same query as the question spelled right, and that the words the
+    translators are given aren't changed.
+    """
+    def test_misspelled_question(self):
+        wordsTagged, queries = self.translate([("Who", "WP"), ("are", "VBP"), ("all", "DT"), ("outlw", "NNS"),
+                                               ("?", ".")])
+        self.assertEqual(wordsTagged, [("who", "WP"), ("are", "VBP"), ("all", "DT"), ("outlw", "NNS"), ("?", ".")])
+        self.assertEqual(queries, [("query1", "MATCH (n :Outlaw) RETURN n.name")])
+        queries = self.translate([("What", "WP"), ("is", "VBZ"), ("the", "DT"), ("bountey", "NN"), ("of", "IN"),
+                                  ("each", "DT"), ("outlaw", "NN")])[1]
+        self.assertEqual(queries, [("query1", "MATCH (n :Outlaw) RETURN n.name, n.bounty")])
+
+    """
+    Test that words WordNet knows aren't taken to be misspellings of the terms they are near, so that "Who lives with
+    outlaws?" isn't read as "Who likes outlaws?".
+    """
+    def test_real_words(self):
+        wordsTagged, queries = self.translate([("Who", "WP"), ("lives", "VBZ"), ("with", "IN"), ("outlaws", "NNS")])
+        self.assertEqual([word for word, tag in wordsTagged], ["who", "life", "with", "outlaw"])
+        self.assertNotIn("query7", [queryId for queryId, query in queries])
+        t = KnownWords.from_tagged([("Which", "WDT"), ("county", "NN"), ("has", "VBZ"), ("outlaws", "NNS")])
+        self.assertEqual([t.schema_word(word) for word, tag in t.wordsTagged], ["which", "county", "ha", "outlaw"])
+
+    """
+    Test that "named" isn't corrected to the property name, so that it still reaches listAllWithProperty() as it was.
+    """
+    def test_named(self):
+        t = KnownWords.from_tagged([("Who", "WP"), ("is", "VBZ"), ("named", "VBN"), ("Michael", "NNP"), ("?", ".")])
+        self.assertEqual(t.wordsTagged[2], ("named", "VBN"))
+        self.assertEqual(t.schema_word("named"), "named")
+        self.assertEqual(t.listAllWithProperty(t.wordsTagged), "MATCH (n {name :'michael'}) RETURN n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from sprint4.cypher import Comparison, Exists, Node, Projection, Query, Value
+from sprint4.indexadvisor import RANGE, TEXT, index_uses, log_questions, recommend
+from sprint4.schema import outlaw_schema
+
+
+def starts_with(letter):
+    return Query(Node("n"), where=Comparison("n", "name", "STARTS WITH", Value(letter, quote="\"")),
+                 returns=[Projection("n", "name", count=True)])
+
+
+class TestIndexAdvisor(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = outlaw_schema()
+
+    """
+    Test that the conditions of a query are turned into the indexes that could serve them.
+    """
+    def test_index_uses(self):
+        q = Query(Node("n", properties=[("species", Value("dog"))]), returns=[Projection("n")])
+        self.assertEqual(index_uses(q, self.schema), [("Animal", "species", RANGE, "=")])
+        q = Query(Node("n", ["Outlaw"]), where=Comparison("n", "name", "CONTAINS", Value("J")),
+                  returns=[Projection("n")])
+        self.assertEqual(index_uses(q, self.schema), [("Outlaw", "name", TEXT, "CONTAINS")])
+        q = Query(Node("n"), where=Exists("n", "bounty"), returns=[Projection("n")])
+        self.assertEqual(index_uses(q, self.schema), [("Person", "bounty", RANGE, "exists"),
+                                                      ("Outlaw", "bounty", RANGE, "exists")])
+
+    """
+    Test that the recommendations are ranked by the share of the queries they would serve.
+    """
+    def test_recommend(self):
+        species = Query(Node("n"), where=Comparison("n", "species", "IS NOT NULL"), returns=[Projection("n")])
+        queries = [starts_with("J"), starts_with("K"), species, "MATCH (n) RETURN n"]
+        recommendations = recommend(queries, self.schema)
+        self.assertEqual([(r["label"], r["property"], r["queries"], r["share"]) for r in recommendations],
+                         [("Animal", "name", 2, 0.5), ("Outlaw", "name", 2, 0.5), ("Person", "name", 2, 0.5),
+                          ("Animal", "species", 1, 0.25)])
+        self.assertEqual(recommendations[0]["statement"],
+                         "CREATE INDEX animal_name IF NOT EXISTS FOR (n:Animal) ON (n.name)")
+        self.assertEqual(recommendations[0]["operators"], {"STARTS WITH": 2})
+
+    """
+    Test that no index is recommended for IS NULL, which Neo4j can't use an index for.
+    """
+    def test_is_null(self):
+        q = Query(Node("n", ["Animal"]), where=Comparison("n", "species", "IS NULL"), returns=[Projection("n")])
+        self.assertEqual(index_uses(q, self.schema), [])
+        self.assertEqual(recommend([q], self.schema), [])
+
+    def write_log(self, text):
+        with tempfile.NamedTemporaryFile("w", suffix=".log", delete=False, encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    """
+    Test that the log can be plain questions or JSON lines, that repeated questions are kept, and that a JSON line
+    that was only partly written is skipped.
+    """
+    def test_log_questions(self):
+        path = self.write_log("Who are all the outlaws?\n\nHow many names start with J?\nWho are all the outlaws?\n")
+        self.assertEqual(log_questions(path), ["Who are all the outlaws?", "How many names start with J?",
+                                               "Who are all the outlaws?"])
+        path = self.write_log(json.dumps(dict(question="Who are all the outlaws?")) + "\n" +
+                              json.dumps(dict(question="How many names start with J?")) + "\n" +
+                              '{"question": "Who are')
+        self.assertEqual(log_questions(path), ["Who are all the outlaws?", "How many names start with J?"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import threading
+import unittest
+from contextlib import redirect_stdout
+from sprint4.Tokenize import Tokenize
+from sprint4.execute import LocalExecutor
+from sprint4.introspect import (NODE_PROPERTIES, RELATIONSHIP_PROPERTIES, SAMPLED_NODES, SAMPLED_RELATIONSHIPS,
+                                SchemaLoader, load_in_background)
+from sprint4.schema import SchemaRegistry, outlaw_schema
+from sprint4.translators import TranslatorRegistry, plugins
+
+PROCEDURES = {
+    NODE_PROPERTIES: [dict(nodeLabels=["Person"], propertyName="name"),
+                      dict(nodeLabels=["Person"], propertyName="size"),
+                      dict(nodeLabels=["Person", "Outlaw"], propertyName="bounty"),
+                      dict(nodeLabels=["Animal"], propertyName="species"),
+                      dict(nodeLabels=["Animal"], propertyName="name")],
+    RELATIONSHIP_PROPERTIES: [dict(relType=":`LIKES`", propertyName="because"),
+                              dict(relType=":`BROTHER`", propertyName=None)]}
+SAMPLED = {
+    SAMPLED_NODES: [dict(label="Person", keys=[["name", "size"], ["name", "bounty"]]), dict(label="Animal", keys=[[]])],
+    SAMPLED_RELATIONSHIPS: [dict(type="PARENTS", keys=[["gift"]])]}
+OUTLAW = {
+    NODE_PROPERTIES: [dict(nodeLabels=[label], propertyName=key) for label, keys in
+                      [("Person", ["name", "female", "size", "bounty"]), ("Animal", ["name", "species"]),
+                       ("Outlaw", ["name", "bounty", "size"])] for key in keys],
+    RELATIONSHIP_PROPERTIES: [dict(relType=":`LIKES`", propertyName="because"),
+                              dict(relType=":`DISLIKES`", propertyName="because"),
+                              dict(relType=":`PARENTS`", propertyName="gift"),
+                              dict(relType=":`BROTHER`", propertyName=None)]}
+
+
+class BlockingExecutor(LocalExecutor):
+    """A stand-in for a database that takes its time to answer, until it is released."""
+
+    def __init__(self, responses):
+        LocalExecutor.__init__(self, responses=responses)
+        self.release = threading.Event()
+
+    def run(self, query, params=None, timeout=None):
+        self.release.wait(5)
+        return LocalExecutor.run(self, query, params, timeout)
+
+
+class TestIntrospect(unittest.TestCase):
+
+    """
+    Test that the schema is read from the db.schema procedures, in one query for nodes and one for relationships.
+    """
+    def test_procedures(self):
+        executor = LocalExecutor(responses=PROCEDURES)
+        loader = SchemaLoader(executor)
+        schema = loader.load("loaded")
+        self.assertEqual(loader.method, "procedures")
+        self.assertEqual(schema.labels, ("Person", "Outlaw", "Animal"))
+        self.assertEqual(dict(schema.labelProperties), dict(Person=("name", "size", "bounty"), Outlaw=("bounty",),
+                                                            Animal=("species", "name")))
+        self.assertEqual(schema.relationships, ("likes", "brother"))
+        self.assertEqual(dict(schema.relationshipProperties), dict(LIKES=("because",), BROTHER=()))
+        self.assertIn("species", schema.properties)
+        self.assertEqual(executor.pool.stats()["opened"], 1)
+
+    """
+    Test that a sample of the graph is read when the procedures can't be called.
+    """
+    def test_sampling(self):
+        loader = SchemaLoader(LocalExecutor(responses=SAMPLED), sample=100)
+        schema = loader.load("sampled")
+        self.assertEqual(loader.method, "sampling")
+        self.assertEqual(dict(schema.labelProperties), dict(Person=("name", "size", "bounty"), Animal=()))
+        self.assertEqual(schema.relationships, ("parents",))
+
+    """
+    Test that questions are translated against the old schema until the new one has loaded.
+    """
+    def test_background(self):
+        schemas = SchemaRegistry()
+        old = schemas.register(outlaw_schema())
+        executor = BlockingExecutor(PROCEDURES)
+        future = load_in_background(SchemaLoader(executor), "outlaw", schemas)
+        self.assertIs(schemas.get("outlaw"), old)
+        executor.release.set()
+        self.assertIs(future.result(5), schemas.get("outlaw"))
+        self.assertEqual(schemas.get("outlaw").relationships, ("likes", "brother"))
+
+    """
+    Test that a failed load is reported through the future, and leaves the old schema registered.
+    """
+    def test_background_failure(self):
+        schemas = SchemaRegistry()
+        old = schemas.register(outlaw_schema())
+        future = load_in_background(SchemaLoader(LocalExecutor()), "outlaw", schemas)
+        self.assertRaises(Exception, future.result, 5)
+        self.assertIs(schemas.get("outlaw"), old)
+
+    """
+    Test that reading the database again refreshes the registered schema, and reports what changed.
+    """
+    def test_refresh(self):
+        schemas = SchemaRegistry()
+        schemas.register(outlaw_schema())
+        diff = SchemaLoader(LocalExecutor(responses=PROCEDURES)).refresh("outlaw", schemas)
+        self.assertEqual(diff["addedRelationships"], set())
+        self.assertEqual(diff["removedRelationships"], {"dislikes", "parents"})
+        self.assertEqual(diff["removedProperties"], {"female"})
+        self.assertEqual(schemas.get("outlaw").synonyms["someone"], ("Person",))
+
+    """
+    Test that refreshing the outlaw schema from its own database finds nothing changed, and keeps its cached scores.
+    """
+    def test_refresh_unchanged(self):
+        schemas = SchemaRegistry()
+        schemas.register(outlaw_schema()).similarityCache.put(("parent", "parents"), 1.0)
+        diff = SchemaLoader(LocalExecutor(responses=OUTLAW)).refresh("outlaw", schemas)
+        self.assertEqual(diff, dict(addedLabels=set(), removedLabels=set(), addedRelationships=set(),
+                                    removedRelationships=set(), addedProperties=set(), removedProperties=set(),
+                                    changedLabels=set()))
+        self.assertEqual(schemas.get("outlaw").relationships, outlaw_schema().relationships)
+        self.assertEqual(schemas.get("outlaw").similarityCache.get(("parent", "parents")), 1.0)
+
+    """
+    Test that a relationship question is translated against a schema loaded from the database.
+    """
+    def test_translate_relationship(self):
+        schemas = SchemaRegistry()
+        schemas.register(SchemaLoader(LocalExecutor(responses=PROCEDURES)).load("loaded"))
+        translators = TranslatorRegistry()
+        translators.register([translator for translator in plugins.enabled() if translator.queryId == "query7"][0])
+        t = Tokenize.from_tagged([("Who", "WP"), ("likes", "VBZ"), ("someone", "NN")], schemaId="loaded",
+                                 schemas=schemas, translators=translators)
+        with redirect_stdout(io.StringIO()):  # the translators print while debugging
+            self.assertEqual(t.translate(t.wordsTagged), [("query7", "MATCH (p) -[:likes] -> (n) RETURN n")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import time
+import unittest
+from sprint4.loadgen import percentile, run_load, corpus_questions
+
+
+class TestLoadgen(unittest.TestCase):
+
+    """
+    Test that the corpus is read from the questions in the unit tests.
+    """
+    def test_corpus(self):
+        questions = corpus_questions()
+        self.assertIn("Who are all the outlaws?", questions)
+        self.assertEqual(len(questions), len(set(questions)))
+
+    """
+    Test nearest-rank percentiles.
+    """
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual((percentile(values, 50), percentile(values, 95), percentile(values, 99)), (50, 95, 99))
+        self.assertIsNone(percentile([], 50))
+
+    """
+    Test that every request is counted, and errors are reported instead of stopping the run.
+    """
+    def test_closed_loop(self):
+        def target(question):
+            if question == "bad":
+                raise ValueError(question)
+
+        report = run_load(["good", "bad", "good", "good"], target, concurrency=3, requests=40)
+        self.assertEqual(report["requests"], 40)
+        self.assertEqual(report["errors"], 10)
+        self.assertEqual(report["errorRate"], 0.25)
+        self.assertEqual(report["firstErrors"][0], "ValueError: bad")
+
+    """
+    Test that with an arrival rate, questions are sent at that rate.
+    """
+    def test_open_loop(self):
+        report = run_load(["a"], lambda question: time.sleep(0.001), concurrency=2, rate=200, requests=20)
+        self.assertEqual(report["requests"], 20)
+        self.assertGreaterEqual(report["seconds"], 19 / 200)
+        self.assertLess(report["latencyMs"]["p50"], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
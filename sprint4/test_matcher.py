@@ -0,0 +1,103 @@
+import unittest
+from sprint4.matcher import EXACT, FUZZY, LEXICON, NONE, WORDNET, related_terms
+from sprint4.schema import Schema, outlaw_schema
+
+
+class TestMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = outlaw_schema()
+        self.asked = []
+
+    def similarity(self, wordx, wordy):
+        self.asked.append((wordx, wordy))
+        return 1.0 if (wordx, wordy) in [("female", "Person"), ("creature", "Person")] else 0.2
+
+    """
+    Test that schema terms are decided by the exact tier, without WordNet.
+    """
+    def test_exact(self):
+        decision = self.schema.matcher.labels("outlaw", self.similarity)
+        self.assertEqual((decision.terms, decision.tier), (("Outlaw",), EXACT))
+        decision = self.schema.matcher.labels("Outlaw", self.similarity)
+        self.assertEqual((decision.terms, decision.tier), (("Outlaw",), EXACT))
+        decision = self.schema.matcher.relationships("parent", self.similarity)
+        self.assertEqual(decision.terms, ("parents",))
+        self.assertEqual(self.schema.matcher.labels("parent", self.similarity).terms, ())
+        self.assertEqual(self.asked, [])
+
+    """
+    Test that the schema's own words can mean another term as well, as WordNet has always counted them, and that this
+    comes from the schema's relatedTerms rather than from asking WordNet.
+    """
+    def test_cross_term(self):
+        decision = self.schema.matcher.labels("female", self.similarity)
+        self.assertEqual((decision.terms, decision.tier), (("Animal",), LEXICON))
+        self.assertEqual(self.schema.matcher.labels("creature", self.similarity).terms, ("Animal",))
+        self.assertEqual(self.asked, [])
+
+    """
+    Test that the related terms are worked out by comparing every word of the vocabulary with the terms it isn't
+    declared to mean.
+    """
+    def test_related_terms(self):
+        related = related_terms(self.schema, self.similarity)
+        self.assertEqual(related, dict(female=["Person"], creature=["Person"]))
+        self.assertNotIn(("outlaw", "Outlaw"), self.asked)
+        self.assertIn(("outlaw", "Person"), self.asked)
+        self.assertIn(("bounty", "brother"), self.asked)
+        schema = Schema("outlaw", self.schema.labels, self.schema.relationships, self.schema.labelProperties,
+                        self.schema.relationshipProperties, synonyms=self.schema.synonyms, relatedTerms=related)
+        self.assertEqual(schema.matcher.labels("creature", None).terms, ("Person", "Animal"))
+
+    """
+    Test that question words and punctuation are decided by the lexicon tier, without WordNet.
+    """
+    def test_lexicon(self):
+        for word in ["who", "list", "?", "$"]:
+            decision = self.schema.matcher.relationships(word, self.similarity)
+            self.assertEqual((decision.terms, decision.tier), ((), LEXICON))
+        self.assertEqual(self.asked, [])
+
+    """
+    Test that the properties are taken from labelProperties, so that a schema doesn't have to list them anywhere else.
+    """
+    def test_properties_from_schema(self):
+        schema = Schema("horses", ["Horse"], [], dict(Horse=["colour"]), {})
+        self.assertNotIn("colour", schema.nonTerms)
+        decision = schema.matcher.labels("colour", self.similarity)
+        self.assertEqual((decision.terms, decision.tier), ((), LEXICON))
+        self.assertEqual(self.asked, [])
+
+    """
+    Test that a word no tier can decide, when there is no similarity function, is counted under its own tier.
+    """
+    def test_none(self):
+        decision = self.schema.matcher.labels("zebra", None)
+        self.assertEqual((decision.terms, decision.tier), ((), NONE))
+        self.assertEqual(self.schema.matcher.stats()[NONE], 1)
+
+    """
+    Test that precomputed similarity scores are used before WordNet, but only if every term has one.
+    """
+    def test_similarity_table(self):
+        schema = Schema("bundled", ["Person", "Animal"], [], {}, {},
+                        similarityTable={("dog", "Person"): 0.5, ("dog", "Animal"): 0.95, ("cat", "Animal"): 0.95})
+        decision = schema.matcher.labels("dog", self.similarity)
+        self.assertEqual((decision.terms, decision.tier), (("Animal",), LEXICON))
+        self.assertEqual(schema.matcher.labels("cat", self.similarity).tier, WORDNET)
+
+    """
+    Test that a question made only of the schema's own words and question words never asks WordNet, and that the tiers
+    are counted.
+    """
+    def test_no_wordnet(self):
+        tagMap = [("who", "WP"), ("are", "VBP"), ("all", "DT"), ("female", "NNS"), ("outlaw", "NNS"), ("?", ".")]
+        self.assertEqual(self.schema.matcher.count(tagMap, "labels", self.similarity), 2)
+        self.assertEqual(self.schema.matcher.count(tagMap, "relationships", self.similarity), 0)
+        self.assertEqual(self.asked, [])
+        self.assertEqual(self.schema.matcher.stats(), {EXACT: 2, LEXICON: 10, FUZZY: 0, WORDNET: 0, NONE: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
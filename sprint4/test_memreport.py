@@ -0,0 +1,57 @@
+import tracemalloc
+import unittest
+from sprint4.cache import LRUCache
+from sprint4.memreport import _deep_size, add, measure
+
+
+class TestMemreport(unittest.TestCase):
+
+    def setUp(self):
+        tracemalloc.start()
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    """
+    Test that what a step leaves allocated is reported, along with the line that allocated it.
+    """
+    def test_measure(self):
+        kept = []
+        result, entry = measure("allocate", lambda: kept.append(bytearray(256 * 1024)) or "done")
+        self.assertEqual(result, "done")
+        self.assertEqual(entry["stage"], "allocate")
+        self.assertGreaterEqual(entry["netKB"], 256)
+        self.assertIn("test_memreport.py", entry["top"][0])
+
+    """
+    Test that the peak of a step doesn't count what was already allocated before it started.
+    """
+    @unittest.skipUnless(hasattr(tracemalloc, "reset_peak"), "needs Python 3.9")
+    def test_peak_is_the_steps_own(self):
+        kept = bytearray(1024 * 1024)
+        result, entry = measure("temporary", lambda: len(bytearray(256 * 1024)))
+        self.assertEqual(result, 256 * 1024)
+        self.assertGreaterEqual(entry["peakKB"], 256)
+        self.assertLess(entry["peakKB"], 512)
+        self.assertEqual(len(kept), 1024 * 1024)
+
+    """
+    Test that the entries of one step are added up over the corpus.
+    """
+    def test_add(self):
+        total = add(None, dict(stage="pos_tag", netKB=1.5, peakKB=10.0, blocks=3, top=[]))
+        total = add(total, dict(stage="pos_tag", netKB=0.5, peakKB=4.0, blocks=1, top=[]))
+        self.assertEqual((total["netKB"], total["peakKB"], total["blocks"], total["count"]), (2.0, 10.0, 4, 2))
+
+    """
+    Test that sizing a cache doesn't count as using it.
+    """
+    def test_cache_size(self):
+        cache = LRUCache()
+        cache.put(("outlaw", "Person"), 0.5)
+        self.assertGreater(_deep_size(cache), 0)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from sprint4.Tokenize import Tokenize
+from sprint4.cypher import Exists, Node, Projection, Query
+from sprint4.execute import LocalExecutor
+from sprint4.paging import InvalidToken, decode_token
+from sprint4.translators import Translator, TranslatorRegistry
+
+SPECIES = [("list", "NN"), ("all", "DT"), ("with", "IN"), ("specie", "NN")]
+
+
+def species_translator(t, tagMap):
+    return Query(Node("n"), where=Exists("n", "species"), returns=[Projection("n")], whereKeyword="where")
+
+
+def count_translator(t, tagMap):
+    return Query(Node("n"), returns=[Projection("n", "species", count=True)])
+
+
+class TestPaging(unittest.TestCase):
+
+    def setUp(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("species", "query3", "sprint4.test_paging:species_translator"))
+        translators.register(Translator("count", "query5", "sprint4.test_paging:count_translator"))
+        self.t = Tokenize.from_tagged(SPECIES, translators=translators)
+
+    """
+    Test that only the unbounded queries are paginated, and that they come with a token for the next page.
+    """
+    def test_first_page(self):
+        results = self.t.runTranslator(SPECIES, pageSize=2)
+        self.assertEqual(results, ["query3: MATCH (n) where exists (n.species) RETURN n ORDER BY id(n) SKIP 0 LIMIT 2",
+                                   "query5: MATCH (n) RETURN COUNT (n.species)"])
+        self.assertEqual(list(results.tokens), ["query3"])
+        self.assertEqual(decode_token(results.tokens["query3"])["page"], 1)
+        self.assertEqual(self.t.runTranslator(SPECIES).tokens, {})
+
+    """
+    Test that following the tokens walks through every page of the results.
+    """
+    def test_next_page(self):
+        executor = LocalExecutor([dict(id=i, properties=dict(species="dog" + str(i))) for i in range(5)])
+        (queryId, query, records), = [r for r in self.t.execute(SPECIES, executor, pageSize=2) if r[0] == "query3"]
+        pages = [[r["n"]["species"] for r in records]]
+        token = self.t.translate(SPECIES, pageSize=2).tokens[queryId]
+        while len(pages[-1]) == 2:
+            queryId, query, token = self.t.next_page(token)
+            pages.append([r["n"]["species"] for r in executor.run(query)])
+        self.assertEqual(pages, [["dog0", "dog1"], ["dog2", "dog3"], ["dog4"]])
+
+    """
+    Test that tokens that can't be read, or that don't belong to these translators, are refused.
+    """
+    def test_invalid_tokens(self):
+        token = self.t.translate(SPECIES, pageSize=2).tokens["query3"]
+        for bad in ["not a token", token[:-4]]:
+            self.assertRaises(InvalidToken, self.t.next_page, bad)
+        self.t.translators.disable(["species"])
+        self.assertRaises(InvalidToken, self.t.next_page, token)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stderr
+from sprint4.Tokenize import Tokenize, run_pipe
+from sprint4.translators import Translator, TranslatorRegistry
+
+TAGGED = {"Who are all the outlaws?": [("who", "WP"), ("are", "VBP"), ("all", "DT"), ("outlaws", "NNS")],
+          "How many names start with J?": [("how", "WRB"), ("many", "JJ"), ("names", "NNS"), ("start", "VBP"),
+                                           ("with", "IN"), ("j", "NN")]}
+
+
+def outlaw_translator(t, tagMap):
+    print("debugging output")
+    if ("outlaw", "NNS") in tagMap:
+        return "MATCH (n :Outlaw) RETURN n.name"
+    return -1
+
+
+class FlushCounter(io.StringIO):
+    """Counts the lines that had been written when each flush happened."""
+
+    def __init__(self):
+        io.StringIO.__init__(self)
+        self.flushedAt = []
+
+    def flush(self):
+        self.flushedAt.append(self.getvalue().count("\n"))
+        io.StringIO.flush(self)
+
+
+class RecordingLog():
+
+    def __init__(self):
+        self.entries = []
+
+    def record(self, entry):
+        self.entries.append(entry)
+
+
+class TestPipe(unittest.TestCase):
+
+    """
+    Test that every question gets exactly one line of JSON, blank lines are skipped, and errors are reported in the
+    result instead of stopping the pipe.
+    """
+    def test_one_line_per_question(self):
+        out = io.StringIO()
+        run_pipe(io.StringIO("Who are all the outlaws?\n\n   \nHow many names start with J?\n"), out, "no such schema")
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        first = json.loads(lines[0])
+        self.assertEqual(first["question"], "Who are all the outlaws?")
+        self.assertEqual(first["queries"], [])
+        self.assertTrue(first["error"].startswith("KeyError"))
+        self.assertEqual(json.loads(lines[1])["question"], "How many names start with J?")
+
+    """
+    Test that translated questions give their queries and timings, that each line is flushed before the next question
+    is read, that the translators' debugging output doesn't get into the results, and that each is logged.
+    """
+    def test_translated(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("outlaws", "query1", "sprint4.test_pipe:outlaw_translator"))
+        out = FlushCounter()
+        log = RecordingLog()
+        read = []
+
+        def lines():
+            for question in TAGGED:
+                read.append(out.getvalue().count("\n"))
+                yield question + "\n"
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            run_pipe(lines(), out, log=log,
+                     tokenize=lambda question, schemaId: Tokenize.from_tagged(TAGGED[question], schemaId,
+                                                                              translators=translators))
+        first, second = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(first["queries"], ["query1: MATCH (n :Outlaw) RETURN n.name"])
+        self.assertEqual((first["error"], second["queries"], second["error"]), (None, [], None))
+        self.assertEqual(sorted(first["timings"]), ["tokenize", "translate"])
+        self.assertTrue(all(ms >= 0 for ms in first["timings"].values()))
+        self.assertEqual(read, [0, 1])
+        self.assertEqual(out.flushedAt, [1, 2])
+        self.assertNotIn("debugging output", out.getvalue())
+        self.assertEqual(stderr.getvalue().count("debugging output"), 2)
+        self.assertEqual([e["fired"] for e in log.entries], [["query1"], []])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from sprint4.cypher import Comparison, Exists, Node, Path, Projection, Query, Value
+from sprint4.execute import LocalExecutor
+from sprint4.rewrite import narrow_labels
+from sprint4.schema import outlaw_schema
+
+
+class TestRewrite(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = outlaw_schema()
+
+    """
+    Test that a node is given the only label that has the property it must have.
+    """
+    def test_one_label(self):
+        q = Query(Node("n", properties=[("species", Value("dog"))]), returns=[Projection("n")])
+        self.assertEqual(narrow_labels(q, self.schema), "MATCH (n :Animal {species :'dog'}) RETURN n")
+        q = Query(Node("n"), where=Exists("n", "species"), returns=[Projection("n")], whereKeyword="where")
+        self.assertEqual(narrow_labels(q, self.schema), "MATCH (n :Animal) where exists (n.species) RETURN n")
+
+    """
+    Test that several labels are tested in the WHERE clause, with the values still sent as parameters.
+    """
+    def test_several_labels(self):
+        q = Query(Node("n"), where=Comparison("n", "bounty", "STARTS WITH", Value("1", quote="\"")),
+                  returns=[Projection("n", "bounty", count=True)])
+        narrowed = narrow_labels(q, self.schema)
+        self.assertEqual(narrowed, "MATCH (n) WHERE (n:Person OR n:Outlaw) AND n.bounty STARTS WITH \"1\" "
+                                   "RETURN COUNT (n.bounty)")
+        self.assertEqual(narrowed.parameterized()[1], {"value": "1"})
+
+    """
+    Test the queries that are left as they are.
+    """
+    def test_unchanged(self):
+        for q in [Query(Node("n"), where=Comparison("n", "species", "IS NULL"), returns=[Projection("n")]),
+                  Query(Node("n"), where=Exists("n", "name"), returns=[Projection("n")]),
+                  Query(Node("n"), where=Exists("n", "colour"), returns=[Projection("n")]),
+                  Query(Node("n", ["Person"]), where=Exists("n", "species"), returns=[Projection("n")]),
+                  Query(Path(Node("p"), "parents", Node("n")), returns=[Projection("p", "name")])]:
+            self.assertEqual(narrow_labels(q, self.schema), q)
+        self.assertEqual(narrow_labels("MATCH (n) RETURN n", self.schema), "MATCH (n) RETURN n")
+
+    """
+    Test that the narrowed queries give the same records as the originals.
+    """
+    def test_same_records(self):
+        executor = LocalExecutor([dict(id=1, labels=["Person"], properties=dict(name="Jeffery", bounty="100")),
+                                  dict(id=2, labels=["Outlaw"], properties=dict(name="Jesse", bounty="1000")),
+                                  dict(id=3, labels=["Animal"], properties=dict(name="Rex", species="dog"))])
+        for q in [Query(Node("n"), where=Comparison("n", "bounty", "STARTS WITH", Value("1")),
+                        returns=[Projection("n", "name")]),
+                  Query(Node("n", properties=[("species", Value("dog"))]), returns=[Projection("n")])]:
+            self.assertEqual(list(executor.run(narrow_labels(q, self.schema))), list(executor.run(q)))
+
+
+if __name__ == '__main__':
+    unittest.main()
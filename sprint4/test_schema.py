@@ -0,0 +1,124 @@
+import unittest
+from sprint4.cache import LRUCache
+from sprint4.schema import DEFAULT_SCHEMA, Schema, SchemaRegistry, outlaw_schema, registry
+
+
+class TestSchema(unittest.TestCase):
+
+    """
+    Test that the Outlaw schema is registered as the default schema.
+    """
+    def test_default_schema(self):
+        schema = registry.get(DEFAULT_SCHEMA)
+        self.assertEqual(schema.labels, ("Person", "Animal", "Outlaw"))
+        self.assertEqual(schema.labelProperties["Animal"], ("name", "species"))
+
+    """
+    Test the indexes that a schema precomputes.
+    """
+    def test_indexes(self):
+        schema = outlaw_schema()
+        self.assertEqual(schema.labelIndex["outlaw"], "Outlaw")
+        self.assertIn("dislikes", schema.relationshipIndex)
+        self.assertEqual(schema.properties, {"name", "female", "size", "bounty", "species"})
+        self.assertEqual(schema.labelsByProperty["species"], ("Animal",))
+        self.assertEqual(schema.labelsByProperty["bounty"], ("Person", "Outlaw"))
+
+    """
+    Test that a schema can't be changed once it has been made.
+    """
+    def test_immutable(self):
+        schema = outlaw_schema()
+        with self.assertRaises(AttributeError):
+            schema.labels = ("Movie",)
+        with self.assertRaises(TypeError):
+            schema.labelProperties["Movie"] = ("title",)
+        with self.assertRaises(AttributeError):
+            schema.labelProperties["Person"].append("age")
+        self.assertEqual(schema.labelProperties["Person"], ("name", "female", "size", "bounty"))
+
+    """
+    Test that looking up a schema that was never registered fails loudly.
+    """
+    def test_unknown_schema(self):
+        schemas = SchemaRegistry()
+        with self.assertRaises(KeyError):
+            schemas.get("movies")
+
+    """
+    Test that every schema gets its own similarity cache, so one can't evict the other's entries.
+    """
+    def test_isolated_caches(self):
+        schemas = SchemaRegistry()
+        movies = schemas.register(Schema("movies", ["Movie", "Actor"], ["acted_in"],
+                                         dict(Movie=["title"], Actor=["name"]), dict(ACTED_IN=["role"]), cacheSize=2))
+        outlaws = schemas.register(Schema("outlaws", ["Outlaw"], [], dict(Outlaw=["name"]), {}, cacheSize=2))
+        outlaws.similarityCache.put(("outlaw", "outlaw"), 1.0)
+        for i in range(10):
+            movies.similarityCache.put(("movie", str(i)), 0.5)
+        self.assertEqual(outlaws.similarityCache.get(("outlaw", "outlaw")), 1.0)
+        self.assertEqual(len(movies.similarityCache), 2)
+        self.assertEqual(schemas.names(), ["movies", "outlaws"])
+
+    """
+    Test that the least recently used entry is the one that gets evicted.
+    """
+    def test_lru_eviction(self):
+        cache = LRUCache(maxSize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+
+    """
+    Test that a refresh keeps the similarity scores of the terms that are still there, only computes scores for the
+    new terms (and for the new words of the vocabulary), and swaps the new schema in while a translation that already
+    has the old one keeps it.
+    """
+    def test_refresh(self):
+        schemas = SchemaRegistry()
+        table = {("thief", "Person"): 0.5, ("thief", "Outlaw"): 0.9, ("thief", "Animal"): 0.2,
+                 ("thief", "likes"): 0.1, ("thief", "dislikes"): 0.1, ("thief", "parents"): 0.1,
+                 ("thief", "brother"): 0.1}
+        old = outlaw_schema()
+        schemas.register(Schema(old.name, old.labels, old.relationships, old.labelProperties,
+                                old.relationshipProperties, similarityTable=table, synonyms=old.synonyms,
+                                nonTerms=old.nonTerms))
+        inFlight = schemas.get("outlaw")
+        inFlight.similarityCache.put(("dog", "Animal"), 0.8)
+        inFlight.similarityCache.put(("dog", "Outlaw"), 0.3)
+        asked = []
+
+        def similarity(word, term):
+            asked.append((word, term))
+            return 0.4
+
+        labelProperties = dict(inFlight.labelProperties, Horse=["name", "colour"])
+        del labelProperties["Animal"]
+        diff = schemas.refresh("outlaw", ["Person", "Outlaw", "Horse"], inFlight.relationships, labelProperties,
+                               inFlight.relationshipProperties, similarity)
+        self.assertEqual((diff["addedLabels"], diff["removedLabels"]), ({"Horse"}, {"Animal"}))
+        self.assertEqual((diff["addedProperties"], diff["removedProperties"]), ({"colour"}, {"species"}))
+        self.assertEqual([pair for pair in asked if pair[0] == "thief"], [("thief", "Horse")])
+        self.assertEqual(set(term for word, term in asked if word not in ("horse", "colour")), {"Horse"})
+        self.assertEqual(len([pair for pair in asked if pair[0] == "colour"]), 7)
+
+        refreshed = schemas.get("outlaw")
+        self.assertIsNot(refreshed, inFlight)
+        self.assertEqual(refreshed.similarityTable[("thief", "Outlaw")], 0.9)
+        self.assertNotIn(("thief", "Animal"), refreshed.similarityTable)
+        self.assertNotIn("female", refreshed.relatedTerms)
+        self.assertEqual(refreshed.similarityCache.get(("dog", "Outlaw")), 0.3)
+        self.assertNotIn(("dog", "Animal"), refreshed.similarityCache)
+        self.assertEqual(refreshed.matcher.labels("beast", None).terms, ())
+        self.assertIn("colour", refreshed.properties)
+        self.assertEqual(refreshed.nonTerms, old.nonTerms)
+        self.assertEqual(inFlight.labels, ("Person", "Animal", "Outlaw"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import re
+import unittest
+from sprint4.sentences import stream_sentences
+
+
+def split(text):
+    """A stand-in for the sentence tokenizer, which needs nltk_data: a sentence ends with ?, ! or . and a space, except
+    after "Mr."."""
+    return [s for s in re.split(r"(?<!Mr\.)(?<=[?!.])\s+", text) if s]
+
+
+class TestSentences(unittest.TestCase):
+
+    """
+    Test that the sentences are the same as splitting each whole paragraph at once, wherever the lines break.
+    """
+    def test_same_as_whole_paragraph(self):
+        text = "Who are all the outlaws? How many names start with J? Mr. Smith asked who has a bounty. List all! Ok"
+        words = text.split(" ")
+        for width in range(1, len(words) + 1):
+            lines = [" ".join(words[i:i + width]) for i in range(0, len(words), width)]
+            self.assertEqual(list(stream_sentences(lines + ["", "Next one."], split)), split(text) + ["Next one."],
+                             width)
+
+    """
+    Test that a sentence that runs over many lines isn't split again from its start for every line.
+    """
+    def test_only_the_tail_is_split(self):
+        splits = []
+
+        def recording(text):
+            splits.append(text)
+            return split(text)
+
+        lines = ["word%d and more words" % i for i in range(200)] + ["the end. Then", "another."]
+        sentences = list(stream_sentences(lines, recording))
+        self.assertEqual(len(sentences), 2)
+        self.assertTrue(sentences[0].startswith("word0 and") and sentences[0].endswith("the end."))
+        self.assertEqual(sentences[1], "Then another.")
+        self.assertLess(max(len(text) for text in splits), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
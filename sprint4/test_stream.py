@@ -0,0 +1,71 @@
+import threading
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from sprint4.Tokenize import Tokenize
+from sprint4.stream import StreamHandler, StreamServer, event, events
+from sprint4.translators import Translator, TranslatorRegistry
+
+started = []
+
+
+def fast_translator(t, tagMap):
+    started.append("fast")
+    return "MATCH (n :Outlaw) RETURN n.name"
+
+
+def slow_translator(t, tagMap):
+    started.append("slow")
+    return "MATCH (n :Animal) RETURN n.name"
+
+
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        del started[:]
+
+    """
+    Test that each query is given as soon as its translator has finished, before the next translator is run.
+    """
+    def test_stream_translator(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("fast", "query1", "sprint4.test_stream:fast_translator"))
+        translators.register(Translator("slow", "query2", "sprint4.test_stream:slow_translator"))
+        t = Tokenize.from_tagged([("outlaw", "NNS")], translators=translators)
+        stream = t.streamTranslator(t.wordsTagged)
+        self.assertEqual(next(stream), "query1: MATCH (n :Outlaw) RETURN n.name")
+        self.assertEqual(started, ["fast"])
+        self.assertEqual(list(stream), ["query2: MATCH (n :Animal) RETURN n.name"])
+        self.assertEqual(t.runTranslator([("outlaw", "NNS")]), ["query1: MATCH (n :Outlaw) RETURN n.name",
+                                                                "query2: MATCH (n :Animal) RETURN n.name"])
+
+    """
+    Test that a failed translation ends the stream with an error event.
+    """
+    def test_error_event(self):
+        self.assertEqual(event("done", dict(skipped=[])), "event: done\ndata: {\"skipped\": []}\n\n")
+        streamed = list(events("Who are all the outlaws?", "no such schema"))
+        self.assertEqual(len(streamed), 1)
+        self.assertTrue(streamed[0].startswith("event: error\ndata: {\"error\": \"KeyError"))
+
+    """
+    Test that the server streams the events, and refuses requests without a question.
+    """
+    def test_server(self):
+        server = StreamServer(("localhost", 0), StreamHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://localhost:%d/stream" % server.server_address[1]
+        try:
+            with urlopen(url + "?question=Who+are+all+the+outlaws%3F&schema=none", timeout=10) as response:
+                self.assertEqual(response.headers["Content-Type"], "text/event-stream; charset=utf-8")
+                self.assertTrue(response.read().decode("utf-8").startswith("event: error\n"))
+            with self.assertRaises(HTTPError) as raised:
+                urlopen(url, timeout=10)
+            self.assertEqual(raised.exception.code, 400)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from sprint4 import resources
+from sprint4.schema import outlaw_schema
+from sprint4.tagger import SchemaTagger, compare_taggers, load_tagger, save_tagger, train_fast_tagger
+
+TRAINING = [[("who", "WP"), ("are", "VBP"), ("all", "DT"), ("the", "DT"), ("people", "NNS"), ("that", "WDT"),
+             ("are", "VBP"), ("outlaws", "VBN"), ("?", ".")],
+            [("who", "WP"), ("likes", "VBZ"), ("someone", "NN"), ("?", ".")],
+            [("how", "WRB"), ("many", "JJ"), ("names", "NNS"), ("start", "VBP"), ("with", "IN"), ("j", "NN")]]
+
+
+class TestTagger(unittest.TestCase):
+
+    def setUp(self):
+        self.fast = train_fast_tagger(TRAINING)
+
+    """
+    Test that the fast tagger tags the questions it was trained on the same way, and unseen words as nouns.
+    """
+    def test_fast_tagger(self):
+        for sentence in TRAINING:
+            self.assertEqual(self.fast.tag([w for w, t in sentence]), sentence)
+        self.assertEqual(self.fast.tag(["zebras"]), [("zebras", "NN")])
+
+    """
+    Test that labels and properties are tagged as nouns, but relationships are left alone.
+    """
+    def test_schema_tagger(self):
+        tagger = SchemaTagger(self.fast, outlaw_schema())
+        self.assertEqual(tagger.tag("who are all the people that are outlaws ?".split())[7], ("outlaws", "NNS"))
+        self.assertEqual(tagger.tag("who likes someone ?".split())[1], ("likes", "VBZ"))
+        self.assertEqual(tagger.nouns["bounties"], "NNS")
+        self.assertEqual(tagger.nouns["bounty"], "NN")
+
+    """
+    Test that the fast tagger is measured against a reference tagger: the share of words tagged the same way, and the
+    time each takes per question.
+    """
+    def test_compare(self):
+        reference = train_fast_tagger(TRAINING)
+        questions = [[w for w, t in sentence] for sentence in TRAINING] + [["who", "has", "a", "bounty", "?"]]
+        report = compare_taggers(self.fast, reference, questions, repeat=2)
+        self.assertEqual((report["questions"], report["words"], report["agreement"]), (4, 24, 1.0))
+        self.assertGreater(report["taggerMicros"], 0)
+        self.assertGreater(report["referenceMicros"], 0)
+        wrong = train_fast_tagger([[(w, "NN") for w, t in sentence] for sentence in TRAINING])
+        self.assertEqual(compare_taggers(wrong, reference, questions[1:2], repeat=1)["agreement"], 0.25)
+
+    """
+    Test that a saved tagger can be used by resources.pos_tag() instead of the perceptron tagger.
+    """
+    def test_use_tagger(self):
+        path = os.path.join(tempfile.mkdtemp(), "fast.pickle")
+        save_tagger(self.fast, path)
+        schema = outlaw_schema()
+        resources.use_tagger(load_tagger(path))
+        try:
+            words = "who are all the people that are outlaws ?".split()
+            self.assertEqual(resources.pos_tag(words), TRAINING[0])
+            self.assertEqual(resources.pos_tag(words, schema)[7], ("outlaws", "NNS"))
+        finally:
+            resources.use_tagger(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
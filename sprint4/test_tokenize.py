@@ -260,6 +260,16 @@ class TestTokenize(unittest.TestCase):
         t = Tokenize(string)
         self.assertEqual(t.match_label_and_property(t.wordsTagged), self.query1_5)
 
+    """
+    Test match_label_and_property with query1_5, with the schema's labels and properties tagged as nouns. Some
+    perceptron models tag "sizes" here as a verb (VBZ), which test25 fails on.
+    """
+    def test26_match_label_and_property(self):
+        string = "Give me a list of the names, bounties, and sizes for every outlaw."
+        t = Tokenize(string, schemaTagging=True)
+        self.assertEqual(t.wordsTagged[7], ("size", "NNS"))
+        self.assertEqual(t.match_label_and_property(t.wordsTagged), self.query1_5)
+
 
     """
     Test for Kevin Feddema's numberStartsWith method for query5_1, defined above, with lowercase.
@@ -687,6 +697,18 @@ class TestTokenize(unittest.TestCase):
         t = Tokenize(string)
         self.assertEqual(t.return_multiple_labels(t.wordsTagged), -1)
 
+    """
+    Test that words WordNet knows aren't taken to be misspellings of the schema's terms, and misspellings are.
+    """
+    def test_schema_word(self):
+        t = Tokenize("Who lives with outlaws?")
+        for word in ["lives", "lakes", "bikes", "bother", "county", "patent", "seize", "sized", "outlay", "anima",
+                     "named", "letter"]:
+            self.assertEqual(t.schema_word(word), word)
+        self.assertEqual(t.schema_word("outlw"), "outlaw")
+        self.assertEqual(t.schema_word("bountey"), "bounty")
+        self.assertNotIn("query7", [queryId for queryId, query in t.translate(t.wordsTagged)])
+
 
 if __name__ == '__main__':
     unittest.main()
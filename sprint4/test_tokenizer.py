@@ -0,0 +1,47 @@
+import unittest
+from nltk.tokenize import NLTKWordTokenizer
+from sprint4.loadgen import corpus_questions
+from sprint4.tokenizer import fast_tokenize
+
+
+class TestTokenizer(unittest.TestCase):
+
+    """
+    Test that the fast tokenizer gives exactly the same words as nltk for every question in the tests that it handles,
+    as written and lowercased, and that it handles nearly all of them.
+    """
+    def test_corpus_parity(self):
+        treebank = NLTKWordTokenizer()
+        handled = 0
+        questions = corpus_questions()
+        for question in questions:
+            for text in (question, question.lower()):
+                words = fast_tokenize(text)
+                if words is not None:
+                    handled += 1
+                    self.assertEqual(words, treebank.tokenize(text), text)
+        self.assertGreater(handled, 1.8 * len(questions))
+
+    """
+    Test the shapes that our questions have.
+    """
+    def test_shapes(self):
+        self.assertEqual(fast_tokenize('how many outlaws have a bounty of less than $10,000 on them?'),
+                         ["how", "many", "outlaws", "have", "a", "bounty", "of", "less", "than", "$", "10,000", "on",
+                          "them", "?"])
+        self.assertEqual(fast_tokenize('who is named "bob"?'), ["who", "is", "named", "``", "bob", "''", "?"])
+        self.assertEqual(fast_tokenize("what are joe's and the outlaws' sizes."),
+                         ["what", "are", "joe", "'s", "and", "the", "outlaws", "'", "sizes", "."])
+        self.assertEqual(fast_tokenize("i cannot, don't"), ["i", "can", "not", ",", "do", "n't"])
+
+    """
+    Test that shapes it doesn't handle are left to nltk.
+    """
+    def test_fallback(self):
+        for text in ["mr. smith is an outlaw", "the u.s. outlaws", "(who)", "what’s that",
+                     "a;b", "lemme's"]:
+            self.assertIsNone(fast_tokenize(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
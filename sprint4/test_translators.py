@@ -0,0 +1,159 @@
+import threading
+import time
+import unittest
+from sprint4.Tokenize import Tokenize
+from sprint4.schema import Schema, SchemaRegistry, outlaw_schema, registry
+from sprint4.translators import Translator, TranslatorRegistry, plugins
+
+OUTLAWS = [("who", "WP"), ("are", "VBP"), ("all", "DT"), ("outlaw", "NNS"), ("?", ".")]
+
+
+def bundled_outlaw_schema():
+    """The outlaw schema with the similarity scores of its own words precomputed, as a bundle has them, so that the
+    matcher doesn't need WordNet for them. None of them is close to another term."""
+    old = outlaw_schema()
+    words = set(old.labelIndex) | old.relationshipIndex | set(r[:-1] for r in old.relationships) | set(old.synonyms) \
+        | old.properties
+    table = dict(((word, term), 0.0) for word in words for term in old.labels + old.relationships)
+    return Schema(old.name, old.labels, old.relationships, old.labelProperties, old.relationshipProperties,
+                  similarityTable=table, synonyms=old.synonyms)
+
+
+class NoWordNet(Tokenize):
+    """A Tokenize that fails if WordNet is asked about anything."""
+
+    def similarity_score(self, wordx, wordy):
+        raise AssertionError("WordNet was asked about %s and %s" % (wordx, wordy))
+
+
+def extra_translator(t, tagMap):
+    return "MATCH (n) RETURN n"
+
+
+def slow_translator(t, tagMap):
+    time.sleep(0.005)
+    return -1
+
+
+def wordnet_translator(t, tagMap):
+    time.sleep(0.03)
+    return t.similarity_score("zebra", "Outlaw")
+
+
+class TestTranslators(unittest.TestCase):
+
+    def tokenize(self, translators=plugins):
+        """A Tokenize object for an already tagged question, so that no tagger is needed."""
+        schemas = SchemaRegistry()
+        schemas.register(bundled_outlaw_schema())
+        return Tokenize.from_tagged(OUTLAWS, schemas=schemas, translators=translators)
+
+    """
+    Test that a Tokenize object can be made from words that are already tagged, and that they are put in the same form
+    as the tagger's words are.
+    """
+    def test_from_tagged(self):
+        t = Tokenize.from_tagged([("Who", "WP"), ("are", "VBP"), ("the", "DT"), ("Outlaws", "NNS")])
+        self.assertEqual(t.words, ["Who", "are", "the", "Outlaws"])
+        self.assertEqual(t.wordsTagged, [("who", "WP"), ("are", "VBP"), ("the", "DT"), ("outlaw", "NNS")])
+        self.assertIs(t.schema, registry.get())
+
+    """
+    Test that a question whose words are all the schema's own words or question words is translated without WordNet,
+    against a schema that wasn't loaded from a bundle.
+    """
+    def test_no_wordnet(self):
+        schemas = SchemaRegistry()
+        schemas.register(outlaw_schema())
+        t = NoWordNet.from_tagged(OUTLAWS, schemas=schemas)
+        self.assertEqual(t.translate(t.wordsTagged), [("query1", "MATCH (n :Outlaw) RETURN n.name")])
+
+    """
+    Test that the built in translators are registered in the order they have always been run.
+    """
+    def test_builtin_order(self):
+        self.assertEqual([t.queryId for t in plugins.enabled()],
+                         ["query1", "query3", "query2", "query5", "query6", "query7"])
+
+    """
+    Test that translators whose preconditions aren't met are skipped, and the others still give their queries.
+    """
+    def test_preconditions(self):
+        t = self.tokenize()
+        applies = dict((tr.queryId, tr.applies(t, OUTLAWS)) for tr in plugins.enabled())
+        self.assertEqual(applies, dict(query1=True, query3=False, query2=False, query5=False, query6=False,
+                                       query7=False))
+        self.assertEqual(t.runTranslator(list(OUTLAWS)), ["query1: MATCH (n :Outlaw) RETURN n.name"])
+
+    """
+    Test that a plugin's module isn't imported unless it is enabled, and that disabled translators aren't run.
+    """
+    def test_lazy_plugins(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("missing", "query8", "no_such_module:translate"), enabled=False)
+        translators.register(Translator("extra", "query9", "sprint4.test_translators:extra_translator"))
+        t = self.tokenize(translators)
+        self.assertEqual(t.runTranslator(list(OUTLAWS)), ["query9: MATCH (n) RETURN n"])
+        translators.enable(["missing"])
+        with self.assertRaises(ImportError):
+            t.runTranslator(list(OUTLAWS))
+        with self.assertRaises(KeyError):
+            translators.enable(["nothing"])
+
+    """
+    Test that first match mode returns one query, and learns to run the translator that gives queries first.
+    """
+    def test_first_match(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("slow", "query8", "sprint4.test_translators:slow_translator"))
+        translators.register(Translator("extra", "query9", "sprint4.test_translators:extra_translator"))
+        translators.register(Translator("again", "query10", "sprint4.test_translators:extra_translator"))
+        t = self.tokenize(translators)
+        self.assertEqual(t.runTranslator(list(OUTLAWS)), ["query9: MATCH (n) RETURN n", "query10: MATCH (n) RETURN n"])
+        self.assertEqual(len(t.runTranslator(list(OUTLAWS), firstMatch=True)), 1)
+        self.assertEqual(translators.ordered()[-1].name, "slow")
+        self.assertEqual(translators.stats()["slow"]["hitRate"], 0.0)
+        self.assertEqual(translators.stats()["extra"]["hits"], translators.stats()["extra"]["runs"])
+
+    """
+    Test that translating never changes the tagMap, and that one object can translate from many threads at once.
+    """
+    def test_reentrant(self):
+        t = self.tokenize()
+        named = [("list", "NN"), ("all", "DT"), ("named", "VBN"), ("j", "NN")]
+        t.listAllWithProperty(named)
+        self.assertEqual(named, [("list", "NN"), ("all", "DT"), ("named", "VBN"), ("j", "NN")])
+
+        expected = t.runTranslator(OUTLAWS)
+        results = []
+
+        def translate():
+            for i in range(50):
+                results.append(t.runTranslator(OUTLAWS) == expected)
+
+        threads = [threading.Thread(target=translate) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [True] * 400)
+
+    """
+    Test that once the deadline passes, WordNet isn't asked, the rest of the translators are skipped, and the
+    queries found before it passed are still returned.
+    """
+    def test_deadline(self):
+        translators = TranslatorRegistry()
+        translators.register(Translator("extra", "query9", "sprint4.test_translators:extra_translator"))
+        translators.register(Translator("wordnet", "query8", "sprint4.test_translators:wordnet_translator"))
+        translators.register(Translator("again", "query10", "sprint4.test_translators:extra_translator"))
+        t = self.tokenize(translators)
+        results = t.runTranslator(OUTLAWS, deadline=0.01)
+        self.assertEqual(results, ["query9: MATCH (n) RETURN n"])
+        self.assertEqual(results.skipped, ["wordnet", "again"])
+        self.assertTrue(results.partial)
+        self.assertFalse(t.runTranslator(OUTLAWS, deadline=0.01, firstMatch=True).partial)
+
+
+if __name__ == '__main__':
+    unittest.main()
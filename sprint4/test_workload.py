@@ -0,0 +1,64 @@
+import io
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from sprint4.Tokenize import run_pipe
+from sprint4.workload import WorkloadLog, analyze, entry, read_log
+
+
+def asked(question, tags, queries, ms):
+    t = SimpleNamespace(words=question.split(), wordsTagged=tags)
+    return entry(t, queries, dict(tokenize=1.0, translate=ms), "outlaw")
+
+
+class TestWorkload(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".ndjson")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    """
+    Test that every recorded entry is written by the background thread once the log is closed.
+    """
+    def test_log_written(self):
+        log = WorkloadLog(self.path, batchSize=7)
+        for i in range(50):
+            log.record(dict(question="question %d" % i))
+        log.close()
+        self.assertEqual([e["question"] for e in read_log(self.path)], ["question %d" % i for i in range(50)])
+        self.assertEqual((log.written, log.dropped), (50, 0))
+
+    """
+    Test that the pipe records every question, including the ones that failed.
+    """
+    def test_pipe_records(self):
+        log = WorkloadLog(self.path)
+        run_pipe(io.StringIO("Who are all the outlaws?\n"), io.StringIO(), "no such schema", log)
+        log.close()
+        e, = read_log(self.path)
+        self.assertEqual((e["question"], e["fired"], e["schema"]), (None, [], "no such schema"))
+        self.assertTrue(e["error"].startswith("KeyError"))
+
+    """
+    Test the analyzer's report of the top and slowest questions, the hit rates and the cache-hit potential.
+    """
+    def test_analyze(self):
+        outlaws = [["who", "WP"], ["outlaw", "NNS"]]
+        entries = [asked("Who are all the OUTLAWS ?", outlaws, ["query1: MATCH (n :Outlaw) RETURN n.name"], 5.0),
+                   asked("who are all the outlaws ?", outlaws, ["query1: MATCH (n :Outlaw) RETURN n.name"], 2.0),
+                   asked("who are the outlaws", outlaws, ["query1: MATCH (n :Outlaw) RETURN n.name"], 3.0),
+                   asked("how many names", [["how", "WRB"], ["name", "NNS"]], [], 40.0)]
+        report = analyze(entries, top=2)
+        self.assertEqual(report["requests"], 4)
+        self.assertEqual(report["topQuestions"][0], dict(question="who are all the outlaws ?", count=2))
+        self.assertEqual(report["translators"], dict(query1=dict(fired=3, hitRate=0.75)))
+        self.assertEqual([s["question"] for s in report["slowest"]], ["how many names", "who are all the outlaws ?"])
+        self.assertEqual(report["cacheHitPotential"], dict(question=0.25, wordsTagged=0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
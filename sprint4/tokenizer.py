@@ -0,0 +1,101 @@
+"""
+tokenizer.py:
+A fast word tokenizer for the kind of questions we get, which gives exactly the same words as nltk.word_tokenize().
+
+File name: tokenizer.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+nltk.word_tokenize() splits the text into sentences with punkt, and then runs a few dozen regular expressions over
+each sentence. Our questions are almost always one short sentence of plain words, so fast_tokenize() splits the text on
+spaces and matches each piece against one precompiled regular expression, and a small table of contractions.
+
+It understands the shapes that our questions have: words (with hyphens), numbers like 10,000 and 3.5, "$" before a
+number, double quotes (which nltk turns into `` and ''), possessives and other clitics ("joe's", "outlaws'", "don't"),
+question marks, exclamation marks, commas, and a period at the very end. For anything else, such as a period in the
+middle (which might end a sentence or an abbreviation), brackets or other punctuation, it returns None, and tokenize()
+falls back to nltk.word_tokenize(). test_tokenizer.py checks that the two agree on every question in the tests.
+
+"""
+
+import re
+
+import nltk
+
+"""Words that nltk splits in two, and where it splits them."""
+CONTRACTIONS = {"cannot": 3, "gimme": 3, "gonna": 3, "gotta": 3, "lemme": 3, "wanna": 3}
+
+_PIECE = re.compile(r"""
+    (?P<open>")?
+    (?P<dollar>\$)?
+    (?:
+        (?P<neg>[a-zA-Z]+)(?P<nt>n't|N'T)
+      | (?P<body>\d+(?:[.,]\d+)+|[a-zA-Z0-9]+(?:-[a-zA-Z0-9]+)*)(?P<clitic>'[sSmMdD]|'ll|'LL|'re|'RE|'ve|'VE|')?
+    )
+    (?P<close>")?
+    (?P<punct>[?!,]*)
+    (?P<period>\.)?
+    (?P<after>")?
+    $""", re.VERBOSE)
+
+
+def fast_tokenize(text):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param text: The text to split into words.
+    :return: A list of words, exactly as nltk.word_tokenize() would give them, or None if the text has a shape that
+        this tokenizer doesn't handle.
+    """
+    pieces = [piece for piece in text.split(" ") if piece != ""]
+    words = []
+    for i, piece in enumerate(pieces):
+        m = _PIECE.match(piece)
+        if m is None:
+            return None
+        if m.group("period") is None and m.group("after") is not None:
+            return None
+        if m.group("period") is not None and i != len(pieces) - 1:
+            return None
+        if m.group("open"):
+            words.append("``")
+        if m.group("dollar"):
+            words.append("$")
+        if m.group("neg") is not None:
+            words.append(m.group("neg"))
+            words.append(m.group("nt"))
+        else:
+            body = m.group("body")
+            if any(part.lower() in CONTRACTIONS for part in body.split("-")):
+                if body.lower() not in CONTRACTIONS or m.group("clitic") is not None:
+                    return None
+                split = CONTRACTIONS[body.lower()]
+                words.append(body[:split])
+                words.append(body[split:])
+            else:
+                words.append(body)
+                if m.group("clitic"):
+                    words.append(m.group("clitic"))
+        if m.group("close"):
+            words.append("''")
+        words.extend(m.group("punct"))
+        if m.group("period"):
+            words.append(".")
+        if m.group("after"):
+            words.append("''")
+    return words
+
+
+def tokenize(text):
+    """
+    :param text: The text to split into words.
+    :return: A list of words, from fast_tokenize() if it can handle the text, or else from nltk.word_tokenize().
+    """
+    words = fast_tokenize(text)
+    if words is None:
+        return nltk.word_tokenize(text)
+    return words
@@ -0,0 +1,333 @@
+"""
+translators.py:
+The registry of translation methods ("translators") that Tokenize runs a question through.
+
+File name: translators.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Each translator is described by a Translator: its name, the id its queries are reported under, where its code is, and
+a few cheap preconditions. A precondition is a test that the translator would
+fail anyway if it were false (e.g. numberStartsWith() never returns a query unless the question asks for a count), so
+a translator whose preconditions aren't all met can be skipped without changing any results.
+
+The translators written as methods of Tokenize are found by method name. Any other translator is given as
+"module:function", and its module is only imported the first time it is used, and only if it is enabled; the function
+is called with the Tokenize object and the tagMap, and returns a query or -1 just like the methods do. Only the
+translators that are enabled are run, in the order they were registered. The NL2CQ_TRANSLATORS environment variable
+can be set to a comma separated list of the names of the translators to enable.
+
+The registry also keeps statistics on how often each translator returns a query when it is run (its hit rate), and how
+long it takes. When only the first query is wanted (Tokenize.runTranslator(firstMatch=True)), the translators are run
+in the order given by ordered(): the translators that are cheapest for their chance of giving a query go first.
+
+A request can be given a Deadline. The translators that haven't started by the time it passes are skipped, and one
+that is still comparing words using WordNet when it passes is abandoned (see DeadlineExceeded). The results are
+returned as a Results list, which says which translators were skipped.
+
+"""
+
+import importlib
+import os
+import threading
+import time
+
+try:
+    from sprint4.canonical import canonical
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from canonical import canonical
+
+_local = threading.local()
+
+"""Words that mean the question asks for a number of things."""
+COUNT_WORDS = frozenset(["number"])
+NOUN_TAGS = ("NN", "NNS", "NNP", "NNPS")
+KEYWORDS = frozenset(["who", "every", "each", "all", "list", "return"])
+
+
+def asks_for_count(t, tagMap):
+    """A count is indicated by the word "number", or by "how many" (a WRB followed by a JJ, so there has to be a WRB)."""
+    return any(tm[0] in COUNT_WORDS or tm[1] == "WRB" for tm in tagMap)
+
+
+def no_count_word(t, tagMap):
+    return not any(tm[0] in COUNT_WORDS for tm in tagMap)
+
+
+def label_nouns(t, tagMap):
+    return [tm[0] for tm in tagMap if tm[1] in NOUN_TAGS and canonical(t.schema_word(tm[0])) in t.schema.labelIndex]
+
+
+def has_one_label_noun(t, tagMap):
+    return len(label_nouns(t, tagMap)) == 1
+
+
+def has_two_label_nouns(t, tagMap):
+    return len(label_nouns(t, tagMap)) >= 2
+
+
+def has_two_nouns(t, tagMap):
+    return sum(1 for tm in tagMap if tm[1] in NOUN_TAGS or tm[0] in KEYWORDS) >= 2
+
+
+def has_property(t, tagMap):
+    return any(tm[0] == "named" or t.schema_word(tm[0]) in t.schema.properties for tm in tagMap)
+
+
+def has_null_word(t, tagMap):
+    return any(tm[0] in ("known", "unknown") for tm in tagMap)
+
+
+def has_relationship(t, tagMap):
+    return any(tm[0] + "s" in t.relationships for tm in tagMap)
+
+
+class DeadlineExceeded(Exception):
+    """Raised by slow work (e.g. WordNet lookups) inside a translator when the request's deadline has passed."""
+
+
+class Deadline():
+    """
+    Deadline is the time by which a request has to be answered.
+
+    Attributes:
+        expires (Float): The time.monotonic() time at which it passes.
+
+    """
+
+    def __init__(self, seconds):
+        """
+        :param seconds: How long from now until the deadline passes.
+        """
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        """
+        :return: The number of seconds left, which is 0 once the deadline has passed.
+        """
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self):
+        """
+        :return: True if the deadline has passed.
+        """
+        return time.monotonic() >= self.expires
+
+    def check(self):
+        """
+        :return: nothing
+        :raises DeadlineExceeded: If the deadline has passed.
+        """
+        if self.expired():
+            raise DeadlineExceeded()
+
+
+def current_deadline():
+    """
+    :return: The Deadline of the request being translated on this thread, or None.
+    """
+    return getattr(_local, "deadline", None)
+
+
+class Results(list):
+    """
+    Results is the list of queries that a translation returned, with the translators that a deadline cut short.
+
+    Attributes:
+        skipped [List]: The names of the translators that were skipped or abandoned because the deadline passed.
+        tokens [Dictionary]: When the queries were paginated, maps the id of every paginated query to the continuation
+            token for its next page (see paging.py).
+
+    """
+
+    def __init__(self, items=(), skipped=(), tokens=None):
+        list.__init__(self, items)
+        self.skipped = list(skipped)
+        self.tokens = dict(tokens or {})
+
+    @property
+    def partial(self):
+        """True if any translator was skipped, so there may be queries missing."""
+        return len(self.skipped) > 0
+
+
+class Translator():
+    """
+    Translator describes one translation method.
+
+    Attributes:
+        name (String): The name the translator is registered and enabled under.
+        queryId (String): The id that its queries are reported under, e.g. "query1".
+        target (String): The name of a Tokenize method, or "module:function".
+        preconditions (Tuple): Functions of (Tokenize object, tagMap) that are all True whenever it can return a query.
+
+    """
+
+    def __init__(self, name, queryId, target, preconditions=()):
+        self.name = name
+        self.queryId = queryId
+        self.target = target
+        self.preconditions = tuple(preconditions)
+        self._function = None
+
+    def applies(self, t, tagMap):
+        """
+        :param t: The Tokenize object.
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :return: False if the translator certainly won't return a query, so it doesn't need to be run.
+        """
+        return all(precondition(t, tagMap) for precondition in self.preconditions)
+
+    def run(self, t, tagMap, deadline=None):
+        """
+        :param t: The Tokenize object.
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param deadline: The Deadline of the request, or None. While the translator runs, it is what
+            current_deadline() returns on this thread.
+        :return: What the translator returns: a query, or -1.
+        """
+        outer = current_deadline()
+        _local.deadline = deadline
+        try:
+            if ":" not in self.target:
+                return getattr(t, self.target)(tagMap)
+            if self._function is None:
+                moduleName, functionName = self.target.split(":", 1)
+                self._function = getattr(importlib.import_module(moduleName), functionName)
+            return self._function(t, tagMap)
+        finally:
+            _local.deadline = outer
+
+    def __repr__(self):
+        return "Translator(%r, %r, %r)" % (self.name, self.queryId, self.target)
+
+
+class TranslatorRegistry():
+    """
+    TranslatorRegistry keeps every known Translator, in order, and which of them are enabled.
+    """
+
+    def __init__(self):
+        self._translators = []
+        self._enabled = set()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def register(self, translator, enabled=True):
+        """
+        Add a translator to the end of the registry, replacing any translator that already has the same name.
+
+        :param translator: The Translator to register.
+        :param enabled: Whether it should be run.
+        :return: The registered Translator.
+        """
+        with self._lock:
+            self._translators = [t for t in self._translators if t.name != translator.name] + [translator]
+            if enabled:
+                self._enabled.add(translator.name)
+            else:
+                self._enabled.discard(translator.name)
+        return translator
+
+    def enable(self, names, only=False):
+        """
+        :param names: The names of the translators to enable.
+        :param only: If True, every other translator is disabled.
+        :return: nothing
+        :raises KeyError: If one of the names isn't registered.
+        """
+        unknown = set(names) - set(self.names())
+        if unknown:
+            raise KeyError("Unknown translator: " + ", ".join(sorted(unknown)))
+        with self._lock:
+            if only:
+                self._enabled.clear()
+            self._enabled.update(names)
+
+    def disable(self, names):
+        """
+        :param names: The names of the translators to disable.
+        :return: nothing
+        """
+        with self._lock:
+            self._enabled.difference_update(names)
+
+    def enabled(self):
+        """
+        :return: A list of the enabled Translators, in the order they were registered.
+        """
+        return [t for t in self._translators if t.name in self._enabled]
+
+    def names(self):
+        """
+        :return: The names of every registered translator, in order.
+        """
+        return [t.name for t in self._translators]
+
+    def ordered(self):
+        """
+        The enabled translators, cheapest first for their chance of giving a query: they are sorted by their average
+        time divided by their hit rate. A translator that has never been run goes first, so that it gets measured.
+
+        :return: A list of the enabled Translators.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        def expectedCost(translator):
+            runs, hits, seconds = stats.get(translator.name, (0, 0, 0.0))
+            if runs == 0:
+                return 0.0
+            return (seconds / runs) / ((hits + 1.0) / (runs + 2.0))
+
+        return sorted(self.enabled(), key=expectedCost)
+
+    def timed_run(self, translator, t, tagMap, deadline=None):
+        """
+        Runs a translator, and records whether it gave a query (-1 and "" don't count) and how long it took.
+
+        :param translator: The Translator to run.
+        :param t: The Tokenize object.
+        :param tagMap: A list of tuples consisting of words and their Stanford CoreNLP tags.
+        :param deadline: The Deadline of the request, or None.
+        :return: What the translator returns: a query, or -1.
+        :raises DeadlineExceeded: If the translator was abandoned because the deadline passed. This is recorded as a
+            run without a query.
+        """
+        query = -1
+        started = time.perf_counter()
+        try:
+            query = translator.run(t, tagMap, deadline)
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                runs, hits, total = self._stats.get(translator.name, (0, 0, 0.0))
+                self._stats[translator.name] = (runs + 1, hits + (query not in (-1, "")), total + seconds)
+        return query
+
+    def stats(self):
+        """
+        :return: A dictionary from the name of every translator that has been run to a dictionary of its runs, hits,
+            hitRate and meanTime (in seconds).
+        """
+        with self._lock:
+            return dict((name, dict(runs=runs, hits=hits, hitRate=hits / runs, meanTime=seconds / runs))
+                        for name, (runs, hits, seconds) in self._stats.items())
+
+
+"""The translators used by Tokenize unless it is given another registry."""
+plugins = TranslatorRegistry()
+plugins.register(Translator("match_label_and_property", "query1", "match_label_and_property",
+                            preconditions=(no_count_word, has_two_nouns, has_one_label_noun)))
+plugins.register(Translator("listAllWithProperty", "query3", "listAllWithProperty", preconditions=(has_property,)))
+plugins.register(Translator("return_multiple_labels", "query2", "return_multiple_labels",
+                            preconditions=(no_count_word, has_two_label_nouns)))
+plugins.register(Translator("numberStartsWith", "query5", "numberStartsWith", preconditions=(asks_for_count,)))
+plugins.register(Translator("numberNullOrNot", "query6", "numberNullOrNot",
+                            preconditions=(asks_for_count, has_null_word)))
+plugins.register(Translator("relationshipOrder", "query7", "relationshipOrder", preconditions=(has_relationship,)))
+
+if os.environ.get("NL2CQ_TRANSLATORS"):
+    plugins.enable([name.strip() for name in os.environ["NL2CQ_TRANSLATORS"].split(",")], only=True)
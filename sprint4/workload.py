@@ -0,0 +1,227 @@
+"""
+workload.py:
+An append-only log of the questions that are translated, and the analyzer that reports on it.
+
+File name: workload.py
+Author: Joseph Pruner
+Date created: 19/10/2026
+Date last modified: 19/10/2026
+Python version: 3.5
+
+Nothing recorded which questions were asked, which translators answered them, or how long each stage took. When the
+NL2CQ_WORKLOAD_LOG environment variable is set to a file name, every question that Tokenize.py translates (one at a
+time, or with --pipe) is appended to that file as one JSON object per line, with:
+
+    time        When it was translated, in seconds since the epoch.
+    schema      The schema it was translated against.
+    question    The normalized question: its words, lowercase, separated by single spaces.
+    wordsTagged The words and their tags, after the stop words were taken out.
+    fired       The ids of the queries that the translators gave, e.g. ["query1"].
+    queries     The queries.
+    timings     How many milliseconds each stage took: tokenize and translate.
+    error       The error, if the translation failed.
+
+Logging mustn't slow down the translation, so WorkloadLog.record() only puts the entry on a queue. A background thread
+takes the entries off the queue in batches, and writes each batch with one write. If the queue is ever full, entries
+are dropped and counted rather than making the request wait.
+
+The analyzer reads a log and reports, as JSON, the most asked questions, how often each query is given, the slowest
+questions, and how many requests could have been answered from a cache of earlier answers. For example:
+
+    python workload.py analyze workload.ndjson --top 10
+
+The log can also be given to indexadvisor.py --log.
+
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+try:
+    from sprint4.canonical import canonical
+except ImportError:  # run as a script from inside sprint4/, e.g. by results.php
+    from canonical import canonical
+
+_default = None
+_defaultLock = threading.Lock()
+
+
+def normalize_question(words):
+    """
+    :param words: The words of the question, from the word tokenizer.
+    :return: The words in their canonical form, separated by single spaces.
+    """
+    return " ".join(canonical(word) for word in words)
+
+
+class WorkloadLog():
+    """
+    WorkloadLog appends entries to a file of JSON lines, from a background thread.
+
+    Attributes:
+        path (String): The file the entries are appended to.
+        batchSize (int): The most entries that are written at once.
+        written (int): How many entries have been written.
+        dropped (int): How many entries were dropped because the queue was full.
+
+    """
+
+    def __init__(self, path, batchSize=100, maxQueued=10000):
+        self.path = path
+        self.batchSize = batchSize
+        self.written = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxQueued)
+        self._thread = threading.Thread(target=self._write, name="workload-log", daemon=True)
+        self._thread.start()
+
+    def record(self, entry):
+        """
+        Add an entry to the log, without waiting for it to be written.
+
+        :param entry: A dictionary that can be written as JSON.
+        :return: nothing
+        """
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """
+        Write every entry that is still queued, and stop the background thread.
+
+        :return: nothing
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _write(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                batch = [self._queue.get()]
+                while batch[-1] is not None and len(batch) < self.batchSize:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                entries = [entry for entry in batch if entry is not None]
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+                f.flush()
+                self.written += len(entries)
+                if batch[-1] is None:
+                    return
+
+
+def default_log():
+    """
+    :return: The WorkloadLog for the file named by the NL2CQ_WORKLOAD_LOG environment variable, which is opened the
+        first time it is asked for, and closed when the program exits; or None if the variable isn't set.
+    """
+    global _default
+    if not os.environ.get("NL2CQ_WORKLOAD_LOG"):
+        return None
+    with _defaultLock:
+        if _default is None:
+            _default = WorkloadLog(os.environ["NL2CQ_WORKLOAD_LOG"])
+            atexit.register(_default.close)
+        return _default
+
+
+def entry(t, queries, timings, schemaId, error=None):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param t: The Tokenize object for the question, or None if it couldn't be made.
+    :param queries: The list of queries from runTranslator(), e.g. "query1: MATCH (n :Outlaw) RETURN n.name".
+    :param timings: A dictionary of how many milliseconds each stage took.
+    :param schemaId: The schema the question was translated against.
+    :param error: The error, if the translation failed.
+    :return: The entry to record in the log.
+    """
+    return dict(time=round(time.time(), 3), schema=schemaId,
+                question=normalize_question(t.words) if t is not None else None,
+                wordsTagged=[list(tm) for tm in t.wordsTagged] if t is not None else [],
+                fired=[query.split(":", 1)[0] for query in queries], queries=list(queries), timings=dict(timings),
+                error=error)
+
+
+def read_log(path):
+    """
+    :param path: A workload log.
+    :return: The list of its entries. Lines that were only partly written, e.g. when the program was killed, are
+        skipped.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+
+def analyze(entries, top=10):
+    """
+    Author: Joseph Pruner
+    Date created: 19/10/2026
+    Date last modified: 19/10/2026
+
+    :param entries: The entries of a workload log.
+    :param top: How many questions to list as the most asked and the slowest.
+    :return: A dictionary with requests, errors, topQuestions, translators (how many times each query id was given,
+        and in what share of the requests), slowest (the questions that took longest in all, with their stage
+        timings), and cacheHitPotential: the share of the requests that asked a question that had been asked before,
+        either word for word (question) or once the stop words are taken out (wordsTagged).
+    """
+    requests = len(entries)
+    counts = {}
+    fired = {}
+    seenQuestions = set()
+    seenTags = set()
+    repeatQuestions = repeatTags = 0
+    for e in entries:
+        question = e.get("question")
+        counts[question] = counts.get(question, 0) + 1
+        for queryId in e.get("fired", []):
+            fired[queryId] = fired.get(queryId, 0) + 1
+        tags = json.dumps(e.get("wordsTagged"))
+        repeatQuestions += question in seenQuestions
+        repeatTags += tags in seenTags
+        seenQuestions.add(question)
+        seenTags.add(tags)
+
+    slowest = sorted(entries, key=lambda e: -sum(e.get("timings", {}).values()))[:top]
+    share = (lambda n: round(n / requests, 3)) if requests else (lambda n: 0.0)
+    return dict(requests=requests, errors=sum(1 for e in entries if e.get("error")),
+                topQuestions=[dict(question=q, count=c)
+                              for q, c in sorted(counts.items(), key=lambda qc: (-qc[1], str(qc[0])))[:top]],
+                translators=dict((queryId, dict(fired=n, hitRate=share(n))) for queryId, n in sorted(fired.items())),
+                slowest=[dict(question=e.get("question"), totalMs=round(sum(e.get("timings", {}).values()), 3),
+                              timings=e.get("timings", {})) for e in slowest],
+                cacheHitPotential=dict(question=share(repeatQuestions), wordsTagged=share(repeatTags)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report on a workload log.")
+    commands = parser.add_subparsers(dest="command")
+    analyzeCommand = commands.add_parser("analyze", help="report on the questions in a log")
+    analyzeCommand.add_argument("log")
+    analyzeCommand.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    if args.command != "analyze":
+        parser.error("Use: workload.py analyze LOG")
+    print(json.dumps(analyze(read_log(args.log), args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()